@@ -7,6 +7,14 @@ from mainotebook.utils.validator import CustomValidationError
 
 dispatch_db_type = getattr(settings, 'DISPATCH_DB_TYPE', 'memory')  # redis
 
+# 启动初始化结果的共享缓存（memory 模式下供其他 worker 复用），数据结构变化时递增版本号
+BOOTSTRAP_CACHE_VERSION = 1
+BOOTSTRAP_DICTIONARY_KEY = f"bootstrap_dictionary:v{BOOTSTRAP_CACHE_VERSION}"
+BOOTSTRAP_SYSTEM_CONFIG_KEY = f"bootstrap_system_config:v{BOOTSTRAP_CACHE_VERSION}"
+# 共享缓存的有效期（秒）：只用于同一次部署中相继启动的 worker 复用，过期后重新查询数据库，
+# 避免绕过 refresh_* 的修改（初始化数据导入、直接改库、共享 Redis 的其他部署）长期不生效
+BOOTSTRAP_CACHE_TIMEOUT = getattr(settings, 'BOOTSTRAP_CACHE_TIMEOUT', 300)
+
 
 def is_tenants_mode():
     """
@@ -19,23 +27,30 @@ def is_tenants_mode():
 # ================================================= #
 # ******************** 初始化 ******************** #
 # ================================================= #
+def _get_or_build(key, builder):
+    """优先读取缓存中的初始化结果，未命中时查询数据库并写入缓存"""
+    data = cache.get(key)
+    if data is None:
+        data = builder()
+        cache.set(key, data, timeout=BOOTSTRAP_CACHE_TIMEOUT)
+    return data
+
+
 def _get_all_dictionary():
     from mainotebook.system.models import Dictionary
 
-    queryset = Dictionary.objects.filter(status=True, is_value=False)
-    data = []
-    for instance in queryset:
-        data.append(
-            {
-                "id": instance.id,
-                "value": instance.value,
-                "children": list(
-                    Dictionary.objects.filter(parent=instance.id)
-                    .filter(status=1)
-                    .values("label", "value", "type", "color")
-                ),
-            }
-        )
+    parents = list(Dictionary.objects.filter(status=True, is_value=False).values_list("id", "value"))
+    # 一次查询取出所有子项，按父级分组（保持模型默认排序）
+    children = {parent_id: [] for parent_id, _ in parents}
+    for child in (
+        Dictionary.objects.filter(parent_id__in=list(children), status=1)
+        .values("parent_id", "label", "value", "type", "color")
+    ):
+        children[child.pop("parent_id")].append(child)
+    data = [
+        {"id": parent_id, "value": value, "children": children[parent_id]}
+        for parent_id, value in parents
+    ]
     return {ele.get("value"): ele for ele in data}
 
 
@@ -73,7 +88,8 @@ def init_dictionary():
     """
     try:
         if dispatch_db_type == 'redis':
-            cache.set(f"init_dictionary", _get_all_dictionary())
+            # 已由其他 worker 初始化时直接复用
+            _get_or_build(f"init_dictionary", _get_all_dictionary)
             return
         if is_tenants_mode():
             from django_tenants.utils import tenant_context, get_tenant_model
@@ -82,7 +98,7 @@ def init_dictionary():
                 with tenant_context(tenant):
                     settings.DICTIONARY_CONFIG[connection.tenant.schema_name] = _get_all_dictionary()
         else:
-            settings.DICTIONARY_CONFIG = _get_all_dictionary()
+            settings.DICTIONARY_CONFIG = _get_or_build(BOOTSTRAP_DICTIONARY_KEY, _get_all_dictionary)
     except Exception as e:
         print("请先进行数据库迁移!")
     return
@@ -96,7 +112,8 @@ def init_system_config():
     """
     try:
         if dispatch_db_type == 'redis':
-            cache.set(f"init_system_config", _get_all_system_config())
+            # 已由其他 worker 初始化时直接复用
+            _get_or_build(f"init_system_config", _get_all_system_config)
             return
         if is_tenants_mode():
             from django_tenants.utils import tenant_context, get_tenant_model
@@ -105,7 +122,7 @@ def init_system_config():
                 with tenant_context(tenant):
                     settings.SYSTEM_CONFIG[connection.tenant.schema_name] = _get_all_system_config()
         else:
-            settings.SYSTEM_CONFIG = _get_all_system_config()
+            settings.SYSTEM_CONFIG = _get_or_build(BOOTSTRAP_SYSTEM_CONFIG_KEY, _get_all_system_config)
     except Exception as e:
         print("请先进行数据库迁移!")
     return
@@ -127,6 +144,7 @@ def refresh_dictionary():
                 settings.DICTIONARY_CONFIG[connection.tenant.schema_name] = _get_all_dictionary()
     else:
         settings.DICTIONARY_CONFIG = _get_all_dictionary()
+        cache.set(BOOTSTRAP_DICTIONARY_KEY, settings.DICTIONARY_CONFIG, timeout=BOOTSTRAP_CACHE_TIMEOUT)
 
 
 def refresh_system_config():
@@ -145,6 +163,7 @@ def refresh_system_config():
                 settings.SYSTEM_CONFIG[connection.tenant.schema_name] = _get_all_system_config()
     else:
         settings.SYSTEM_CONFIG = _get_all_system_config()
+        cache.set(BOOTSTRAP_SYSTEM_CONFIG_KEY, settings.SYSTEM_CONFIG, timeout=BOOTSTRAP_CACHE_TIMEOUT)
 
 
 # ================================================= #
@@ -108,6 +108,11 @@ DATABASES = {
         "PASSWORD": DATABASE_PASSWORD,
         "HOST": DATABASE_HOST,
         "PORT": DATABASE_PORT,
+        # 持久连接时长，默认关闭：ASGI（uvicorn）下同步视图运行在短生命周期线程中，
+        # 持久连接无法复用只会堆积；仅 WSGI 部署时开启，ASGI 部署请使用 pgbouncer 等外部连接池
+        "CONN_MAX_AGE": locals().get("DATABASE_CONN_MAX_AGE", 0),
+        # 复用连接前检查其是否可用，避免数据库重启后使用失效连接
+        "CONN_HEALTH_CHECKS": True,
         "TEST": {
             "NAME": "test_" + DATABASE_NAME,
             "MIRROR": None,
@@ -159,6 +164,8 @@ STATICFILES_DIRS = [
 
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")  # 项目下的目录
 MEDIA_URL = "/media/"  # 跟STATIC_URL类似，指定用户可以通过这个url找到文件
+# 生产环境由 nginx 发送媒体文件时配置为 internal location 前缀（如 "/protected-media/"），为空则由 Django 直接返回
+MEDIA_ACCEL_REDIRECT_PREFIX = locals().get("MEDIA_ACCEL_REDIRECT_PREFIX", None)
 
 #添加以下代码以后就不用写{% load staticfiles %}，可以直接引用
 STATICFILES_FINDERS = (
@@ -396,6 +403,14 @@ API_MODEL_MAP = {
 
 DJANGO_CELERY_BEAT_TZ_AWARE = False
 CELERY_TIMEZONE = "Asia/Shanghai"  # celery 时区问题
+# 审计记录 Redis 缓冲模式：每秒将缓冲的下载记录、审核日志批量写入数据库
+if locals().get('AUDIT_RECORD_BUFFER') == 'redis':
+    CELERY_BEAT_SCHEDULE = {
+        'flush-audit-record-buffers': {
+            'task': 'mainotebook.content.tasks.flush_audit_record_buffers',
+            'schedule': 1.0,
+        },
+    }
 # 静态页面压缩
 STATICFILES_STORAGE = "whitenoise.storage.CompressedStaticFilesStorage"
 
@@ -13,17 +13,17 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+import functools
+
 from django.conf.urls.static import static
 from django.urls import path, include, re_path
+from django.views.decorators.csrf import csrf_exempt
 from django.views.static import serve
-from drf_yasg import openapi
-from drf_yasg.views import get_schema_view
 from rest_framework import permissions
 from rest_framework_simplejwt.views import (
     TokenRefreshView,
 )
 
-from application import dispatch
 from application import settings
 from application.sse_views import sse_view
 from mainotebook.system.views.dictionary import InitDictionaryViewSet
@@ -36,7 +36,6 @@ from mainotebook.system.views.login import (
 )
 from mainotebook.system.views.register import RegisterView, VerifyEmailView, ResendVerificationView
 from mainotebook.system.views.system_config import InitSettingsViewSet
-from mainotebook.utils.swagger import CustomOpenAPISchemaGenerator
 from mainotebook.content.views import UserExtensionViewSet
 
 # 头像访问视图（公开访问）
@@ -44,10 +43,26 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from django.shortcuts import redirect
 from django.http import Http404
+from django.core.cache import cache
 from mainotebook.system.models import Users
 from mainotebook.utils.json_response import ErrorResponse
 from rest_framework import status as http_status
 
+# 头像地址缓存（键为用户ID，空字符串表示用户不存在或没有头像）
+AVATAR_CACHE_KEY = "avatar:{pk}"
+AVATAR_CACHE_TTL = 300
+_MEDIA_URL = settings.MEDIA_URL.rstrip('/') + '/'
+
+
+def _resolve_avatar_url(avatar):
+    """将头像字段转换为可重定向的地址"""
+    # 如果是完整URL（http/https开头）或已经是完整路径（/media/开头），直接使用
+    if avatar.startswith('http') or avatar.startswith('/media/'):
+        return avatar
+    # 如果是相对路径，拼接MEDIA_URL
+    return _MEDIA_URL + avatar.lstrip('/')
+
+
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def user_avatar_view(request, pk):
@@ -60,22 +75,22 @@ def user_avatar_view(request, pk):
     Returns:
         Response: 重定向到头像文件或返回404
     """
+    cache_key = AVATAR_CACHE_KEY.format(pk=pk)
     try:
-        user = Users.objects.get(pk=pk)
-        if user.avatar:
-            # 如果是完整URL（http/https开头），直接重定向
-            if user.avatar.startswith('http'):
-                return redirect(user.avatar)
-            # 如果已经是完整路径（/media/开头），直接重定向
-            if user.avatar.startswith('/media/'):
-                return redirect(user.avatar)
-            # 如果是相对路径，拼接MEDIA_URL
-            avatar_url = f"{settings.MEDIA_URL}{user.avatar}".replace('//', '/')
-            return redirect(avatar_url)
-        else:
-            # 用户没有头像
+        avatar_url = cache.get(cache_key)
+        if avatar_url is None:
+            try:
+                # 只读取头像字段，避免拉取整行用户数据
+                user = Users.objects.only('id', 'avatar').get(pk=pk)
+                avatar_url = _resolve_avatar_url(user.avatar) if user.avatar else ""
+            except Users.DoesNotExist:
+                avatar_url = ""
+            cache.set(cache_key, avatar_url, AVATAR_CACHE_TTL)
+        if not avatar_url:
+            # 用户不存在或没有头像
             raise Http404("User has no avatar")
-    except (Users.DoesNotExist, Http404):
+        return redirect(avatar_url)
+    except Http404:
         raise Http404("User not found")
     except Exception as e:
         return ErrorResponse(
@@ -83,68 +98,121 @@ def user_avatar_view(request, pk):
             status=http_status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
-# =========== 初始化系统配置 =================
-dispatch.init_system_config()
-dispatch.init_dictionary()
-# =========== 初始化系统配置 =================
-
-permission_classes = [permissions.AllowAny, ] if settings.DEBUG else [permissions.IsAuthenticated, ]
-schema_view = get_schema_view(
-    openapi.Info(
-        title="Snippets API",
-        default_version="v1",
-        description="Test description",
-        terms_of_service="https://www.google.com/policies/terms/",
-        contact=openapi.Contact(email="contact@snippets.local"),
-        license=openapi.License(name="BSD License"),
-    ),
-    public=True,
-    permission_classes=permission_classes,
-    generator_class=CustomOpenAPISchemaGenerator,
-)
+# 系统配置与字典的初始化在 SystemConfig.ready() 中执行，每个进程仅一次
+
+
+@functools.cache
+def _get_schema_view():
+    """构建 swagger schema 视图（首次访问文档时才导入 drf_yasg）"""
+    from drf_yasg import openapi
+    from drf_yasg.views import get_schema_view
+    from mainotebook.utils.swagger import CustomOpenAPISchemaGenerator
+
+    schema_permission_classes = [permissions.AllowAny, ] if settings.DEBUG else [permissions.IsAuthenticated, ]
+    return get_schema_view(
+        openapi.Info(
+            title="Snippets API",
+            default_version="v1",
+            description="Test description",
+            terms_of_service="https://www.google.com/policies/terms/",
+            contact=openapi.Contact(email="contact@snippets.local"),
+            license=openapi.License(name="BSD License"),
+        ),
+        public=True,
+        permission_classes=schema_permission_classes,
+        generator_class=CustomOpenAPISchemaGenerator,
+    )
+
+
+def _lazy_schema_view(method, *args, **kwargs):
+    """返回延迟构建的 swagger 视图
+
+    Args:
+        method: schema_view 上的构造方法名（without_ui / with_ui）
+    """
+    @functools.cache
+    def _view():
+        return getattr(_get_schema_view(), method)(*args, **kwargs)
+
+    @csrf_exempt
+    def view(request, *view_args, **view_kwargs):
+        return _view()(request, *view_args, **view_kwargs)
+
+    return view
+
+
 # 前端页面映射
-from django.http import Http404, HttpResponse
+from django.http import Http404, HttpResponse, FileResponse
 from django.shortcuts import render
+from functools import lru_cache
 import mimetypes
 import os
+from urllib.parse import quote
+
+# 小于该大小的前端文件缓存在进程内存中
+_SMALL_FILE_LIMIT = 64 * 1024
 
 
 def web_view(request):
     return render(request, 'web/index.html')
 
 
+@lru_cache(maxsize=256)
+def _read_small_file(filepath, mtime):
+    """读取小文件内容，以 (路径, 修改时间) 为缓存键，文件更新后自动失效"""
+    with open(filepath, 'rb') as f:
+        return f.read()
+
+
 def serve_web_files(request, filename):
     # 设定文件路径
     filepath = os.path.join(settings.BASE_DIR, 'templates', 'web', filename)
 
     # 检查文件是否存在
-    if not os.path.exists(filepath):
+    try:
+        stat = os.stat(filepath)
+    except OSError:
         raise Http404("File does not exist")
 
     # 根据文件扩展名，确定 MIME 类型
     mime_type, _ = mimetypes.guess_type(filepath)
 
-    # 打开文件并读取内容
-    with open(filepath, 'rb') as f:
-        response = HttpResponse(f.read(), content_type=mime_type)
+    if stat.st_size < _SMALL_FILE_LIMIT:
+        return HttpResponse(_read_small_file(filepath, stat.st_mtime), content_type=mime_type)
+    # 大文件交给 FileResponse 流式发送（服务器支持时走 sendfile）
+    return FileResponse(open(filepath, 'rb'), content_type=mime_type)
+
+
+def serve_media(request, path):
+    """媒体文件访问
+
+    配置 MEDIA_ACCEL_REDIRECT_PREFIX 时通过 X-Accel-Redirect 交由 nginx 直接发送文件，
+    否则回退到 Django 自带的 serve（仅适用于开发环境）。
+    """
+    accel_prefix = getattr(settings, 'MEDIA_ACCEL_REDIRECT_PREFIX', None)
+    if accel_prefix:
+        response = HttpResponse(content_type=mimetypes.guess_type(path)[0] or '')
+        # Django 传入的 path 已解码，重新进行百分号编码，避免空格、%、? 及非 ASCII 文件名被 nginx 误解析
+        response['X-Accel-Redirect'] = accel_prefix.rstrip('/') + '/' + quote(path.lstrip('/'))
         return response
+    return serve(request, path, document_root=settings.MEDIA_ROOT)
 
 
 urlpatterns = (
         [
             re_path(
                 r"^swagger(?P<format>\.json|\.yaml)$",
-                schema_view.without_ui(cache_timeout=0),
+                _lazy_schema_view("without_ui", cache_timeout=0),
                 name="schema-json",
             ),
             path(
                 "",
-                schema_view.with_ui("swagger", cache_timeout=0),
+                _lazy_schema_view("with_ui", "swagger", cache_timeout=0),
                 name="schema-swagger-ui",
             ),
             path(
                 r"redoc/",
-                schema_view.with_ui("redoc", cache_timeout=0),
+                _lazy_schema_view("with_ui", "redoc", cache_timeout=0),
                 name="schema-redoc",
             ),
             path("api/system/", include("mainotebook.system.urls")),
@@ -172,7 +240,7 @@ urlpatterns = (
             path('web/<path:filename>', serve_web_files, name='serve_web_files'),
             # sse
             path('sse/', sse_view, name='sse'),
-            re_path(r'^media/(?P<path>.*)$', serve, {'document_root': settings.MEDIA_ROOT}),
+            path('media/<path:path>', serve_media),
         ]
         + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
         + static(settings.STATIC_URL, document_root=settings.STATIC_URL)
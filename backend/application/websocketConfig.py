@@ -1,19 +1,18 @@
 # -*- coding: utf-8 -*-
-import urllib
+import asyncio
+import time
 import logging
 
 from asgiref.sync import sync_to_async, async_to_sync
-from channels.db import database_sync_to_async
 from channels.generic.websocket import AsyncJsonWebsocketConsumer, AsyncWebsocketConsumer
-import json
-
+import jwt
+import orjson
 from channels.layers import get_channel_layer
-from jwt import InvalidSignatureError
+from jwt.exceptions import ExpiredSignatureError, InvalidTokenError
 from rest_framework.request import Request
 
 from application import settings
 from mainotebook.system.models import MessageCenter, Users, MessageCenterTargetUser
-from mainotebook.system.views.message_center import MessageCenterTargetUserSerializer
 from mainotebook.utils.serializers import CustomModelSerializer
 
 # 获取日志记录器
@@ -21,6 +20,33 @@ logger = logging.getLogger(__name__)
 
 send_dict = {}
 
+# 按角色/部门推送时每批推送的用户数
+PUSH_CHUNK_SIZE = 2000
+
+# 所有在线连接都会加入的全员广播组
+BROADCAST_GROUP = "broadcast"
+
+# 每个连接待发送消息队列的容量，队列满时丢弃最早的消息
+OUTBOX_MAXSIZE = 256
+
+# WebSocket 连接的 JWT 解码参数
+JWT_ALGORITHMS = ["HS256"]
+JWT_OPTIONS = {"verify_aud": False}
+
+# 已解码 token 的缓存（token -> (user_id, 过期时间戳)），用于断线重连时跳过重复解码
+_TOKEN_CACHE = {}
+TOKEN_CACHE_TTL = 60
+TOKEN_CACHE_MAXSIZE = 1024
+
+_CHANNEL_LAYER = None
+
+
+def _layer():
+    """获取通道层（进程内缓存，避免每次推送都重新查找）"""
+    global _CHANNEL_LAYER
+    _CHANNEL_LAYER = _CHANNEL_LAYER or get_channel_layer()
+    return _CHANNEL_LAYER
+
 
 # 发送消息结构体
 def set_message(sender, msg_type, msg, unread=0):
@@ -33,77 +59,154 @@ def set_message(sender, msg_type, msg, unread=0):
     return text
 
 
-# 异步获取消息中心的目标用户
-@database_sync_to_async
-def _get_message_center_instance(message_id):
-    from mainotebook.system.models import MessageCenter
-    _MessageCenter = MessageCenter.objects.filter(id=message_id).values_list('target_user', flat=True)
-    if _MessageCenter:
-        return _MessageCenter
-    else:
-        return []
+async def _get_unread_map(user_ids):
+    """一次查询获取多个用户的未读消息数量，未出现的用户视为 0"""
+    from django.db.models import Count
+    queryset = (
+        MessageCenterTargetUser.objects.filter(users__in=user_ids, is_read=False)
+        .values('users').annotate(c=Count('id')).values_list('users', 'c')
+    )
+    return {uid: count async for uid, count in queryset}
+
+
+def _decode_token(token):
+    """解码 WebSocket 连接 token，返回 user_id
+
+    解码结果缓存至 TOKEN_CACHE_TTL 秒或 token 过期时间（取较早者）。
+
+    Raises:
+        jwt.PyJWTError: token 无效或已过期
+    """
+    now = time.time()
+    cached = _TOKEN_CACHE.get(token)
+    if cached and cached[1] > now:
+        return cached[0]
+    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=JWT_ALGORITHMS, options=JWT_OPTIONS)
+    user_id = payload.get('user_id')
+    expires_at = min(now + TOKEN_CACHE_TTL, payload.get('exp', now + TOKEN_CACHE_TTL))
+    if len(_TOKEN_CACHE) >= TOKEN_CACHE_MAXSIZE:
+        # 淘汰最早写入的条目
+        _TOKEN_CACHE.pop(next(iter(_TOKEN_CACHE)))
+    _TOKEN_CACHE[token] = (user_id, expires_at)
+    return user_id
+
 
+def _dumps(message):
+    """序列化推送消息体"""
+    return orjson.dumps(message).decode()
 
-@database_sync_to_async
-def _get_message_unread(user_id):
-    """获取用户的未读消息数量"""
-    from mainotebook.system.models import MessageCenterTargetUser
-    count = MessageCenterTargetUser.objects.filter(users=user_id, is_read=False).count()
-    return count or 0
 
+async def _fanout(channel_layer, user_ids, payload_fn):
+    """并发推送给多个用户
 
-def request_data(scope):
-    query_string = scope.get('query_string', b'').decode('utf-8')
-    qs = urllib.parse.parse_qs(query_string)
-    return qs
+    Args:
+        channel_layer: 通道层
+        user_ids: 用户 ID 可迭代对象
+        payload_fn: 根据用户 ID 返回已序列化的推送文本的函数
+    """
+    await asyncio.gather(*(
+        channel_layer.group_send("user_" + str(uid), {"type": "push.message", "text": payload_fn(uid)})
+        for uid in user_ids
+    ))
+
+
+def _chunked(iterable, size):
+    """将可迭代对象按 size 切分为列表"""
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
 
 
 class MainotebookWebSocket(AsyncJsonWebsocketConsumer):
+    @classmethod
+    async def decode_json(cls, text_data):
+        return orjson.loads(text_data)
+
+    @classmethod
+    async def encode_json(cls, content):
+        return _dumps(content)
+
     async def connect(self):
+        self.service_uid = self.scope["url_route"]["kwargs"]["service_uid"]
+
         try:
-            import jwt
-            from jwt.exceptions import ExpiredSignatureError, InvalidTokenError
-            
-            self.service_uid = self.scope["url_route"]["kwargs"]["service_uid"]
-            
+            user_id = _decode_token(self.service_uid)
+        except ExpiredSignatureError:
+            # Token 已过期，拒绝连接（不记录堆栈跟踪）
+            logger.warning(f"WebSocket 连接被拒绝：JWT token 已过期")
+            await self.close(code=4001)  # 自定义关闭码：token 过期
+            return
+        except InvalidTokenError as e:
+            # Token 无效，拒绝连接
+            logger.warning(f"WebSocket 连接被拒绝：JWT token 无效 - {e}")
+            await self.close(code=4002)  # 自定义关闭码：token 无效
+            return
+        except jwt.PyJWTError as e:
+            # 其他 JWT 错误同样视为无效 token
+            logger.warning(f"WebSocket 连接被拒绝：JWT 解析失败 - {e}")
+            await self.close(code=4002)
+            return
+        if user_id is None:
+            await self.close(code=4002)
+            return
+
+        self.user_id = user_id
+        self.chat_group_name = "user_" + str(self.user_id)
+        # 收到连接时候处理，
+        await self.channel_layer.group_add(
+            self.chat_group_name,
+            self.channel_name
+        )
+        # 加入全员广播组，系统通知只需发送一次
+        await self.channel_layer.group_add(BROADCAST_GROUP, self.channel_name)
+        await self.accept()
+        # 推送消息先进入队列，由后台任务逐条发送，避免慢客户端阻塞消息分发
+        self._out_q = asyncio.Queue(maxsize=OUTBOX_MAXSIZE)
+        self._relay_task = asyncio.create_task(self._relay())
+        # 主动推送消息
+        unread_count = await MessageCenterTargetUser.objects.filter(
+            users=self.user_id, is_read=False
+        ).acount()
+        if unread_count == 0:
+            # 发送连接成功
+            await self.send_json(set_message('system', 'SYSTEM', '您已上线'))
+        else:
+            await self.send_json(
+                set_message('system', 'SYSTEM', "请查看您的未读消息~",
+                            unread=unread_count))
+
+    def enqueue(self, text):
+        """将已序列化的消息放入发送队列，队列满时丢弃最早的一条"""
+        if self._out_q.full():
+            self._out_q.get_nowait()
+            logger.warning(f"WebSocket 发送队列已满，丢弃最早的消息：user_id={self.user_id}")
+        self._out_q.put_nowait(text)
+
+    async def _relay(self):
+        """后台发送任务：按顺序将队列中的消息发送给客户端"""
+        while True:
+            text = await self._out_q.get()
             try:
-                decoded_result = jwt.decode(self.service_uid, settings.SECRET_KEY, algorithms=["HS256"])
-            except ExpiredSignatureError:
-                # Token 已过期，拒绝连接（不记录堆栈跟踪）
-                logger.warning(f"WebSocket 连接被拒绝：JWT token 已过期")
-                await self.close(code=4001)  # 自定义关闭码：token 过期
-                return
-            except InvalidTokenError as e:
-                # Token 无效，拒绝连接
-                logger.warning(f"WebSocket 连接被拒绝：JWT token 无效 - {e}")
-                await self.close(code=4002)  # 自定义关闭码：token 无效
-                return
-            
-            if decoded_result:
-                self.user_id = decoded_result.get('user_id')
-                self.chat_group_name = "user_" + str(self.user_id)
-                # 收到连接时候处理，
-                await self.channel_layer.group_add(
-                    self.chat_group_name,
-                    self.channel_name
-                )
-                await self.accept()
-                # 主动推送消息
-                unread_count = await _get_message_unread(self.user_id)
-                if unread_count == 0:
-                    # 发送连接成功
-                    await self.send_json(set_message('system', 'SYSTEM', '您已上线'))
-                else:
-                    await self.send_json(
-                        set_message('system', 'SYSTEM', "请查看您的未读消息~",
-                                    unread=unread_count))
-        except InvalidSignatureError:
-            await self.disconnect(None)
+                await self.send(text_data=text)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"WebSocket 消息发送失败：user_id={self.user_id} - {e}")
 
     async def disconnect(self, close_code):
+        # 停止后台发送任务
+        relay_task = getattr(self, '_relay_task', None)
+        if relay_task is not None:
+            relay_task.cancel()
         # 安全退出房间组（JWT 验证失败时 chat_group_name 可能未初始化）
         if hasattr(self, 'chat_group_name'):
             await self.channel_layer.group_discard(self.chat_group_name, self.channel_name)
+            await self.channel_layer.group_discard(BROADCAST_GROUP, self.channel_name)
         try:
             await self.close(close_code)
         except Exception:
@@ -117,9 +220,12 @@ class MegCenter(MainotebookWebSocket):
 
     async def receive(self, text_data):
         # 接受客户端的信息，你处理的函数
-        text_data_json = json.loads(text_data)
+        text_data_json = orjson.loads(text_data)
         message_id = text_data_json.get('message_id', None)
-        user_list = await _get_message_center_instance(message_id)
+        user_list = [
+            uid async for uid in
+            MessageCenter.objects.filter(id=message_id).values_list('target_user', flat=True)
+        ]
         for send_user in user_list:
             await self.channel_layer.group_send(
                 "user_" + str(send_user),
@@ -127,9 +233,16 @@ class MegCenter(MainotebookWebSocket):
             )
 
     async def push_message(self, event):
-        """消息发送"""
-        message = event['json']
-        await self.send(text_data=json.dumps(message))
+        """消息发送
+
+        广播时消息体已预先序列化为 text，直接转发；否则序列化 json 字段。
+        消息放入发送队列后立即返回，由后台任务负责实际发送。
+        """
+        text = event['text'] if 'text' in event else _dumps(event['json'])
+        if getattr(self, '_out_q', None) is None:
+            await self.send(text_data=text)
+            return
+        self.enqueue(text)
 
 
 class MessageCreateSerializer(CustomModelSerializer):
@@ -142,16 +255,59 @@ class MessageCreateSerializer(CustomModelSerializer):
         read_only_fields = ["id"]
 
 
+# 在事件循环中调度的推送任务，保持引用避免被提前回收
+_pending_pushes = set()
+
+
+async def awebsocket_push(user_id, message):
+    """通过 WebSocket 向指定用户推送消息（异步版本）
+
+    Args:
+        user_id: 目标用户 ID
+        message: 推送消息体字典
+    """
+    await _layer().group_send("user_" + str(user_id), {"type": "push.message", "json": message})
+
+
 def websocket_push(user_id, message):
-    username = "user_" + str(user_id)
-    channel_layer = get_channel_layer()
-    async_to_sync(channel_layer.group_send)(
-        username,
-        {
-            "type": "push.message",
-            "json": message
-        }
-    )
+    """通过 WebSocket 向指定用户推送消息
+
+    在事件循环线程中调用时直接调度为任务，不再经过 async_to_sync；
+    在同步上下文中调用时通过 async_to_sync 执行。
+
+    Args:
+        user_id: 目标用户 ID
+        message: 推送消息体字典
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        async_to_sync(awebsocket_push)(user_id, message)
+        return
+    task = loop.create_task(awebsocket_push(user_id, message))
+    _pending_pushes.add(task)
+    task.add_done_callback(_pending_pushes.discard)
+
+
+def broadcast_websocket(user_ids, message):
+    """批量 WebSocket 推送，所有 group_send 在一次 async_to_sync 中并发执行
+
+    Args:
+        user_ids: 用户 ID 可迭代对象
+        message: 推送消息体字典
+    """
+    text = _dumps(message)
+    for chunk in _chunked(user_ids, PUSH_CHUNK_SIZE):
+        async_to_sync(_fanout)(_layer(), chunk, lambda uid: text)
+
+
+def broadcast_all_websocket(message):
+    """向全员广播组发送一条 WebSocket 消息（所有在线连接都已加入 BROADCAST_GROUP）
+
+    Args:
+        message: 推送消息体字典
+    """
+    async_to_sync(_layer().group_send)(BROADCAST_GROUP, {"type": "push.message", "text": _dumps(message)})
 
 
 def create_message_push(title: str, content: str, target_type: int = 0, target_user: list = None, target_dept=None,
@@ -190,43 +346,35 @@ def create_message_push(title: str, content: str, target_type: int = 0, target_u
     message_center_instance.is_valid(raise_exception=True)
     message_center_instance.save()
 
-    ws_message = {**message, "unread": 1}
-    channel_layer = get_channel_layer()
+    # 广播消息体对所有接收者相同，只序列化一次
+    ws_text = _dumps({**message, "unread": 1})
+    channel_layer = _layer()
 
     if target_type == 0:
-        # 指定用户：写入中间表并逐个推送
+        # 指定用户：写入中间表并推送
         users = target_user or []
-        targetuser_data = [
-            {"messagecenter": message_center_instance.instance.id, "users": uid}
-            for uid in users
-        ]
-        targetuser_instance = MessageCenterTargetUserSerializer(data=targetuser_data, many=True, request=request)
-        targetuser_instance.is_valid(raise_exception=True)
-        targetuser_instance.save()
-        for uid in users:
-            unread_count = async_to_sync(_get_message_unread)(uid)
-            async_to_sync(channel_layer.group_send)(
-                "user_" + str(uid),
-                {"type": "push.message", "json": {**message, "unread": unread_count}}
-            )
-    elif target_type == 1:
-        # 按角色：不写中间表
-        user_ids = Users.objects.filter(role__id__in=target_role).values_list('id', flat=True).distinct()
-        for uid in user_ids:
-            async_to_sync(channel_layer.group_send)(
-                "user_" + str(uid), {"type": "push.message", "json": ws_message}
-            )
-    elif target_type == 2:
-        # 按部门：不写中间表
-        user_ids = Users.objects.filter(dept__id__in=target_dept).values_list('id', flat=True).distinct()
-        for uid in user_ids:
-            async_to_sync(channel_layer.group_send)(
-                "user_" + str(uid), {"type": "push.message", "json": ws_message}
-            )
+        message_id = message_center_instance.instance.id
+        MessageCenterTargetUser.objects.bulk_create(
+            [MessageCenterTargetUser(messagecenter_id=message_id, users_id=uid) for uid in users],
+            batch_size=500
+        )
+
+        async def _push_all():
+            # 所有 group_send 在同一个事件循环中并发执行，只做一次 sync/async 切换
+            unread_map = await _get_unread_map(users)
+            await _fanout(channel_layer, users, lambda uid: _dumps({**message, "unread": unread_map.get(uid, 0)}))
+
+        async_to_sync(_push_all)()
+    elif target_type in (1, 2):
+        # 按角色/部门：不写中间表
+        if target_type == 1:
+            queryset = Users.objects.filter(role__id__in=target_role)
+        else:
+            queryset = Users.objects.filter(dept__id__in=target_dept)
+        # 在 SQL 中去重并只执行一次查询，分块流式读取用户 ID，每块并发推送
+        user_ids = queryset.values_list('id', flat=True).distinct().iterator(chunk_size=PUSH_CHUNK_SIZE)
+        for chunk in _chunked(user_ids, PUSH_CHUNK_SIZE):
+            async_to_sync(_fanout)(channel_layer, chunk, lambda uid: ws_text)
     elif target_type == 3:
-        # 系统通知：不写中间表，广播所有用户
-        user_ids = Users.objects.values_list('id', flat=True)
-        for uid in user_ids:
-            async_to_sync(channel_layer.group_send)(
-                "user_" + str(uid), {"type": "push.message", "json": ws_message}
-            )
\ No newline at end of file
+        # 系统通知：不写中间表，向全员广播组发送一条消息
+        broadcast_all_websocket({**message, "unread": 1})
@@ -22,6 +22,9 @@ DATABASE_PORT = 3306
 DATABASE_USER = "root"
 # # 数据库密码
 DATABASE_PASSWORD = 'MAINOTEBOOK3'
+# # 数据库持久连接时长（秒），0 表示每个请求结束后关闭连接
+# # 默认的 ASGI（uvicorn）部署必须保持 0，连接复用请使用 pgbouncer 等外部连接池；仅 WSGI 部署可设为 60 左右
+DATABASE_CONN_MAX_AGE = 0
 
 # 表前缀
 TABLE_PREFIX = "mainotebook_"
@@ -53,6 +56,21 @@ LOGIN_NO_CAPTCHA_AUTH = True
 ALLOWED_HOSTS = ["*"]
 # 列权限中排除App应用
 COLUMN_EXCLUDE_APPS = []
+# 媒体文件交由 nginx 发送时的 internal location 前缀，需在 nginx 中配置对应的 internal 路径指向 MEDIA_ROOT
+# MEDIA_ACCEL_REDIRECT_PREFIX = "/protected-media/"
+# 知识库/人设卡综合搜索是否使用 PostgreSQL 全文检索（默认使用模糊匹配）
+# 全文检索按词匹配，中文内容需配合分词扩展（如 zhparser）并修改检索配置
+CONTENT_FULLTEXT_SEARCH = False
+# 全文检索使用的文本检索配置，修改后需执行 python manage.py rebuild_search_vectors
+CONTENT_FULLTEXT_SEARCH_CONFIG = "simple"
+# 下载记录、审核日志的批量写入方式：
+# False 逐条写入；True 缓冲在进程内批量写入（进程异常退出时可能丢失最近约 0.5 秒的记录）；
+# 'redis' 缓冲在 Redis 中，由 Celery Beat 每秒批量写入（需启动 Celery Worker 与 Beat）
+AUDIT_RECORD_BUFFER = False
+# 分页总数缓存时间（秒），0 表示不缓存；开启后列表总数最多滞后该时长，建议 30~60
+PAGINATION_COUNT_CACHE_TIMEOUT = 0
+# 评论 AI 审核结果按内容哈希缓存的时间（秒），0 表示不缓存；相同文本在该时间内不再调用 AI
+COMMENT_MODERATION_CACHE_TIMEOUT = 3600
 
 # ================================================= #
 # ************** 人设卡上传功能配置 *************** #
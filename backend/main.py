@@ -29,9 +29,12 @@ if __name__ == '__main__':
     
     # 自动重载模式下不使用多进程
     workers = 1 if args.reload else 4
+    # uvloop 仅支持 POSIX 平台
+    loop = "uvloop"
     if os.sys.platform.startswith('win'):
         # Windows操作系统
         workers = None
+        loop = "asyncio"
     
     # 配置 uvicorn
     uvicorn.run(
@@ -40,6 +43,9 @@ if __name__ == '__main__':
         host=args.host,
         port=args.port,
         workers=workers,
+        loop=loop,
+        http="httptools",
+        ws="websockets",
         log_config=LOGGING,
         timeout_graceful_shutdown=5  # 优雅关闭超时时间设为 5 秒
     )
@@ -54,6 +54,7 @@ if ADMIN_ENABLED:
         list_filter = ['is_public', 'is_pending', 'create_datetime']
         search_fields = ['name', 'description', 'tags']
         raw_id_fields = ['uploader']
+        list_select_related = ['uploader']
         date_hierarchy = 'create_datetime'
         readonly_fields = ['create_datetime', 'update_datetime']
         
@@ -93,6 +94,7 @@ if ADMIN_ENABLED:
         list_filter = ['is_public', 'is_pending', 'create_datetime']
         search_fields = ['name', 'description', 'tags']
         raw_id_fields = ['uploader']
+        list_select_related = ['uploader']
         date_hierarchy = 'create_datetime'
         readonly_fields = ['create_datetime', 'update_datetime']
         
@@ -193,6 +195,7 @@ if ADMIN_ENABLED:
         list_filter = ['target_type', 'is_deleted', 'create_datetime']
         search_fields = ['content', 'user__username']
         raw_id_fields = ['user', 'parent']
+        list_select_related = ['user']
         date_hierarchy = 'create_datetime'
         readonly_fields = ['create_datetime', 'update_datetime']
         
@@ -228,6 +231,7 @@ if ADMIN_ENABLED:
         list_filter = ['reaction_type', 'create_datetime']
         search_fields = ['user__username', 'comment__content']
         raw_id_fields = ['user', 'comment']
+        list_select_related = ['user', 'comment__user']
         date_hierarchy = 'create_datetime'
         readonly_fields = ['create_datetime', 'update_datetime']
         
@@ -255,6 +259,7 @@ if ADMIN_ENABLED:
         list_filter = ['target_type', 'create_datetime']
         search_fields = ['user__username', 'target_id']
         raw_id_fields = ['user']
+        list_select_related = ['user']
         date_hierarchy = 'create_datetime'
         readonly_fields = ['create_datetime', 'update_datetime']
         
@@ -310,6 +315,7 @@ if ADMIN_ENABLED:
         list_filter = ['target_type', 'status', 'create_datetime']
         search_fields = ['name', 'description', 'uploader__username', 'target_id']
         raw_id_fields = ['uploader']
+        list_select_related = ['uploader']
         date_hierarchy = 'create_datetime'
         readonly_fields = ['create_datetime', 'update_datetime']
         
@@ -370,6 +376,7 @@ if ADMIN_ENABLED:
         list_filter = ['data_type', 'is_deleted', 'create_datetime']
         search_fields = ['section_name', 'key_name', 'value', 'description']
         raw_id_fields = ['persona_card']
+        list_select_related = ['persona_card']
         date_hierarchy = 'create_datetime'
         readonly_fields = ['create_datetime', 'update_datetime']
         
@@ -403,6 +410,7 @@ if ADMIN_ENABLED:
         list_filter = ['confirmed_at']
         search_fields = ['persona_card__name', 'user__username', 'confirmation_text', 'ip_address']
         raw_id_fields = ['persona_card', 'user']
+        list_select_related = ['persona_card', 'user']
         date_hierarchy = 'confirmed_at'
         readonly_fields = ['confirmed_at', 'create_datetime', 'update_datetime']
         
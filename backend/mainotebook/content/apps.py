@@ -3,6 +3,7 @@ Content 应用配置模块
 """
 
 from django.apps import AppConfig
+from django.db.models.signals import pre_migrate
 
 
 class ContentConfig(AppConfig):
@@ -18,3 +19,12 @@ class ContentConfig(AppConfig):
         import mainotebook.content.views.ai_model  # noqa: F401
         # 注册标签统计生命周期同步信号
         import mainotebook.content.signals  # noqa: F401
+        # 迁移前启用 pg_trgm 扩展（模糊搜索三元组索引依赖）
+        pre_migrate.connect(
+            mainotebook.content.signals.ensure_pg_trgm_extension,
+            sender=self,
+            dispatch_uid='content_ensure_pg_trgm_extension',
+        )
+        # 内容模块日志改为异步队列输出，避免日志 I/O 阻塞请求
+        from mainotebook.utils.log_queue import enable_queue_logging
+        enable_queue_logging('mainotebook.content')
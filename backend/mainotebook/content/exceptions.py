@@ -6,6 +6,7 @@
 """
 
 import logging
+from functools import lru_cache
 from typing import Any, Dict, Optional
 from rest_framework.views import exception_handler, set_rollback
 from rest_framework.response import Response
@@ -13,6 +14,8 @@ from mainotebook.utils.json_response import ErrorResponse
 
 logger = logging.getLogger(__name__)
 
+INTERNAL_ERROR_MSG = '服务器内部错误'
+
 
 class ContentException(Exception):
     """内容相关异常基类
@@ -101,83 +104,108 @@ class ConflictException(ContentException):
         super().__init__(message, code=409)
 
 
-def custom_exception_handler(exc, context):
-    """自定义异常处理器
-    
-    处理自定义异常并返回统一格式的错误响应。
-    此处理器会：
-    1. 首先调用 DRF 默认的异常处理器
-    2. 处理自定义的 ContentException 及其子类
-    3. 处理其他 DRF 异常
-    4. 处理未捕获的异常
-    
-    Args:
-        exc: 异常对象
-        context: 异常上下文，包含 view 和 request 等信息
-        
-    Returns:
-        ErrorResponse: 统一格式的错误响应
+def _build_log_extra(request, view) -> Dict[str, Any]:
+    """构建异常日志的上下文信息（仅在对应日志级别启用时调用）"""
+    user_id = None
+    if request is not None:
+        user_id = getattr(getattr(request, 'user', None), 'id', None)
+    return {
+        'user_id': user_id,
+        'path': getattr(request, 'path', None),
+        'method': getattr(request, 'method', None),
+        'view': view.__class__.__name__ if view is not None else None,
+    }
+
+
+def _handle_content_exception(exc, context):
+    """处理 ContentException 及其子类
+
+    DRF 视图在 ASGI 下同样运行在 sync_to_async 的工作线程中，本处理器不会阻塞事件循环；
+    set_rollback() 只标记当前线程连接上的事务，必须在同一线程同步执行，不能转交其他线程。
+    日志已通过队列异步输出。
     """
-    # 调用 DRF 默认的异常处理器
-    response = exception_handler(exc, context)
-    
-    # 获取请求信息用于日志记录
-    request = context.get('request')
-    view = context.get('view')
+    # 设置数据库回滚
+    set_rollback()
     
-    # 处理自定义异常
-    if isinstance(exc, ContentException):
-        # 设置数据库回滚
-        set_rollback()
-        
-        # 记录警告日志
+    # 记录警告日志
+    if logger.isEnabledFor(logging.WARNING):
         logger.warning(
-            f"自定义异常: {exc.__class__.__name__} - {exc.message}",
-            extra={
-                'user_id': getattr(request.user, 'id', None) if request and hasattr(request, 'user') else None,
-                'path': request.path if request else None,
-                'method': request.method if request else None,
-                'view': view.__class__.__name__ if view else None,
-            }
+            "自定义异常: %s - %s", exc.__class__.__name__, exc.message,
+            extra=_build_log_extra(context.get('request'), context.get('view')),
         )
-        
-        # 返回统一格式的错误响应
-        return ErrorResponse(msg=exc.message, code=exc.code, status=exc.code)
+    
+    # 返回统一格式的错误响应
+    return ErrorResponse(msg=exc.message, code=exc.code, status=exc.code)
+
+
+def _handle_other_exception(exc, context):
+    """处理 DRF 异常及未捕获的异常"""
+    # 调用 DRF 默认的异常处理器
+    response = exception_handler(exc, context)
     
     # 处理其他 DRF 异常
     if response is not None:
         # 记录警告日志
-        logger.warning(
-            f"DRF 异常: {exc.__class__.__name__} - {str(exc)}",
-            extra={
-                'user_id': getattr(request.user, 'id', None) if request and hasattr(request, 'user') else None,
-                'path': request.path if request else None,
-                'method': request.method if request else None,
-                'view': view.__class__.__name__ if view else None,
-            }
-        )
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "DRF 异常: %s - %s", exc.__class__.__name__, exc,
+                extra=_build_log_extra(context.get('request'), context.get('view')),
+            )
         
         # 提取错误消息
         msg = str(exc)
-        if hasattr(response, 'data') and isinstance(response.data, dict):
+        data = getattr(response, 'data', None)
+        if isinstance(data, dict):
             # 如果响应数据是字典，尝试提取详细信息
-            if 'detail' in response.data:
-                msg = response.data['detail']
-            elif 'message' in response.data:
-                msg = response.data['message']
+            if 'detail' in data:
+                msg = data['detail']
+            elif 'message' in data:
+                msg = data['message']
         
         return ErrorResponse(msg=msg, code=response.status_code, status=response.status_code)
     
     # 处理未捕获的异常
-    logger.error(
-        f"未处理的异常: {exc.__class__.__name__} - {str(exc)}",
-        exc_info=True,
-        extra={
-            'user_id': getattr(request.user, 'id', None) if request and hasattr(request, 'user') else None,
-            'path': request.path if request else None,
-            'method': request.method if request else None,
-            'view': view.__class__.__name__ if view else None,
-        }
-    )
-    
-    return ErrorResponse(msg='服务器内部错误', code=500, status=500)
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error(
+            "未处理的异常: %s - %s", exc.__class__.__name__, exc,
+            exc_info=True,
+            extra=_build_log_extra(context.get('request'), context.get('view')),
+        )
+    
+    # Response 在 finalize/render 阶段会绑定请求、渲染器与响应头，每个请求必须使用新实例，不能缓存复用
+    return ErrorResponse(msg=INTERNAL_ERROR_MSG, code=500, status=500)
+
+
+# 异常类型 -> 处理函数
+_HANDLERS = {
+    ContentException: _handle_content_exception,
+}
+
+
+@lru_cache(maxsize=128)
+def _resolve_handler(exc_type):
+    """按异常类型查找处理函数，结果按类型缓存（异常类数量有限）"""
+    for base in exc_type.__mro__:
+        handler = _HANDLERS.get(base)
+        if handler is not None:
+            return handler
+    return _handle_other_exception
+
+
+def custom_exception_handler(exc, context):
+    """自定义异常处理器
+    
+    处理自定义异常并返回统一格式的错误响应。
+    此处理器会：
+    1. 处理自定义的 ContentException 及其子类
+    2. 调用 DRF 默认的异常处理器处理其他 DRF 异常
+    3. 处理未捕获的异常
+    
+    Args:
+        exc: 异常对象
+        context: 异常上下文，包含 view 和 request 等信息
+        
+    Returns:
+        ErrorResponse: 统一格式的错误响应
+    """
+    return _resolve_handler(type(exc))(exc, context)
@@ -4,11 +4,79 @@
 使用 django-filter 库实现声明式过滤。
 """
 
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery
+from django.db.models import Q
 from django_filters import rest_framework as filters
-from mainotebook.content.models import KnowledgeBase, PersonaCard, Comment
+from django_filters.constants import EMPTY_VALUES
+from mainotebook.content.models import (
+    KnowledgeBase, PersonaCard, Comment, IS_POSTGRESQL, get_search_config, search_text_expression,
+)
 
 
-class KnowledgeBaseFilter(filters.FilterSet):
+def fulltext_search_enabled():
+    """是否使用 PostgreSQL 全文检索处理综合搜索（需开启 CONTENT_FULLTEXT_SEARCH）"""
+    return IS_POSTGRESQL and getattr(settings, 'CONTENT_FULLTEXT_SEARCH', False)
+
+
+def fulltext_search(queryset, value):
+    """基于 search_vector GIN 索引的综合搜索，一次索引探测覆盖名称、描述与标签"""
+    return queryset.filter(
+        search_vector=SearchQuery(value, config=get_search_config(), search_type='websearch')
+    )
+
+
+def keyword_q(value):
+    """综合搜索的模糊匹配条件（名称、描述）"""
+    return Q(name__icontains=value) | Q(description__icontains=value)
+
+
+# 综合搜索表达式只构建一次；查询解析表达式时会复制，模块级实例可安全复用
+SEARCH_TEXT = search_text_expression()
+
+
+def keyword_search(queryset, value):
+    """综合搜索的模糊匹配
+
+    PostgreSQL 下对名称与描述的拼接文本做单个 icontains 匹配，命中 search_text 三元组索引；
+    其他数据库使用 OR 条件。
+    """
+    if IS_POSTGRESQL:
+        return queryset.alias(search_text=SEARCH_TEXT).filter(search_text__icontains=value)
+    return queryset.filter(keyword_q(value))
+
+
+class TrimmedCharFilter(filters.CharFilter):
+    """去除首尾空白后再过滤的字符过滤器
+
+    去除空白后为空或短于 min_length 时不做过滤，避免生成匹配全部记录的 LIKE 条件。
+    默认最小长度为 1：单个中文字符也是有效的搜索词。
+    """
+
+    def __init__(self, *args, min_length=1, **kwargs):
+        self.min_length = min_length
+        super().__init__(*args, **kwargs)
+
+    def filter(self, qs, value):
+        value = (value or '').strip()
+        if len(value) < self.min_length:
+            return qs
+        return super().filter(qs, value)
+
+
+class ContentFilterSet(filters.FilterSet):
+    """内容过滤器基类
+
+    请求未携带任何有效筛选参数时直接返回原查询集，跳过逐个过滤器的调用。
+    """
+
+    def filter_queryset(self, queryset):
+        if all(value in EMPTY_VALUES for value in self.form.cleaned_data.values()):
+            return queryset
+        return super().filter_queryset(queryset)
+
+
+class KnowledgeBaseFilter(ContentFilterSet):
     """知识库过滤器
     
     支持按名称、标签、创建时间、收藏数等字段进行筛选和搜索。
@@ -16,14 +84,14 @@ class KnowledgeBaseFilter(filters.FilterSet):
     """
     
     # 名称模糊搜索
-    name = filters.CharFilter(
+    name = TrimmedCharFilter(
         field_name='name',
         lookup_expr='icontains',
         label='知识库名称'
     )
     
     # 描述模糊搜索
-    description = filters.CharFilter(
+    description = TrimmedCharFilter(
         field_name='description',
         lookup_expr='icontains',
         label='知识库描述'
@@ -101,14 +169,15 @@ class KnowledgeBaseFilter(filters.FilterSet):
     
     class Meta:
         model = KnowledgeBase
-        fields = [
-            'name', 'description', 'tags', 'uploader',
-            'is_public', 'is_pending',
+        # 精确匹配 / 有索引的字段在前，模糊搜索在后
+        fields = (
+            'uploader', 'is_public', 'is_pending',
             'create_datetime_after', 'create_datetime_before',
             'star_count_min', 'star_count_max',
             'downloads_min', 'downloads_max',
-            'keyword'
-        ]
+            'name', 'description', 'tags',
+            'keyword',
+        )
     
     def filter_tags(self, queryset, name, value):
         """标签筛选过滤方法
@@ -126,8 +195,6 @@ class KnowledgeBaseFilter(filters.FilterSet):
         Returns:
             QuerySet: 过滤后的查询集
         """
-        from django.db.models import Q
-
         # 从 request 中获取完整的标签列表
         # CharFilter 的 value 参数只包含最后一个值，需要直接从 request 获取
         tag_list = self.request.GET.getlist('tags') if hasattr(self, 'request') else []
@@ -156,6 +223,7 @@ class KnowledgeBaseFilter(filters.FilterSet):
         
         在名称、描述字段中进行模糊搜索。
         注意：标签字段现在是 JSONField，不再使用 icontains。
+        开启 CONTENT_FULLTEXT_SEARCH 时改用 PostgreSQL 全文检索（同时匹配标签）。
         
         Args:
             queryset: 查询集
@@ -168,14 +236,13 @@ class KnowledgeBaseFilter(filters.FilterSet):
         if not value:
             return queryset
         
-        from django.db.models import Q
-        return queryset.filter(
-            Q(name__icontains=value) |
-            Q(description__icontains=value)
-        )
+        if fulltext_search_enabled():
+            return fulltext_search(queryset, value)
+        
+        return keyword_search(queryset, value)
 
 
-class PersonaCardFilter(filters.FilterSet):
+class PersonaCardFilter(ContentFilterSet):
     """人设卡过滤器
     
     支持按名称、标签、创建时间、收藏数等字段进行筛选和搜索。
@@ -183,14 +250,14 @@ class PersonaCardFilter(filters.FilterSet):
     """
     
     # 名称模糊搜索
-    name = filters.CharFilter(
+    name = TrimmedCharFilter(
         field_name='name',
         lookup_expr='icontains',
         label='人设卡名称'
     )
     
     # 描述模糊搜索
-    description = filters.CharFilter(
+    description = TrimmedCharFilter(
         field_name='description',
         lookup_expr='icontains',
         label='人设卡描述'
@@ -274,14 +341,15 @@ class PersonaCardFilter(filters.FilterSet):
     
     class Meta:
         model = PersonaCard
-        fields = [
-            'name', 'description', 'tags', 'uploader',
-            'is_public', 'is_pending',
+        # 精确匹配 / 有索引的字段在前，模糊搜索在后
+        fields = (
+            'uploader', 'is_public', 'is_pending',
             'create_datetime_after', 'create_datetime_before',
             'star_count_min', 'star_count_max',
             'downloads_min', 'downloads_max',
-            'version', 'keyword'
-        ]
+            'version', 'name', 'description', 'tags',
+            'keyword',
+        )
     
     def filter_version(self, queryset, name, value):
         """版本号筛选过滤方法
@@ -340,8 +408,6 @@ class PersonaCardFilter(filters.FilterSet):
         Returns:
             QuerySet: 过滤后的查询集
         """
-        from django.db.models import Q
-
         # 从 request 中获取完整的标签列表
         # CharFilter 的 value 参数只包含最后一个值，需要直接从 request 获取
         tag_list = self.request.GET.getlist('tags') if hasattr(self, 'request') else []
@@ -370,6 +436,7 @@ class PersonaCardFilter(filters.FilterSet):
         
         在名称、描述字段中进行模糊搜索。
         注意：标签字段现在是 JSONField，不再使用 icontains。
+        开启 CONTENT_FULLTEXT_SEARCH 时改用 PostgreSQL 全文检索（同时匹配标签）。
         
         Args:
             queryset: 查询集
@@ -382,14 +449,13 @@ class PersonaCardFilter(filters.FilterSet):
         if not value:
             return queryset
         
-        from django.db.models import Q
-        return queryset.filter(
-            Q(name__icontains=value) |
-            Q(description__icontains=value)
-        )
+        if fulltext_search_enabled():
+            return fulltext_search(queryset, value)
+        
+        return keyword_search(queryset, value)
 
 
-class CommentFilter(filters.FilterSet):
+class CommentFilter(ContentFilterSet):
     """评论过滤器
     
     支持按目标ID、目标类型、用户、父评论等字段进行筛选。
@@ -397,19 +463,15 @@ class CommentFilter(filters.FilterSet):
     """
     
     # 目标ID筛选
-    target_id = filters.CharFilter(
+    target_id = filters.UUIDFilter(
         field_name='target_id',
-        lookup_expr='exact',
         label='目标ID'
     )
     
     # 目标类型筛选
     target_type = filters.ChoiceFilter(
         field_name='target_type',
-        choices=[
-            ('knowledge', '知识库'),
-            ('persona', '人设卡')
-        ],
+        choices=Comment.TARGET_TYPE_CHOICES,
         label='目标类型'
     )
     
@@ -427,7 +489,8 @@ class CommentFilter(filters.FilterSet):
     
     # 是否为顶级评论（没有父评论）
     is_root = filters.BooleanFilter(
-        method='filter_is_root',
+        field_name='parent',
+        lookup_expr='isnull',
         label='是否为顶级评论'
     )
     
@@ -464,7 +527,7 @@ class CommentFilter(filters.FilterSet):
     )
     
     # 内容模糊搜索
-    content = filters.CharFilter(
+    content = TrimmedCharFilter(
         field_name='content',
         lookup_expr='icontains',
         label='评论内容'
@@ -472,29 +535,11 @@ class CommentFilter(filters.FilterSet):
     
     class Meta:
         model = Comment
-        fields = [
-            'target_id', 'target_type', 'user', 'parent',
+        # 精确匹配 / 有索引的字段在前，模糊搜索在后
+        fields = (
+            'user', 'parent', 'target_id', 'target_type',
             'is_root', 'is_deleted',
             'create_datetime_after', 'create_datetime_before',
             'like_count_min', 'like_count_max',
-            'content'
-        ]
-    
-    def filter_is_root(self, queryset, name, value):
-        """筛选顶级评论的过滤方法
-        
-        Args:
-            queryset: 查询集
-            name: 字段名
-            value: 布尔值，True 表示只返回顶级评论
-            
-        Returns:
-            QuerySet: 过滤后的查询集
-        """
-        if value is True:
-            # 返回没有父评论的评论
-            return queryset.filter(parent__isnull=True)
-        elif value is False:
-            # 返回有父评论的评论（回复）
-            return queryset.filter(parent__isnull=False)
-        return queryset
+            'content',
+        )
@@ -2,6 +2,7 @@
 
 import os
 import django
+import orjson
 from dvadmin.utils.core_initialize import CoreInitialize
 
 
@@ -25,18 +26,16 @@ class Initialize(CoreInitialize):
         )
 
     def load_data(self, filename):
-        import json
+        """逐条产出 fixture 中的 fields（带上 pk 作为 id），由 save 直接迭代消费"""
         file_path = os.path.join(
             os.path.dirname(os.path.abspath(__file__)),
             filename,
         )
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            # 提取 fields 字段作为数据
-            result = []
-            for item in data:
-                fields = item.get('fields', {})
-                if 'pk' in item:
-                    fields['id'] = item['pk']
-                result.append(fields)
-            return result
+        with open(file_path, 'rb') as f:
+            data = orjson.loads(f.read())
+        # 提取 fields 字段作为数据，原地补充 id，不再构建第二个列表
+        for item in data:
+            fields = item.get('fields') or {}
+            if 'pk' in item:
+                fields['id'] = item['pk']
+            yield fields
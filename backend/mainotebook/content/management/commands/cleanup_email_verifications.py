@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+
+"""清理已过期的邮箱验证码
+
+可由定时任务周期执行，单条 DELETE 语句按 expires_at 索引范围删除。
+"""
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from mainotebook.content.models import EmailVerification
+
+
+class Command(BaseCommand):
+    help = '删除已过期的邮箱验证码记录'
+
+    def handle(self, *args, **options):
+        deleted_count, _ = EmailVerification.all_objects.filter(
+            expires_at__lt=timezone.now()
+        ).delete()
+        self.stdout.write(self.style.SUCCESS(f'已删除 {deleted_count} 条过期验证码'))
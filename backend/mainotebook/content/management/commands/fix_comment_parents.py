@@ -4,45 +4,146 @@
 
 将所有 parent 指向非根评论的评论修正为指向真正的根评论（parent=None），
 确保评论树只有两层结构。
+
+PostgreSQL / SQLite 下通过递归 CTE 在数据库内一次性计算每条评论的根评论并批量更新；
+其他数据库回退到一次载入 parent 映射、在内存中解析根评论的方式。
 """
 
 from django.core.management.base import BaseCommand
+from django.db import connection, transaction
 
 from mainotebook.content.models import Comment
 
 
+# 回退方式下读取与批量写回的批大小
+FETCH_CHUNK_SIZE = 2000
+UPDATE_BATCH_SIZE = 1000
+
+# 递归计算每条评论所属的根评论（只从根评论出发，孤立或成环的数据不会被遍历到）
+ROOT_TREE_CTE = """
+WITH RECURSIVE tree (id, parent_id, root_id) AS (
+    SELECT id, parent_id, id FROM {table} WHERE parent_id IS NULL
+    UNION ALL
+    SELECT c.id, c.parent_id, t.root_id FROM {table} c JOIN tree t ON c.parent_id = t.id
+)
+"""
+
+POSTGRESQL_FIX_SQL = ROOT_TREE_CTE + """,
+fix AS (
+    SELECT id, parent_id AS old_parent_id, root_id FROM tree
+    WHERE parent_id IS NOT NULL AND parent_id <> root_id
+)
+UPDATE {table} SET parent_id = fix.root_id
+FROM fix
+WHERE {table}.id = fix.id
+RETURNING {table}.id, fix.old_parent_id, fix.root_id
+"""
+
+SQLITE_COUNT_SQL = ROOT_TREE_CTE + """
+SELECT COUNT(*) FROM tree WHERE parent_id IS NOT NULL AND parent_id <> root_id
+"""
+
+SQLITE_FIX_SQL = ROOT_TREE_CTE + """
+UPDATE {table} SET parent_id = (SELECT root_id FROM tree WHERE tree.id = {table}.id)
+WHERE id IN (SELECT id FROM tree WHERE parent_id IS NOT NULL AND parent_id <> root_id)
+"""
+
+
 class Command(BaseCommand):
     help = '修复评论树结构，将三级及以上评论的 parent 修正为根评论'
 
     def handle(self, *args, **options):
-        """遍历所有非根评论，检查并修正 parent 指向"""
-        # 找出所有 parent 不为空的评论
-        child_comments = Comment.objects.filter(
-            parent__isnull=False
-        ).select_related('parent')
-
-        fixed_count = 0
-        for comment in child_comments:
-            if comment.parent_id and comment.parent and comment.parent.parent_id:
-                # parent 本身也有 parent，说明是三级或更深
-                root = comment.parent
-                max_depth = 10
-                while root.parent_id and max_depth > 0:
-                    root = Comment.objects.filter(id=root.parent_id).first()
-                    if not root:
-                        break
-                    max_depth -= 1
-
-                if root and root.id != comment.parent_id:
-                    old_parent_id = comment.parent_id
-                    comment.parent_id = root.id
-                    comment.save(update_fields=['parent_id'])
-                    fixed_count += 1
-                    self.stdout.write(
-                        f'  修正: 评论 {comment.id} 的 parent '
-                        f'从 {old_parent_id} -> {root.id}'
-                    )
+        """根据数据库类型选择修复方式，并输出修正数量"""
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                fixed_count = self._fix_postgresql()
+            elif connection.vendor == 'sqlite':
+                fixed_count = self._fix_sqlite()
+            else:
+                fixed_count = self._fix_in_python()
 
         self.stdout.write(self.style.SUCCESS(
             f'完成，共修正 {fixed_count} 条评论的 parent 指向'
         ))
+
+    def _fix_postgresql(self):
+        """单条 UPDATE ... FROM 递归 CTE 语句完成修正"""
+        table = connection.ops.quote_name(Comment._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(POSTGRESQL_FIX_SQL.format(table=table))
+            for comment_id, old_parent_id, root_id in cursor.fetchall():
+                self.stdout.write(
+                    f'  修正: 评论 {comment_id} 的 parent '
+                    f'从 {old_parent_id} -> {root_id}'
+                )
+            return cursor.rowcount
+
+    def _fix_sqlite(self):
+        """SQLite 不支持 UPDATE ... FROM ... RETURNING，先统计数量再更新"""
+        table = connection.ops.quote_name(Comment._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(SQLITE_COUNT_SQL.format(table=table))
+            fixed_count = cursor.fetchone()[0]
+            if fixed_count:
+                cursor.execute(SQLITE_FIX_SQL.format(table=table))
+            return fixed_count
+
+    def _fix_in_python(self):
+        """在内存中解析根评论，检查并修正 parent 指向（分批 bulk_update 写回）
+
+        成环或祖先缺失的评论链无法确定根评论，保持不变。
+        """
+        # 与递归 CTE 一样读取整张表（含已删除评论），不经过默认管理器的过滤
+        # 一次查询载入所有非根评论的 id -> parent_id 映射
+        parent_map = dict(
+            Comment.all_objects.filter(parent__isnull=False)
+            .order_by()
+            .values_list('id', 'parent_id')
+            .iterator(chunk_size=FETCH_CHUNK_SIZE)
+        )
+        # 真实存在的根评论；parent 未建外键约束，祖先可能已不存在，
+        # 解析到不存在的根时与递归 CTE 一样跳过整条链
+        root_ids = set(
+            Comment.all_objects.filter(parent__isnull=True)
+            .order_by()
+            .values_list('id', flat=True)
+            .iterator(chunk_size=FETCH_CHUNK_SIZE)
+        )
+        root_cache = {}
+
+        def resolve_root(comment_id):
+            """沿 parent_map 向上查找根评论，并对路径上的节点做路径压缩"""
+            path = []
+            node = comment_id
+            visited = set()
+            while node in parent_map and node not in root_cache:
+                if node in visited:
+                    # 数据成环，无法确定根评论
+                    return None
+                visited.add(node)
+                path.append(node)
+                node = parent_map[node]
+            root = root_cache.get(node, node)
+            for item in path:
+                root_cache[item] = root
+            return root
+
+        fixed_count = 0
+        to_fix = []
+        for comment_id, parent_id in parent_map.items():
+            root_id = resolve_root(comment_id)
+            if root_id is None or root_id not in root_ids or root_id == parent_id:
+                continue
+            to_fix.append(Comment(id=comment_id, parent_id=root_id))
+            fixed_count += 1
+            self.stdout.write(
+                f'  修正: 评论 {comment_id} 的 parent '
+                f'从 {parent_id} -> {root_id}'
+            )
+            if len(to_fix) >= UPDATE_BATCH_SIZE:
+                Comment.all_objects.bulk_update(to_fix, ['parent_id'], batch_size=UPDATE_BATCH_SIZE)
+                to_fix.clear()
+
+        if to_fix:
+            Comment.all_objects.bulk_update(to_fix, ['parent_id'], batch_size=UPDATE_BATCH_SIZE)
+        return fixed_count
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+"""将评论、收藏、上传、下载记录中的 target_id 规范为无连字符的 32 位十六进制
+
+target_id 由 CharField(max_length=36) 改为 UUIDField。PostgreSQL 使用原生 uuid 类型，
+迁移时通过 USING target_id::uuid 原地转换，无需处理；MySQL / SQLite 等数据库中
+UUIDField 存为不带连字符的 char(32)，已有的 36 位带连字符数据在严格模式下无法迁移，
+即使保留下来也无法与 ORM 的查询值匹配。
+
+迁移由部署时自动生成，因此以管理命令形式提供，需在 migrate 之前执行；可重复执行。
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from mainotebook.content.models import Comment, DownloadRecord, StarRecord, UploadRecord
+
+
+# 需要规范 target_id 的模型
+TARGET_ID_MODELS = (Comment, StarRecord, UploadRecord, DownloadRecord)
+
+
+class Command(BaseCommand):
+    help = '在 migrate 之前将 target_id 去掉连字符（PostgreSQL 无需执行）'
+
+    def handle(self, *args, **options):
+        if connection.vendor == 'postgresql':
+            self.stdout.write('PostgreSQL 迁移时原地转换为 uuid 类型，无需处理')
+            return
+
+        quote_name = connection.ops.quote_name
+        existing_tables = set(connection.introspection.table_names())
+        with transaction.atomic(), connection.cursor() as cursor:
+            for model in TARGET_ID_MODELS:
+                table = model._meta.db_table
+                if table not in existing_tables:
+                    continue
+                column = quote_name(model._meta.get_field('target_id').column)
+                cursor.execute(
+                    f"UPDATE {quote_name(table)} SET {column} = REPLACE({column}, '-', '') "
+                    f"WHERE {column} LIKE %s",
+                    ['%-%'],
+                )
+                self.stdout.write(f'  {table}: {cursor.rowcount} 条')
+
+        self.stdout.write(self.style.SUCCESS('target_id 规范完成'))
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+"""回填审核报告的预渲染可读文本
+
+readable_text 字段新增前生成的报告没有预渲染文本（读取时会现场渲染），执行本命令一次性补齐。
+"""
+
+from django.core.management.base import BaseCommand
+
+from mainotebook.content.models import ReviewReport, READABLE_TEXT_SOURCE_FIELDS
+
+
+# 读取与批量写回的批大小
+FETCH_CHUNK_SIZE = 1000
+UPDATE_BATCH_SIZE = 500
+
+
+class Command(BaseCommand):
+    help = '回填审核报告的预渲染可读文本'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='重新渲染全部报告（默认只处理缺少可读文本的报告）'
+        )
+
+    def handle(self, *args, **options):
+        # 批处理不依赖顺序，清除模型默认排序
+        queryset = ReviewReport.all_objects.order_by().only('id', *READABLE_TEXT_SOURCE_FIELDS)
+        if not options['all']:
+            queryset = queryset.filter(readable_text__isnull=True)
+
+        updated_count = 0
+        batch = []
+        for report in queryset.iterator(chunk_size=FETCH_CHUNK_SIZE):
+            report.readable_text = report._render_readable_text()
+            batch.append(report)
+            if len(batch) >= UPDATE_BATCH_SIZE:
+                ReviewReport.all_objects.bulk_update(batch, ['readable_text'])
+                updated_count += len(batch)
+                batch.clear()
+
+        if batch:
+            ReviewReport.all_objects.bulk_update(batch, ['readable_text'])
+            updated_count += len(batch)
+
+        self.stdout.write(self.style.SUCCESS(f'完成，共回填 {updated_count} 份审核报告'))
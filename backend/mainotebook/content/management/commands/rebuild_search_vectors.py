@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+
+"""重建知识库与人设卡的全文检索向量
+
+新增 search_vector 字段后的存量数据回填，或修改 CONTENT_FULLTEXT_SEARCH_CONFIG 后执行。
+"""
+
+from django.core.management.base import BaseCommand
+
+from mainotebook.content.models import KnowledgeBase, PersonaCard, IS_POSTGRESQL, build_search_vector
+
+
+class Command(BaseCommand):
+    help = '重建知识库与人设卡的全文检索向量（仅 PostgreSQL）'
+
+    def handle(self, *args, **options):
+        if not IS_POSTGRESQL:
+            self.stdout.write(self.style.WARNING('当前数据库不是 PostgreSQL，无需重建'))
+            return
+
+        for model in (KnowledgeBase, PersonaCard):
+            # 单条 UPDATE 在数据库内计算向量，不经过 Python
+            count = model.all_objects.update(search_vector=build_search_vector())
+            self.stdout.write(f'  {model._meta.verbose_name}: 已重建 {count} 条')
+
+        self.stdout.write(self.style.SUCCESS('全文检索向量重建完成'))
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+"""将大文本 / JSON 列的 TOAST 压缩算法切换为 LZ4
+
+审核日志原始输出、审核报告等列体积大且重复度高，LZ4 的解压速度明显快于默认的 PGLZ。
+需要 PostgreSQL 14+ 且服务端编译了 LZ4 支持。SET COMPRESSION 只影响之后写入的数据，
+存量数据在被更新时才会以新算法重新压缩。
+
+迁移由部署时自动生成，因此以管理命令形式提供，可在 migrate 之后重复执行。
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from mainotebook.content.models import (
+    IS_POSTGRESQL, KnowledgeBase, ModerationLog, PersonaCard, ReviewReport,
+)
+
+
+# 需要切换压缩算法的 (模型, 字段名)
+LZ4_COLUMNS = (
+    (ModerationLog, 'input_text'),
+    (ModerationLog, 'raw_output'),
+    (ModerationLog, 'error_message'),
+    (ReviewReport, 'report_data'),
+    (ReviewReport, 'readable_text'),
+    (KnowledgeBase, 'description'),
+    (KnowledgeBase, 'content'),
+    (PersonaCard, 'description'),
+    (PersonaCard, 'content'),
+)
+
+# PostgreSQL 14 起支持列级压缩算法
+MIN_SERVER_VERSION = 140000
+
+
+class Command(BaseCommand):
+    help = '将大文本 / JSON 列的 TOAST 压缩算法切换为 LZ4（仅 PostgreSQL 14+）'
+
+    def handle(self, *args, **options):
+        if not IS_POSTGRESQL:
+            self.stdout.write(self.style.WARNING('当前数据库不是 PostgreSQL，无需设置'))
+            return
+        if connection.pg_version < MIN_SERVER_VERSION:
+            self.stdout.write(self.style.WARNING('PostgreSQL 版本低于 14，不支持列级压缩算法'))
+            return
+
+        quote_name = connection.ops.quote_name
+        with connection.cursor() as cursor:
+            for model, field_name in LZ4_COLUMNS:
+                table = model._meta.db_table
+                column = model._meta.get_field(field_name).column
+                cursor.execute(
+                    f'ALTER TABLE {quote_name(table)} '
+                    f'ALTER COLUMN {quote_name(column)} SET COMPRESSION lz4'
+                )
+                self.stdout.write(f'  {table}.{column}: lz4')
+
+        self.stdout.write(self.style.SUCCESS('TOAST 压缩算法设置完成'))
@@ -4,12 +4,228 @@ Content 应用数据模型
 包含从 FastAPI 项目迁移过来的所有内容相关模型。
 """
 
-import uuid
+import io
+import operator
+from django.conf import settings
+from django.contrib.postgres.indexes import BrinIndex, GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
-from mainotebook.utils.models import CoreModel, table_prefix
+from django.db.models import Count, Exists, F, OuterRef, Subquery
+from django.db.models.functions import Cast, Coalesce, Greatest, Upper
+from mainotebook.utils.models import (
+    CoreModel, CoreModelManager, OrjsonJSONField, SortedSetJSONField, table_prefix,
+)
+from mainotebook.utils.record_buffer import BufferedRecordWriter
+from mainotebook.utils.uuid7 import uuid7
 from mainotebook.system.models import Users
 
 
+IS_POSTGRESQL = 'postgresql' in settings.DATABASES['default']['ENGINE']
+
+
+def trigram_upper_indexes(prefix, *field_names):
+    """为 icontains 模糊搜索生成 UPPER(col::text) 上的 GIN 三元组索引
+
+    PostgreSQL 下 icontains 编译为 UPPER("col"::text) LIKE UPPER('%x%')，
+    表达式索引与之完全一致时即可走索引；依赖 pg_trgm 扩展，其他数据库返回空列表。
+
+    Args:
+        prefix: 索引名前缀
+        field_names: 需要建立索引的字段名
+    """
+    if not IS_POSTGRESQL:
+        return []
+    return [
+        GinIndex(
+            OpClass(Upper(Cast(field_name, output_field=models.TextField())), name='gin_trgm_ops'),
+            name=f'{prefix}_{field_name}_trgm',
+        )
+        for field_name in field_names
+    ]
+
+
+def jsonb_contains_indexes(prefix, *field_names):
+    """为 JSONField 的 contains（@>）查询生成 jsonb_path_ops GIN 索引，仅 PostgreSQL
+
+    Args:
+        prefix: 索引名前缀
+        field_names: 需要建立索引的字段名
+    """
+    if not IS_POSTGRESQL:
+        return []
+    return [
+        GinIndex(fields=[field_name], opclasses=['jsonb_path_ops'], name=f'{prefix}_{field_name}_path_gin')
+        for field_name in field_names
+    ]
+
+
+class ConcatText(models.Func):
+    """以 || 拼接文本
+
+    PostgreSQL 的 CONCAT() 不是 IMMUTABLE 函数，不能用于索引表达式，这里改用 || 运算符。
+    """
+    arg_joiner = ' || '
+    template = '(%(expressions)s)'
+    output_field = models.TextField()
+
+
+def search_text_expression():
+    """综合搜索匹配的文本表达式：名称与描述以换行拼接"""
+    return ConcatText(
+        Cast('name', output_field=models.TextField()),
+        models.Value('\n'),
+        Cast('description', output_field=models.TextField()),
+    )
+
+
+def search_text_indexes(prefix):
+    """综合搜索拼接文本上的 GIN 三元组索引，与 icontains 生成的 UPPER(...) 表达式一致，仅 PostgreSQL"""
+    if not IS_POSTGRESQL:
+        return []
+    return [
+        GinIndex(
+            OpClass(Upper(search_text_expression()), name='gin_trgm_ops'),
+            name=f'{prefix}_search_text_trgm',
+        )
+    ]
+
+
+def get_search_config():
+    """全文检索使用的 PostgreSQL 文本检索配置（构建向量与查询必须一致）"""
+    return getattr(settings, 'CONTENT_FULLTEXT_SEARCH_CONFIG', 'simple')
+
+
+def build_search_vector():
+    """构建知识库/人设卡的全文检索向量表达式（名称 > 描述 > 标签）"""
+    config = get_search_config()
+    return (
+        SearchVector('name', weight='A', config=config)
+        + SearchVector('description', weight='B', config=config)
+        + SearchVector('tags', weight='C', config=config)
+    )
+
+
+def search_vector_indexes(prefix):
+    """search_vector 字段上的 GIN 索引，仅 PostgreSQL"""
+    if not IS_POSTGRESQL:
+        return []
+    return [GinIndex(fields=['search_vector'], name=f'{prefix}_search_vector_gin')]
+
+
+def append_only_time_index(prefix, field_name='create_datetime'):
+    """只追加表上随插入顺序递增的时间字段索引
+
+    PostgreSQL 下使用 BRIN 索引（每 128 个数据页一条摘要），体积远小于 B-tree，
+    范围查询同样高效，但不能用于 ORDER BY ... LIMIT；其他数据库回退为普通索引。
+
+    Args:
+        prefix: 索引名前缀
+        field_name: 时间字段名
+    """
+    if IS_POSTGRESQL:
+        return BrinIndex(fields=[field_name], pages_per_range=128, name=f'{prefix}_{field_name}_brin')
+    return models.Index(fields=[field_name])
+
+
+def increment_counters(model, pk, **deltas):
+    """以单条 UPDATE 原子地增减计数字段
+
+    直接在数据库中计算 col = col + delta，避免读-改-写竞争，且只更新涉及的列；
+    减少时以 0 为下限。不会触发 save 相关信号。
+
+    Args:
+        model: 模型类
+        pk: 记录主键
+        deltas: 字段名 -> 增量
+
+    Returns:
+        int: 受影响的行数
+    """
+    updates = {}
+    for field_name, delta in deltas.items():
+        if not delta:
+            continue
+        expression = F(field_name) + delta
+        updates[field_name] = expression if delta > 0 else Greatest(expression, 0)
+    if not updates:
+        return 0
+    return model.all_objects.filter(pk=pk).update(**updates)
+
+
+# 列表中关联文件需要读取的列（与文件序列化器的输出字段一致）
+LIST_FILE_FIELDS = (
+    'id', 'file_name', 'original_name', 'file_path', 'file_type', 'file_size', 'create_datetime',
+)
+
+
+class ContentQuerySet(models.QuerySet):
+    """知识库 / 人设卡查询集"""
+
+    def list_view(self, owner_only=False):
+        """列表接口使用的查询集：关联加载上传者，并延迟加载列表序列化器不会读取的大字段
+
+        延迟的字段由模型的 LIST_DEFERRED_FIELDS 声明，只应包含列表不访问的字段，
+        否则每行访问时都会额外查询一次。若对结果再使用 only()，需保留外键字段
+        （如 uploader），否则 select_related / prefetch 拼接关联对象时同样会逐行补查。
+
+        OWNER_ONLY_FIELDS 只向创建者返回，其他用户的列表同样延迟加载；
+        列出当前用户自己的内容时传 owner_only=True 以一并加载这些字段。
+
+        Args:
+            owner_only: 查询集中是否只包含当前用户创建的记录
+        """
+        deferred = self.model.LIST_DEFERRED_FIELDS
+        if not owner_only:
+            deferred += self.model.OWNER_ONLY_FIELDS
+        return self.with_uploader().with_files().defer(*deferred)
+
+    def with_uploader(self):
+        """关联加载上传者（序列化器读取 uploader.name / uploader.avatar）"""
+        return self.select_related('uploader')
+
+    def with_viewer_stats(self, user):
+        """以子查询注解列表序列化器需要的统计，整页一次查询完成
+
+        - comment_total：未删除的评论数
+        - viewer_starred：当前用户是否已收藏（仅登录用户）
+
+        Args:
+            user: 当前用户
+        """
+        target_type = self.model.TARGET_TYPE
+        comment_totals = Comment.objects.filter(
+            target_id=OuterRef('pk'),
+            target_type=target_type,
+            is_deleted=False,
+        ).order_by().values('target_id').annotate(total=Count('pk')).values('total')
+        queryset = self.annotate(comment_total=Coalesce(Subquery(comment_totals), 0))
+        if user is not None and user.is_authenticated:
+            queryset = queryset.annotate(viewer_starred=Exists(StarRecord.objects.filter(
+                user=user,
+                target_type=target_type,
+                target_id=OuterRef('pk'),
+            )))
+        return queryset
+
+    def with_files(self):
+        """预取关联文件，只读取文件序列化器输出的列及用于拼接的外键"""
+        relation = self.model._meta.get_field('files')
+        files = relation.related_model.objects.only(relation.field.name, *LIST_FILE_FIELDS)
+        return self.prefetch_related(models.Prefetch('files', queryset=files))
+
+
+class ContentManager(CoreModelManager.from_queryset(ContentQuerySet)):
+    """知识库 / 人设卡管理器（保留 CoreModelManager 的行为，并提供 ContentQuerySet 的方法）"""
+
+
+# to_dict() 输出的字段（按输出顺序），通过 attrgetter 一次取值
+KNOWLEDGE_BASE_DICT_FIELDS = (
+    'id', 'name', 'description', 'uploader_id', 'copyright_owner', 'content', 'tags',
+    'star_count', 'downloads', 'base_path', 'is_public', 'is_pending', 'rejection_reason',
+)
+_knowledge_base_dict_getter = operator.attrgetter(*KNOWLEDGE_BASE_DICT_FIELDS)
+
+
 class KnowledgeBase(CoreModel):
     """知识库模型
     
@@ -19,7 +235,7 @@ class KnowledgeBase(CoreModel):
     
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
         verbose_name="知识库ID",
         help_text="知识库唯一标识"
@@ -37,6 +253,7 @@ class KnowledgeBase(CoreModel):
         to=Users,
         on_delete=models.PROTECT,
         db_constraint=False,
+        db_index=False,  # 由 Meta.indexes 中以该字段开头的复合索引覆盖
         related_name="uploaded_knowledge_bases",
         verbose_name="上传者",
         help_text="上传者"
@@ -91,6 +308,34 @@ class KnowledgeBase(CoreModel):
         verbose_name="拒绝原因",
         help_text="审核拒绝原因"
     )
+
+    if IS_POSTGRESQL:
+        # 全文检索向量（由 post_save 信号维护，存量数据使用 rebuild_search_vectors 命令重建）
+        search_vector = SearchVectorField(
+            null=True,
+            editable=False,
+            help_text="全文检索向量"
+        )
+    
+    # 收藏、评论等记录中的目标类型
+    TARGET_TYPE = 'knowledge'
+    
+    # 列表接口不返回的大字段
+    LIST_DEFERRED_FIELDS = ('base_path', 'search_vector') if IS_POSTGRESQL else ('base_path',)
+    # 仅创建者可见的字段
+    OWNER_ONLY_FIELDS = ('content',)
+    
+    objects = ContentManager()
+    
+    @classmethod
+    def incr_star(cls, pk, delta=1):
+        """原子地增减收藏数"""
+        return increment_counters(cls, pk, star_count=delta)
+    
+    @classmethod
+    def incr_downloads(cls, pk):
+        """原子地增加下载次数"""
+        return increment_counters(cls, pk, downloads=1)
     
     def to_dict(self) -> dict:
         """转换为字典格式
@@ -98,36 +343,48 @@ class KnowledgeBase(CoreModel):
         Returns:
             dict: 包含所有字段的字典
         """
-        return {
-            'id': str(self.id),
-            'name': self.name,
-            'description': self.description,
-            'uploader_id': self.uploader_id,
-            'copyright_owner': self.copyright_owner,
-            'content': self.content,
-            'tags': self.tags,
-            'star_count': self.star_count,
-            'downloads': self.downloads,
-            'base_path': self.base_path,
-            'is_public': self.is_public,
-            'is_pending': self.is_pending,
-            'rejection_reason': self.rejection_reason,
-            'created_at': self.create_datetime.isoformat() if self.create_datetime else None,
-            'updated_at': self.update_datetime.isoformat() if self.update_datetime else None,
-        }
+        data = dict(zip(KNOWLEDGE_BASE_DICT_FIELDS, _knowledge_base_dict_getter(self)))
+        data['id'] = str(data['id'])
+        create_datetime, update_datetime = self.create_datetime, self.update_datetime
+        data['created_at'] = create_datetime.isoformat() if create_datetime else None
+        data['updated_at'] = update_datetime.isoformat() if update_datetime else None
+        return data
     
     class Meta:
         db_table = table_prefix + "content_knowledge_base"
         verbose_name = "知识库"
         verbose_name_plural = verbose_name
         ordering = ("-create_datetime",)
+        # 重新声明 objects 后仍以其作为默认管理器
+        default_manager_name = 'objects'
         indexes = [
-            models.Index(fields=['uploader']),
-            models.Index(fields=['is_public']),
-            models.Index(fields=['is_pending']),
             models.Index(fields=['star_count']),
             models.Index(fields=['create_datetime']),
             models.Index(fields=['update_datetime']),
+            # 用户个人列表：按上传者筛选并按创建时间倒序
+            models.Index(fields=['uploader', '-create_datetime'], name='kb_uploader_time_idx'),
+            # 公开广场：只索引已公开且审核通过的记录，按默认排序和收藏数排序均可直接走索引
+            models.Index(
+                fields=['-create_datetime'],
+                name='kb_public_time_idx',
+                condition=models.Q(is_public=True, is_pending=False),
+            ),
+            models.Index(
+                fields=['-star_count'],
+                name='kb_public_star_idx',
+                condition=models.Q(is_public=True, is_pending=False),
+            ),
+            # 审核队列：只索引待审核记录
+            models.Index(
+                fields=['create_datetime'],
+                name='kb_pending_idx',
+                condition=models.Q(is_pending=True),
+            ),
+            *trigram_upper_indexes('kb', 'name', 'description', 'tags'),
+            # 标签筛选：tags @> '["x"]'
+            *jsonb_contains_indexes('kb', 'tags'),
+            *search_vector_indexes('kb'),
+            *search_text_indexes('kb'),
         ]
     
     def __str__(self) -> str:
@@ -142,7 +399,7 @@ class KnowledgeBaseFile(CoreModel):
     
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
         verbose_name="文件ID",
         help_text="文件唯一标识"
@@ -151,6 +408,7 @@ class KnowledgeBaseFile(CoreModel):
         to=KnowledgeBase,
         on_delete=models.CASCADE,
         db_constraint=False,
+        db_index=False,  # 由 Meta.indexes 中的索引覆盖
         related_name="files",
         verbose_name="关联知识库",
         help_text="关联知识库"
@@ -198,6 +456,14 @@ class KnowledgeBaseFile(CoreModel):
         return f"{self.original_name} ({self.file_type})"
 
 
+PERSONA_CARD_DICT_FIELDS = (
+    'id', 'name', 'description', 'uploader_id', 'copyright_owner', 'content', 'tags',
+    'star_count', 'downloads', 'base_path', 'is_public', 'is_pending', 'is_deleted',
+    'rejection_reason', 'version',
+)
+_persona_card_dict_getter = operator.attrgetter(*PERSONA_CARD_DICT_FIELDS)
+
+
 class PersonaCard(CoreModel):
     """人设卡模型
     
@@ -207,7 +473,7 @@ class PersonaCard(CoreModel):
     
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
         verbose_name="人设卡ID",
         help_text="人设卡唯一标识"
@@ -225,6 +491,7 @@ class PersonaCard(CoreModel):
         to=Users,
         on_delete=models.PROTECT,
         db_constraint=False,
+        db_index=False,  # 由 Meta.indexes 中以该字段开头的复合索引覆盖
         related_name="uploaded_persona_cards",
         verbose_name="上传者",
         help_text="上传者"
@@ -279,6 +546,14 @@ class PersonaCard(CoreModel):
         verbose_name="拒绝原因",
         help_text="审核拒绝原因"
     )
+
+    if IS_POSTGRESQL:
+        # 全文检索向量（由 post_save 信号维护，存量数据使用 rebuild_search_vectors 命令重建）
+        search_vector = SearchVectorField(
+            null=True,
+            editable=False,
+            help_text="全文检索向量"
+        )
     version = models.CharField(
         max_length=50,
         default="1.0",
@@ -291,45 +566,74 @@ class PersonaCard(CoreModel):
         help_text="软删除标记，已删除的人设卡对其他用户不可见"
     )
     
+    # 收藏、评论等记录中的目标类型
+    TARGET_TYPE = 'persona'
+    
+    # 列表接口不返回的大字段
+    LIST_DEFERRED_FIELDS = ('base_path', 'search_vector') if IS_POSTGRESQL else ('base_path',)
+    # 仅创建者可见的字段
+    OWNER_ONLY_FIELDS = ('content',)
+    
+    objects = ContentManager()
+    
+    @classmethod
+    def incr_star(cls, pk, delta=1):
+        """原子地增减收藏数"""
+        return increment_counters(cls, pk, star_count=delta)
+    
+    @classmethod
+    def incr_downloads(cls, pk):
+        """原子地增加下载次数"""
+        return increment_counters(cls, pk, downloads=1)
+    
     def to_dict(self) -> dict:
         """转换为字典格式
         
         Returns:
             dict: 包含所有字段的字典
         """
-        return {
-            'id': str(self.id),
-            'name': self.name,
-            'description': self.description,
-            'uploader_id': self.uploader_id,
-            'copyright_owner': self.copyright_owner,
-            'content': self.content,
-            'tags': self.tags,
-            'star_count': self.star_count,
-            'downloads': self.downloads,
-            'base_path': self.base_path,
-            'is_public': self.is_public,
-            'is_pending': self.is_pending,
-            'is_deleted': self.is_deleted,
-            'rejection_reason': self.rejection_reason,
-            'version': self.version,
-            'created_at': self.create_datetime.isoformat() if self.create_datetime else None,
-            'updated_at': self.update_datetime.isoformat() if self.update_datetime else None,
-        }
+        data = dict(zip(PERSONA_CARD_DICT_FIELDS, _persona_card_dict_getter(self)))
+        data['id'] = str(data['id'])
+        create_datetime, update_datetime = self.create_datetime, self.update_datetime
+        data['created_at'] = create_datetime.isoformat() if create_datetime else None
+        data['updated_at'] = update_datetime.isoformat() if update_datetime else None
+        return data
     
     class Meta:
         db_table = table_prefix + "content_persona_card"
         verbose_name = "人设卡"
         verbose_name_plural = verbose_name
         ordering = ("-create_datetime",)
+        # 重新声明 objects 后仍以其作为默认管理器
+        default_manager_name = 'objects'
         indexes = [
-            models.Index(fields=['uploader']),
-            models.Index(fields=['is_public']),
-            models.Index(fields=['is_pending']),
-            models.Index(fields=['is_deleted']),
             models.Index(fields=['star_count']),
             models.Index(fields=['create_datetime']),
             models.Index(fields=['update_datetime']),
+            # 用户个人列表：按上传者筛选并按创建时间倒序
+            models.Index(fields=['uploader', '-create_datetime'], name='pc_uploader_time_idx'),
+            # 公开广场：只索引已公开、审核通过且未删除的记录
+            models.Index(
+                fields=['-create_datetime'],
+                name='pc_public_time_idx',
+                condition=models.Q(is_public=True, is_pending=False, is_deleted=False),
+            ),
+            models.Index(
+                fields=['-star_count'],
+                name='pc_public_star_idx',
+                condition=models.Q(is_public=True, is_pending=False, is_deleted=False),
+            ),
+            # 审核队列：只索引待审核记录
+            models.Index(
+                fields=['create_datetime'],
+                name='pc_pending_idx',
+                condition=models.Q(is_pending=True),
+            ),
+            *trigram_upper_indexes('pc', 'name', 'description', 'tags'),
+            # 标签筛选：tags @> '["x"]'
+            *jsonb_contains_indexes('pc', 'tags'),
+            *search_vector_indexes('pc'),
+            *search_text_indexes('pc'),
         ]
     
     def __str__(self) -> str:
@@ -344,7 +648,7 @@ class PersonaCardFile(CoreModel):
     
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
         verbose_name="文件ID",
         help_text="文件唯一标识"
@@ -353,6 +657,7 @@ class PersonaCardFile(CoreModel):
         to=PersonaCard,
         on_delete=models.CASCADE,
         db_constraint=False,
+        db_index=False,  # 由 Meta.indexes 中的索引覆盖
         related_name="files",
         verbose_name="关联人设卡",
         help_text="关联人设卡"
@@ -400,6 +705,18 @@ class PersonaCardFile(CoreModel):
         return f"{self.original_name} ({self.file_type})"
 
 
+class CommentQuerySet(models.QuerySet):
+    """评论查询集"""
+
+    def with_related(self):
+        """预加载序列化评论时会访问的外键（评论用户、被回复评论及其用户）"""
+        return self.select_related('user', 'reply_to', 'reply_to__user')
+
+
+class CommentManager(CoreModelManager.from_queryset(CommentQuerySet)):
+    """评论管理器（保留 CoreModelManager 的行为，并提供 CommentQuerySet 的方法）"""
+
+
 class Comment(CoreModel):
     """评论模型
     
@@ -409,7 +726,7 @@ class Comment(CoreModel):
     
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
         verbose_name="评论ID",
         help_text="评论唯一标识"
@@ -422,8 +739,7 @@ class Comment(CoreModel):
         verbose_name="评论用户",
         help_text="评论用户"
     )
-    target_id = models.CharField(
-        max_length=36,
+    target_id = models.UUIDField(
         verbose_name="目标ID",
         help_text="评论目标的 UUID"
     )
@@ -478,7 +794,7 @@ class Comment(CoreModel):
         verbose_name="审核状态",
         help_text="AI 内容审核状态"
     )
-    moderation_detail = models.JSONField(
+    moderation_detail = OrjsonJSONField(
         null=True,
         blank=True,
         verbose_name="审核详情",
@@ -495,16 +811,27 @@ class Comment(CoreModel):
         help_text="点踩数"
     )
     
+    objects = CommentManager()
+    
+    @classmethod
+    def incr_reactions(cls, pk, like=0, dislike=0):
+        """原子地增减点赞 / 点踩数（两列在同一条 UPDATE 中完成）"""
+        return increment_counters(cls, pk, like_count=like, dislike_count=dislike)
+    
     class Meta:
         db_table = table_prefix + "content_comment"
         verbose_name = "评论"
         verbose_name_plural = verbose_name
         ordering = ("-create_datetime",)
+        # 重新声明 objects 后仍以其作为默认管理器（反向关联 comment.replies 也使用它）
+        default_manager_name = 'objects'
         indexes = [
-            models.Index(fields=['target_id', 'target_type']),
-            models.Index(fields=['user']),
-            models.Index(fields=['parent']),
+            # 目标下的评论列表：未删除评论按时间倒序
+            models.Index(fields=['target_id', 'target_type', 'is_deleted', '-create_datetime']),
+            # 回复列表：按父评论筛选并按时间排序
+            models.Index(fields=['parent', '-create_datetime']),
             models.Index(fields=['create_datetime']),
+            *trigram_upper_indexes('comment', 'content'),
         ]
     
     def __str__(self) -> str:
@@ -520,7 +847,7 @@ class CommentReaction(CoreModel):
     
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
         verbose_name="反应ID",
         help_text="反应唯一标识"
@@ -529,6 +856,7 @@ class CommentReaction(CoreModel):
         to=Users,
         on_delete=models.CASCADE,
         db_constraint=False,
+        db_index=False,  # (user, comment) 唯一约束的前缀即可覆盖按用户查询
         related_name="comment_reactions",
         verbose_name="用户",
         help_text="反应用户"
@@ -537,6 +865,7 @@ class CommentReaction(CoreModel):
         to=Comment,
         on_delete=models.CASCADE,
         db_constraint=False,
+        db_index=False,  # 由 Meta.indexes 中的索引覆盖
         related_name="reactions",
         verbose_name="评论",
         help_text="关联评论"
@@ -580,7 +909,7 @@ class StarRecord(CoreModel):
     
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
         verbose_name="收藏ID",
         help_text="收藏记录唯一标识"
@@ -589,12 +918,12 @@ class StarRecord(CoreModel):
         to=Users,
         on_delete=models.CASCADE,
         db_constraint=False,
+        db_index=False,  # 由 Meta.indexes 中以该字段开头的复合索引覆盖
         related_name="star_records",
         verbose_name="用户",
         help_text="收藏用户"
     )
-    target_id = models.CharField(
-        max_length=36,
+    target_id = models.UUIDField(
         verbose_name="目标ID",
         help_text="收藏目标的 UUID"
     )
@@ -614,10 +943,10 @@ class StarRecord(CoreModel):
         verbose_name = "收藏记录"
         verbose_name_plural = verbose_name
         ordering = ("-create_datetime",)
+        # 唯一约束 (user, target_id, target_type) 已覆盖按用户查询的前缀
         indexes = [
-            models.Index(fields=['user']),
-            models.Index(fields=['target_id']),
-            models.Index(fields=['target_type']),
+            models.Index(fields=['target_id', 'target_type', '-create_datetime']),
+            models.Index(fields=['user', 'target_type', '-create_datetime']),
             models.Index(fields=['create_datetime']),
         ]
         constraints = [
@@ -640,7 +969,7 @@ class EmailVerification(CoreModel):
     
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
         verbose_name="验证ID",
         help_text="验证记录唯一标识"
@@ -671,8 +1000,14 @@ class EmailVerification(CoreModel):
         verbose_name_plural = verbose_name
         ordering = ("-create_datetime",)
         indexes = [
-            models.Index(fields=['email']),
-            models.Index(fields=['code']),
+            # 查找邮箱最新的未使用验证码：只索引未使用的记录
+            models.Index(
+                fields=['email', '-create_datetime'],
+                name='emailver_active_idx',
+                condition=models.Q(is_used=False),
+            ),
+            # 过期清理：按过期时间范围删除（清理会删除行、is_used 更新会移动行，
+            # 物理顺序不随 expires_at 递增，因此使用 B-tree 而不是 BRIN）
             models.Index(fields=['expires_at']),
         ]
     
@@ -689,7 +1024,7 @@ class UploadRecord(CoreModel):
     
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
         verbose_name="上传记录ID",
         help_text="上传记录唯一标识"
@@ -698,12 +1033,12 @@ class UploadRecord(CoreModel):
         to=Users,
         on_delete=models.PROTECT,
         db_constraint=False,
+        db_index=False,  # 由 Meta.indexes 中以该字段开头的复合索引覆盖
         related_name="upload_records",
         verbose_name="上传者",
         help_text="上传者"
     )
-    target_id = models.CharField(
-        max_length=36,
+    target_id = models.UUIDField(
         verbose_name="目标ID",
         help_text="上传目标的 UUID"
     )
@@ -747,10 +1082,12 @@ class UploadRecord(CoreModel):
         verbose_name_plural = verbose_name
         ordering = ("-create_datetime",)
         indexes = [
-            models.Index(fields=['uploader']),
-            models.Index(fields=['target_id']),
-            models.Index(fields=['target_type']),
-            models.Index(fields=['status']),
+            models.Index(fields=['uploader', 'status', '-create_datetime']),
+            models.Index(fields=['target_type', 'status', '-create_datetime']),
+            # 审核流程按目标同步上传记录状态
+            models.Index(fields=['target_id', 'target_type']),
+            # 审核统计：按状态筛选并按处理时间范围计数
+            models.Index(fields=['status', 'update_datetime']),
             models.Index(fields=['create_datetime']),
         ]
     
@@ -766,13 +1103,12 @@ class DownloadRecord(CoreModel):
     
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
         verbose_name="下载记录ID",
         help_text="下载记录唯一标识"
     )
-    target_id = models.CharField(
-        max_length=36,
+    target_id = models.UUIDField(
         verbose_name="目标ID",
         help_text="下载目标的 UUID"
     )
@@ -793,15 +1129,53 @@ class DownloadRecord(CoreModel):
         verbose_name_plural = verbose_name
         ordering = ("-create_datetime",)
         indexes = [
-            models.Index(fields=['target_id']),
-            models.Index(fields=['target_type']),
-            models.Index(fields=['create_datetime']),
+            # 按目标统计下载记录
+            models.Index(fields=['target_id', 'target_type']),
+            append_only_time_index('download'),
         ]
     
     def __str__(self) -> str:
         return f"下载 {self.get_target_type_display()} {self.target_id}"
 
 
+# 下载记录写入器（开启 AUDIT_RECORD_BUFFER 时批量写入）
+download_record_writer = BufferedRecordWriter(DownloadRecord)
+
+
+# 审核报告可读文本：决策结果与违规类型的中文描述
+REVIEW_DECISION_LABELS = {
+    'pending_ai': '⏳ AI 审核中',
+    'auto_approved': '✅ 自动通过',
+    'auto_rejected': '❌ 自动拒绝',
+    'pending_manual': '⏳ 待人工复核',
+    'error': '⚠️ 审核异常',
+    'processing': '🔄 审核中',
+}
+VIOLATION_TYPE_LABELS = {
+    'porn': '色情',
+    'politics': '涉政',
+    'abuse': '辱骂',
+    'violence': '暴力',
+    'spam': '垃圾信息',
+    'illegal': '违法',
+}
+# 报告分隔线
+REPORT_RULE = '=' * 40
+REPORT_SECTION_RULE = '─' * 40
+# 影响可读文本的字段，按 update_fields 保存时只有涉及这些字段才重新渲染
+READABLE_TEXT_SOURCE_FIELDS = frozenset(
+    ('content_name', 'content_type', 'decision', 'final_confidence', 'violation_types', 'report_data')
+)
+
+
+def _violation_labels(violation_types):
+    """将违规类型列表转换为中文描述，空列表返回'无'"""
+    if not violation_types:
+        return '无'
+    # map 的双参数形式在 C 层调用 dict.get(v, v)，未知类型原样输出
+    return ', '.join(map(VIOLATION_TYPE_LABELS.get, violation_types, violation_types))
+
+
 class ReviewReport(CoreModel):
     """AI 审核报告模型
 
@@ -825,7 +1199,7 @@ class ReviewReport(CoreModel):
 
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
         verbose_name="报告ID",
         help_text="审核报告唯一标识"
@@ -851,14 +1225,21 @@ class ReviewReport(CoreModel):
     final_confidence = models.FloatField(
         verbose_name="最终置信度"
     )
-    violation_types = models.JSONField(
+    violation_types = SortedSetJSONField(
         default=list,
         verbose_name="违规类型汇总"
     )
-    report_data = models.JSONField(
+    report_data = OrjsonJSONField(
         verbose_name="报告详细数据",
         help_text="包含各审核部分的详细结果，JSON 格式"
     )
+    readable_text = models.TextField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name="可读文本",
+        help_text="保存时预渲染的报告文本，用于站内信展示"
+    )
 
     class Meta:
         db_table = table_prefix + "content_review_report"
@@ -866,9 +1247,10 @@ class ReviewReport(CoreModel):
         verbose_name_plural = verbose_name
         ordering = ("-create_datetime",)
         indexes = [
-            models.Index(fields=['content_id']),
+            models.Index(fields=['content_id', 'content_type']),
             models.Index(fields=['content_type']),
-            models.Index(fields=['decision']),
+            models.Index(fields=['decision', '-create_datetime']),
+            # rebuild_report_text 会批量更新已有报告并移动行，物理顺序不稳定，保持 B-tree
             models.Index(fields=['create_datetime']),
         ]
 
@@ -876,85 +1258,78 @@ class ReviewReport(CoreModel):
         """返回审核报告的字符串表示"""
         return f"[{self.get_decision_display()}] {self.content_name} ({self.get_content_type_display()})"
 
+    def save(self, *args, **kwargs):
+        """保存时重新渲染可读文本，站内信展示时直接读取"""
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None:
+            self.readable_text = self._render_readable_text()
+        elif READABLE_TEXT_SOURCE_FIELDS.intersection(update_fields):
+            self.readable_text = self._render_readable_text()
+            kwargs['update_fields'] = {*update_fields, 'readable_text'}
+        super().save(*args, **kwargs)
+
     def to_readable_text(self) -> str:
         """将审核报告渲染为可读文本格式，用于站内信展示
 
+        优先返回保存时预渲染的文本。
+
         Returns:
             str: 格式化的审核报告文本
         """
-        # 决策结果映射为中文描述
-        decision_map = {
-            'pending_ai': '⏳ AI 审核中',
-            'auto_approved': '✅ 自动通过',
-            'auto_rejected': '❌ 自动拒绝',
-            'pending_manual': '⏳ 待人工复核',
-            'error': '⚠️ 审核异常',
-            'processing': '🔄 审核中',  # 新增映射
-        }
-        decision_text = decision_map.get(self.decision, self.decision)
-
-        lines = [
-            f"📋 AI 审核报告",
-            f"{'=' * 40}",
-            f"内容名称：{self.content_name}",
-            f"内容类型：{self.get_content_type_display()}",
-            f"审核决策：{decision_text}",
-            f"最终置信度：{self.final_confidence:.2f}",
-        ]
-
-        # 违规类型
-        if self.violation_types:
-            violation_map = {
-                'porn': '色情',
-                'politics': '涉政',
-                'abuse': '辱骂',
-                'violence': '暴力',
-                'spam': '垃圾信息',
-                'illegal': '违法',
-            }
-            violation_labels = [violation_map.get(v, v) for v in self.violation_types]
-            lines.append(f"违规类型：{', '.join(violation_labels)}")
-        else:
-            lines.append("违规类型：无")
+        return self.readable_text or self._render_readable_text()
+
+    def _render_readable_text(self) -> str:
+        """按当前字段渲染审核报告文本"""
+        decision_text = REVIEW_DECISION_LABELS.get(self.decision, self.decision)
+        violation_text = _violation_labels(self.violation_types)
+
+        out = io.StringIO()
+        write = out.write
+        write(
+            f"📋 AI 审核报告\n"
+            f"{REPORT_RULE}\n"
+            f"内容名称：{self.content_name}\n"
+            f"内容类型：{self.get_content_type_display()}\n"
+            f"审核决策：{decision_text}\n"
+            f"最终置信度：{self.final_confidence:.2f}\n"
+            f"违规类型：{violation_text}\n"
+        )
 
         # 各审核部分详情
         parts = self.report_data.get('parts', []) if isinstance(self.report_data, dict) else []
         if parts:
-            lines.append(f"\n{'─' * 40}")
-            lines.append("📝 审核详情")
+            write(f"\n{REPORT_SECTION_RULE}\n📝 审核详情\n")
             for part in parts:
-                part_name = part.get('part_name', '未知')
-                part_confidence = part.get('confidence', 0)
-                part_violations = part.get('violation_types', [])
-                violation_labels = [violation_map.get(v, v) for v in part_violations] if part_violations else ['无']
-                lines.append(f"\n  ▸ {part_name}")
-                lines.append(f"    置信度：{part_confidence:.2f}")
-                lines.append(f"    违规类型：{', '.join(violation_labels)}")
+                write(
+                    f"\n  ▸ {part.get('part_name', '未知')}\n"
+                    f"    置信度：{part.get('confidence', 0):.2f}\n"
+                    f"    违规类型：{_violation_labels(part.get('violation_types'))}\n"
+                )
 
                 # 违规片段
                 flagged = part.get('flagged_content', '')
                 if flagged:
-                    lines.append(f"    违规片段：{flagged}")
+                    write(f"    违规片段：{flagged}\n")
 
                 # 分段详情
                 segments = part.get('segments', [])
                 if segments:
-                    lines.append(f"    分段审核：")
+                    write("    分段审核：\n")
                     for seg in segments:
-                        seg_index = seg.get('segment_index', '?')
+                        write(
+                            f"      第 {seg.get('segment_index', '?')} 段："
+                            f"置信度 {seg.get('confidence', 0):.2f}，"
+                            f"违规类型：{_violation_labels(seg.get('violation_types'))}\n"
+                        )
                         seg_summary = seg.get('text_summary', '')
-                        seg_confidence = seg.get('confidence', 0)
-                        seg_violations = seg.get('violation_types', [])
-                        seg_violation_labels = [violation_map.get(v, v) for v in seg_violations] if seg_violations else ['无']
-                        lines.append(f"      第 {seg_index} 段：置信度 {seg_confidence:.2f}，违规类型：{', '.join(seg_violation_labels)}")
                         if seg_summary:
-                            lines.append(f"        摘要：{seg_summary}")
+                            write(f"        摘要：{seg_summary}\n")
                         seg_flagged = seg.get('flagged_content', '')
                         if seg_flagged:
-                            lines.append(f"        违规片段：{seg_flagged}")
+                            write(f"        违规片段：{seg_flagged}\n")
 
-        lines.append(f"\n{'=' * 40}")
-        return "\n".join(lines)
+        write(f"\n{REPORT_RULE}")
+        return out.getvalue()
 
 
 class AIModel(CoreModel):
@@ -1138,7 +1513,7 @@ class ModerationLog(CoreModel):
         verbose_name="置信度",
         help_text="AI 返回的违规置信度（0~1）"
     )
-    violation_types = models.JSONField(
+    violation_types = SortedSetJSONField(
         default=list,
         verbose_name="违规类型",
         help_text="AI 检测到的违规类型列表，如 ['porn', 'abuse']"
@@ -1177,8 +1552,12 @@ class ModerationLog(CoreModel):
             models.Index(fields=['source']),
             models.Index(fields=['decision']),
             models.Index(fields=['model_name']),
-            models.Index(fields=['user']),
-            models.Index(fields=['is_success']),
+            # 失败记录只占少数，仅索引 is_success=False 的行
+            models.Index(
+                fields=['-create_datetime'],
+                name='modlog_failed_idx',
+                condition=models.Q(is_success=False),
+            ),
             models.Index(fields=['create_datetime']),
             models.Index(fields=['content_id']),
         ]
@@ -1187,6 +1566,11 @@ class ModerationLog(CoreModel):
         return f"[{self.get_source_display()}] {self.get_decision_display()} - {self.input_text[:30]}"
 
 
+# 已完成审核的日志写入器（开启 AUDIT_RECORD_BUFFER 时批量写入）；
+# 需要先创建再回写结果的"请求中"日志仍直接 create
+moderation_log_writer = BufferedRecordWriter(ModerationLog)
+
+
 class TagStatistics(CoreModel):
     """标签统计模型
     
@@ -1277,7 +1661,7 @@ class PersonaCardConfig(CoreModel):
     
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
         verbose_name="配置项ID",
         help_text="配置项唯一标识"
@@ -1287,6 +1671,7 @@ class PersonaCardConfig(CoreModel):
         to=PersonaCard,
         on_delete=models.CASCADE,
         db_constraint=False,
+        db_index=False,  # 由唯一约束 (persona_card, section_name, key_name) 覆盖
         related_name="configs",
         verbose_name="关联人设卡",
         help_text="关联人设卡"
@@ -1354,10 +1739,9 @@ class PersonaCardConfig(CoreModel):
         verbose_name_plural = verbose_name
         ordering = ("section_order", "item_order", "section_name", "key_name")
         unique_together = [("persona_card", "section_name", "key_name")]
+        # 唯一约束 (persona_card, section_name, key_name) 已覆盖按人设卡查询的前缀
         indexes = [
-            models.Index(fields=['persona_card']),
             models.Index(fields=['section_name']),
-            models.Index(fields=['is_deleted']),
             models.Index(fields=['create_datetime']),
             models.Index(fields=['update_datetime']),
         ]
@@ -1376,7 +1760,7 @@ class SensitiveInfoConfirmation(CoreModel):
     
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
         verbose_name="确认记录ID",
         help_text="确认记录唯一标识"
@@ -1427,8 +1811,6 @@ class SensitiveInfoConfirmation(CoreModel):
         verbose_name_plural = verbose_name
         ordering = ("-confirmed_at",)
         indexes = [
-            models.Index(fields=['persona_card']),
-            models.Index(fields=['user']),
             models.Index(fields=['confirmed_at']),
         ]
     
@@ -1447,6 +1829,7 @@ class CommentRejectionLog(CoreModel):
         to=Users,
         on_delete=models.PROTECT,
         db_constraint=False,
+        db_index=False,  # 由 Meta.indexes 中以该字段开头的复合索引覆盖
         related_name='comment_rejection_logs',
         verbose_name="用户",
         help_text="被拒绝评论的用户"
@@ -1462,13 +1845,13 @@ class CommentRejectionLog(CoreModel):
         help_text="AI审核拒绝的原因"
     )
     
-    violation_types = models.JSONField(
+    violation_types = SortedSetJSONField(
         default=list,
         verbose_name="违规类型",
         help_text="违规类型列表，如['spam', 'offensive']"
     )
     
-    moderation_detail = models.JSONField(
+    moderation_detail = OrjsonJSONField(
         default=dict,
         verbose_name="审核详情",
         help_text="AI审核的详细信息"
@@ -1510,7 +1893,6 @@ class CommentRejectionLog(CoreModel):
         ordering = ["-create_datetime"]
         indexes = [
             models.Index(fields=['user', 'create_datetime']),
-            models.Index(fields=['is_counted']),
         ]
     
     def __str__(self) -> str:
@@ -1532,6 +1914,7 @@ class UserMuteRecord(CoreModel):
         to=Users,
         on_delete=models.PROTECT,
         db_constraint=False,
+        db_index=False,  # 由 Meta.indexes 中以该字段开头的复合索引覆盖
         related_name='user_mute_records',
         verbose_name="用户",
         help_text="被禁言的用户"
@@ -1645,6 +2028,7 @@ class UserModerationLog(CoreModel):
         to=Users,
         on_delete=models.PROTECT,
         db_constraint=False,
+        db_index=False,  # 由 Meta.indexes 中以该字段开头的复合索引覆盖
         related_name='moderation_operations',
         verbose_name="操作人",
         help_text="执行操作的管理员"
@@ -1654,6 +2038,7 @@ class UserModerationLog(CoreModel):
         to=Users,
         on_delete=models.PROTECT,
         db_constraint=False,
+        db_index=False,  # 由 Meta.indexes 中以该字段开头的复合索引覆盖
         related_name='moderation_records',
         verbose_name="目标用户",
         help_text="被操作的用户"
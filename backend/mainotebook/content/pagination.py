@@ -9,6 +9,8 @@
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 
+from mainotebook.utils.pagination import CachedCountPaginator
+
 
 class StandardResultsSetPagination(PageNumberPagination):
     """标准分页配置
@@ -40,6 +42,9 @@ class StandardResultsSetPagination(PageNumberPagination):
     # 最大每页数量
     max_page_size = 100
     
+    # 总数可按 PAGINATION_COUNT_CACHE_TIMEOUT 短时缓存
+    django_paginator_class = CachedCountPaginator
+    
     def get_paginated_response(self, data):
         """返回分页响应
         
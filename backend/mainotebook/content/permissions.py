@@ -5,7 +5,8 @@
 """
 
 from rest_framework import permissions
-from django.utils import timezone
+
+from mainotebook.system.models import Users
 
 
 class IsOwnerOrReadOnly(permissions.BasePermission):
@@ -31,12 +32,9 @@ class IsOwnerOrReadOnly(permissions.BasePermission):
             return True
         
         # 写入权限仅允许创建者
-        # 检查对象是否有 uploader 属性
-        if hasattr(obj, 'uploader'):
-            return obj.uploader == request.user
-        
-        # 如果对象没有 uploader 属性，拒绝访问
-        return False
+        # 比较外键列 uploader_id，不加载关联的用户对象；没有 uploader 的对象拒绝访问
+        uploader_id = getattr(obj, 'uploader_id', None)
+        return uploader_id is not None and uploader_id == request.user.id
 
 
 class IsModeratorOrAdmin(permissions.BasePermission):
@@ -55,16 +53,8 @@ class IsModeratorOrAdmin(permissions.BasePermission):
         Returns:
             bool: 是否有权限访问
         """
-        # 检查用户是否已认证
-        if not request.user or not request.user.is_authenticated:
-            return False
-        
-        # 检查用户是否为审核员、管理员或超级管理员
-        return (
-            getattr(request.user, 'is_moderator', False) or
-            getattr(request.user, 'is_staff', False) or
-            getattr(request.user, 'is_superuser', False)
-        )
+        # 匿名用户没有 role_level，按普通用户处理
+        return getattr(request.user, 'role_level', Users.ROLE_USER) >= Users.ROLE_MODERATOR
 
 
 class IsAdminUser(permissions.BasePermission):
@@ -84,15 +74,8 @@ class IsAdminUser(permissions.BasePermission):
         Returns:
             bool: 是否有权限访问
         """
-        # 检查用户是否已认证
-        if not request.user or not request.user.is_authenticated:
-            return False
-        
-        # 检查用户是否为管理员或超级管理员
-        return (
-            getattr(request.user, 'is_staff', False) or
-            getattr(request.user, 'is_superuser', False)
-        )
+        # 匿名用户没有 role_level，按普通用户处理
+        return getattr(request.user, 'role_level', Users.ROLE_USER) >= Users.ROLE_STAFF
 
 
 class CanComment(permissions.BasePermission):
@@ -119,29 +102,24 @@ class CanComment(permissions.BasePermission):
             self.message = '请先登录'
             return False
         
-        # 检查用户是否被禁言
-        if getattr(request.user, 'is_muted', False):
-            # 如果设置了禁言截止时间，检查是否已过期
-            muted_until = getattr(request.user, 'muted_until', None)
-            if muted_until:
-                # 如果禁言时间未过期，拒绝访问
-                if muted_until > timezone.now():
-                    # 格式化禁言截止时间
-                    muted_until_str = muted_until.strftime('%Y年%m月%d日 %H:%M')
-                    mute_reason = getattr(request.user, 'mute_reason', '')
-                    if mute_reason:
-                        self.message = f'您已被禁言至 {muted_until_str}，原因：{mute_reason}'
-                    else:
-                        self.message = f'您已被禁言至 {muted_until_str}'
-                    return False
+        # 检查用户是否被禁言（禁言已过期视为未禁言）
+        user = request.user
+        if getattr(user, 'is_currently_muted', False):
+            mute_reason = user.mute_reason
+            if user.muted_until:
+                # 格式化禁言截止时间
+                muted_until_str = user.muted_until.strftime('%Y年%m月%d日 %H:%M')
+                if mute_reason:
+                    self.message = f'您已被禁言至 {muted_until_str}，原因：{mute_reason}'
+                else:
+                    self.message = f'您已被禁言至 {muted_until_str}'
             else:
                 # 如果没有设置截止时间，表示永久禁言
-                mute_reason = getattr(request.user, 'mute_reason', '')
                 if mute_reason:
                     self.message = f'您已被永久禁言，原因：{mute_reason}'
                 else:
                     self.message = '您已被永久禁言'
-                return False
+            return False
         
         return True
 
@@ -8,7 +8,6 @@
 """
 
 from rest_framework import serializers
-from django.utils import timezone
 from mainotebook.utils.serializers import CustomModelSerializer
 from mainotebook.content.models import Comment, CommentReaction
 
@@ -68,19 +67,30 @@ class CommentSerializer(CustomModelSerializer):
         Returns:
             list: 回复列表（嵌套结构）
         """
-        # 如果已经预取了回复，使用预取的数据
+        # 如果已经预取了回复，使用预取的数据（列表接口由服务层通过 Prefetch 一次加载）
         if hasattr(obj, '_prefetched_replies'):
             replies = obj._prefetched_replies
         else:
-            # 否则查询数据库
-            replies = obj.replies.filter(is_deleted=False).select_related('user')
+            # 单条评论序列化时才查询数据库（二级回复没有下一层，标记后不再递归查询）
+            from mainotebook.content.services.comment_service import CommentService
+            replies = list(obj.replies.filter(is_deleted=False).with_related())
+            CommentService.mark_leaf_replies(replies)
         
-        # 递归序列化回复
-        return CommentSerializer(
-            replies, 
-            many=True, 
-            context=self.context
-        ).data
+        # 递归序列化回复（同一层级复用一个列表序列化器，避免逐条评论重新绑定字段）
+        return self._get_replies_serializer().to_representation(replies)
+    
+    def _get_replies_serializer(self):
+        """获取（并缓存）用于序列化下一层回复的列表序列化器
+        
+        many=True 时所有行共享同一个子序列化器实例，因此每个嵌套层级只构造一次。
+        
+        Returns:
+            ListSerializer: 回复列表序列化器
+        """
+        serializer = getattr(self, '_replies_serializer', None)
+        if serializer is None:
+            serializer = self._replies_serializer = CommentSerializer(many=True, context=self.context)
+        return serializer
     
     def get_user_avatar(self, obj):
         """获取用户头像 URL（如果为空则返回默认头像 URL）
@@ -126,18 +136,25 @@ class CommentSerializer(CustomModelSerializer):
         Returns:
             bool: 是否已点赞
         """
-        request = self.context.get('request')
-        if request and request.user.is_authenticated:
-            return CommentReaction.objects.filter(
-                user=request.user,
-                comment=obj,
-                reaction_type='like'
-            ).exists()
-        return False
+        return self._get_reaction_type(obj) == 'like'
     
     def get_my_reaction(self, obj):
         """获取当前用户对该评论的反应类型
         
+        Args:
+            obj: Comment 实例
+            
+        Returns:
+            str or None: 反应类型（'like'、'dislike'）或 None
+        """
+        return self._get_reaction_type(obj)
+    
+    def _get_reaction_type(self, obj):
+        """获取当前用户对该评论的反应类型
+        
+        优先读取视图通过 CommentService.get_user_reactions 放入 context 的
+        my_reactions 字典；未覆盖该评论时才单独查询。
+        
         Args:
             obj: Comment 实例
             
@@ -145,14 +162,15 @@ class CommentSerializer(CustomModelSerializer):
             str or None: 反应类型（'like'、'dislike'）或 None
         """
         request = self.context.get('request')
-        if request and request.user.is_authenticated:
-            reaction = CommentReaction.objects.filter(
-                user=request.user,
-                comment=obj
-            ).first()
-            if reaction:
-                return reaction.reaction_type
-        return None
+        if not (request and request.user.is_authenticated):
+            return None
+        my_reactions = self.context.get('my_reactions')
+        if my_reactions is not None and obj.id in my_reactions:
+            return my_reactions[obj.id]
+        return CommentReaction.objects.filter(
+            user=request.user,
+            comment=obj
+        ).values_list('reaction_type', flat=True).first()
     
     def get_reply_total(self, obj):
         """获取二级回复总数
@@ -221,15 +239,12 @@ class CommentCreateSerializer(CustomModelSerializer):
             serializers.ValidationError: 当父评论不存在或已被删除时
         """
         if value:
-            # 检查父评论是否存在且未被删除
+            # 父评论由主键字段从数据库加载，不存在时已在字段校验阶段报错，此处只需检查删除状态
             if value.is_deleted:
                 raise serializers.ValidationError("父评论已被删除")
             
-            # 验证父评论是否真实存在于数据库中
-            if not Comment.objects.filter(id=value.id, is_deleted=False).exists():
-                raise serializers.ValidationError("父评论不存在")
-            
             # 自动修正：如果 parent 不是根评论，沿链向上找到根评论
+            # （评论树保持两层，正常情况下最多向上查询一次）
             current = value
             max_depth = 10  # 防止无限循环
             while current.parent_id and max_depth > 0:
@@ -267,12 +282,9 @@ class CommentCreateSerializer(CustomModelSerializer):
         if not user or not hasattr(user, 'id') or user.is_anonymous:
             raise serializers.ValidationError("用户未认证")
         
-        # 检查用户是否被禁言
-        if hasattr(user, 'is_muted') and user.is_muted:
-            # 检查禁言是否仍然有效
-            if hasattr(user, 'muted_until') and user.muted_until:
-                if user.muted_until > timezone.now():
-                    raise serializers.ValidationError("您已被禁言，无法发表评论")
+        # 检查用户是否被禁言（与 CanComment 共用按用户实例缓存的结果）
+        if getattr(user, 'is_currently_muted', False):
+            raise serializers.ValidationError("您已被禁言，无法发表评论")
         
         return attrs
     
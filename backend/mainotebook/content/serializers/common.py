@@ -37,6 +37,9 @@ class StarStatusMixin:
     
     为序列化器添加收藏状态字段。
     需要在 Meta 中指定 target_type 属性。
+    
+    列表序列化时，首次访问即用一次 IN 查询取得当前用户对整个列表的收藏状态，
+    之后各行从缓存读取，避免逐条 EXISTS 查询。
     """
     
     is_starred = serializers.SerializerMethodField(
@@ -61,11 +64,45 @@ class StarStatusMixin:
         if not target_type:
             raise ValueError("StarStatusMixin 需要在 Meta 中指定 target_type 属性")
         
-        return StarRecord.objects.filter(
-            user=request.user,
-            target_id=str(obj.id),
-            target_type=target_type
-        ).exists()
+        # 列表查询已通过 with_viewer_stats 注解
+        viewer_starred = getattr(obj, 'viewer_starred', None)
+        if viewer_starred is not None:
+            return viewer_starred
+        return obj.id in self._get_starred_ids(obj, request.user, target_type)
+    
+    def _get_starred_ids(self, obj, user, target_type) -> set:
+        """获取已收藏的目标 ID 集合，按需批量加载
+        
+        Args:
+            obj: 当前序列化的模型实例
+            user: 当前用户
+            target_type: 收藏目标类型
+            
+        Returns:
+            set: 已查询范围内用户已收藏的目标 ID
+        """
+        lookup = getattr(self, '_starred_lookup', None)
+        if lookup is not None and obj.id in lookup['checked']:
+            return lookup['starred']
+        
+        records = [obj]
+        parent = getattr(self, 'parent', None)
+        if lookup is None and isinstance(parent, serializers.ListSerializer) and parent.instance is not None:
+            records = parent.instance
+        if lookup is None:
+            lookup = self._starred_lookup = {'checked': set(), 'starred': set()}
+        
+        ids = {record.id for record in records}
+        ids.add(obj.id)
+        lookup['checked'].update(ids)
+        lookup['starred'].update(
+            StarRecord.objects.filter(
+                user=user,
+                target_type=target_type,
+                target_id__in=ids
+            ).values_list('target_id', flat=True)
+        )
+        return lookup['starred']
 
 
 class UserInfoMixin:
@@ -8,8 +8,8 @@
 
 from rest_framework import serializers
 from mainotebook.utils.serializers import CustomModelSerializer
-from mainotebook.content.models import KnowledgeBase, KnowledgeBaseFile, StarRecord
-from mainotebook.content.serializers.common import TagField
+from mainotebook.content.models import KnowledgeBase, KnowledgeBaseFile
+from mainotebook.content.serializers.common import StarStatusMixin, TagField
 
 
 class KnowledgeBaseFileSerializer(CustomModelSerializer):
@@ -27,7 +27,7 @@ class KnowledgeBaseFileSerializer(CustomModelSerializer):
         read_only_fields = ['id', 'create_datetime']
 
 
-class KnowledgeBaseSerializer(CustomModelSerializer):
+class KnowledgeBaseSerializer(StarStatusMixin, CustomModelSerializer):
     """知识库列表序列化器
     
     用于列表和详情展示，包含关联数据和计算字段。
@@ -45,6 +45,9 @@ class KnowledgeBaseSerializer(CustomModelSerializer):
         allow_null=True,
         help_text="上传者头像"
     )
+    content = serializers.SerializerMethodField(
+        help_text="补充说明（仅创建者可见）"
+    )
     files = serializers.SerializerMethodField(
         help_text="关联文件列表"
     )
@@ -57,6 +60,8 @@ class KnowledgeBaseSerializer(CustomModelSerializer):
     
     class Meta:
         model = KnowledgeBase
+        # 供 StarStatusMixin 查询收藏状态
+        target_type = 'knowledge'
         fields = [
             'id', 'name', 'description', 'uploader', 'uploader_name',
             'uploader_avatar', 'copyright_owner', 'content', 'tags',
@@ -83,24 +88,6 @@ class KnowledgeBaseSerializer(CustomModelSerializer):
             many=True
         ).data
     
-    def get_is_starred(self, obj):
-        """判断当前用户是否已收藏
-        
-        Args:
-            obj: KnowledgeBase 实例
-            
-        Returns:
-            bool: 是否已收藏
-        """
-        request = self.context.get('request')
-        if request and request.user.is_authenticated:
-            return StarRecord.objects.filter(
-                user=request.user,
-                target_id=str(obj.id),
-                target_type='knowledge'
-            ).exists()
-        return False
-    
     def get_comment_count(self, obj):
         """获取评论数量
         
@@ -110,6 +97,10 @@ class KnowledgeBaseSerializer(CustomModelSerializer):
         Returns:
             int: 评论数量（包括所有层级的评论和回复）
         """
+        # 列表查询已通过 with_viewer_stats 注解
+        comment_total = getattr(obj, 'comment_total', None)
+        if comment_total is not None:
+            return comment_total
         from mainotebook.content.models import Comment
         return Comment.objects.filter(
             target_id=str(obj.id),
@@ -117,24 +108,21 @@ class KnowledgeBaseSerializer(CustomModelSerializer):
             is_deleted=False
         ).count()
 
-    def to_representation(self, instance):
-        """序列化输出，隐藏非创建者的 content（补充说明）字段
+    def get_content(self, obj):
+        """获取补充说明，非创建者不返回
+
+        非创建者时不读取 content，列表查询可延迟加载该字段。
 
         Args:
-            instance: KnowledgeBase 实例
+            obj: KnowledgeBase 实例
 
         Returns:
-            dict: 序列化后的数据
+            str | None: 补充说明
         """
-        data = super().to_representation(instance)
         request = self.context.get('request')
-        # 非创建者不返回 content 字段
-        if request and request.user.is_authenticated:
-            if str(instance.uploader_id) != str(request.user.id):
-                data['content'] = None
-        else:
-            data['content'] = None
-        return data
+        if request and request.user.is_authenticated and str(obj.uploader_id) == str(request.user.id):
+            return obj.content
+        return None
 
 
 
@@ -240,7 +228,7 @@ class KnowledgeBaseUpdateSerializer(CustomModelSerializer):
             raise serializers.ValidationError("用户未认证")
         
         user = request.user
-        if instance.uploader != user:
+        if instance.uploader_id != user.id:
             raise serializers.ValidationError("只有创建者可以修改知识库")
         
         return attrs
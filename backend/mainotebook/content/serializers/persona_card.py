@@ -13,9 +13,8 @@ from mainotebook.content.models import (
     PersonaCardFile, 
     PersonaCardConfig,
     SensitiveInfoConfirmation,
-    StarRecord
 )
-from mainotebook.content.serializers.common import TagField
+from mainotebook.content.serializers.common import StarStatusMixin, TagField
 
 
 class PersonaCardFileSerializer(CustomModelSerializer):
@@ -33,7 +32,7 @@ class PersonaCardFileSerializer(CustomModelSerializer):
         read_only_fields = ['id', 'create_datetime']
 
 
-class PersonaCardSerializer(CustomModelSerializer):
+class PersonaCardSerializer(StarStatusMixin, CustomModelSerializer):
     """人设卡列表序列化器
     
     用于列表和详情展示，包含关联数据和计算字段。
@@ -51,6 +50,9 @@ class PersonaCardSerializer(CustomModelSerializer):
         allow_null=True,
         help_text="上传者头像"
     )
+    content = serializers.SerializerMethodField(
+        help_text="补充说明（仅创建者可见）"
+    )
     files = serializers.SerializerMethodField(
         help_text="关联文件列表"
     )
@@ -66,6 +68,8 @@ class PersonaCardSerializer(CustomModelSerializer):
     
     class Meta:
         model = PersonaCard
+        # 供 StarStatusMixin 查询收藏状态
+        target_type = 'persona'
         fields = [
             'id', 'name', 'description', 'uploader', 'uploader_name',
             'uploader_avatar', 'copyright_owner', 'content', 'tags',
@@ -93,24 +97,6 @@ class PersonaCardSerializer(CustomModelSerializer):
             many=True
         ).data
     
-    def get_is_starred(self, obj):
-        """判断当前用户是否已收藏
-        
-        Args:
-            obj: PersonaCard 实例
-            
-        Returns:
-            bool: 是否已收藏
-        """
-        request = self.context.get('request')
-        if request and request.user.is_authenticated:
-            return StarRecord.objects.filter(
-                user=request.user,
-                target_id=str(obj.id),
-                target_type='persona'
-            ).exists()
-        return False
-    
     def get_has_valid_toml(self, obj):
         """判断是否包含有效的 bot_config.toml 文件
         
@@ -132,6 +118,10 @@ class PersonaCardSerializer(CustomModelSerializer):
         Returns:
             int: 评论数量（包括所有层级的评论和回复）
         """
+        # 列表查询已通过 with_viewer_stats 注解
+        comment_total = getattr(obj, 'comment_total', None)
+        if comment_total is not None:
+            return comment_total
         from mainotebook.content.models import Comment
         return Comment.objects.filter(
             target_id=str(obj.id),
@@ -139,24 +129,21 @@ class PersonaCardSerializer(CustomModelSerializer):
             is_deleted=False
         ).count()
     
-    def to_representation(self, instance):
-        """序列化输出，隐藏非创建者的 content（补充说明）字段
-        
+    def get_content(self, obj):
+        """获取补充说明，非创建者不返回
+
+        非创建者时不读取 content，列表查询可延迟加载该字段。
+
         Args:
-            instance: PersonaCard 实例
-            
+            obj: PersonaCard 实例
+
         Returns:
-            dict: 序列化后的数据
+            str | None: 补充说明
         """
-        data = super().to_representation(instance)
         request = self.context.get('request')
-        # 非创建者不返回 content 字段
-        if request and request.user.is_authenticated:
-            if str(instance.uploader_id) != str(request.user.id):
-                data['content'] = None
-        else:
-            data['content'] = None
-        return data
+        if request and request.user.is_authenticated and str(obj.uploader_id) == str(request.user.id):
+            return obj.content
+        return None
 
 
 class PersonaCardConfigSerializer(CustomModelSerializer):
@@ -453,7 +440,7 @@ class PersonaCardUpdateSerializer(CustomModelSerializer):
             raise serializers.ValidationError("用户未认证")
         
         user = request.user
-        if instance.uploader != user:
+        if instance.uploader_id != user.id:
             raise serializers.ValidationError("只有创建者可以修改人设卡")
         
         return attrs
@@ -108,7 +108,8 @@ class StarRecordSerializer(CustomModelSerializer):
     def _get_target(self, obj: StarRecord) -> Optional[Union[KnowledgeBase, PersonaCard]]:
         """获取目标对象
         
-        根据 target_type 查询对应的知识库或人设卡对象。
+        根据 target_type 查询对应的知识库或人设卡对象。多个字段都会读取目标对象，
+        列表序列化时首次访问即按类型批量加载整个列表的目标（每种类型一次查询），之后从缓存读取。
         
         Args:
             obj: StarRecord 对象
@@ -116,8 +117,42 @@ class StarRecordSerializer(CustomModelSerializer):
         Returns:
             KnowledgeBase | PersonaCard | None: 目标对象，如果不存在则返回 None
         """
-        if obj.target_type == 'knowledge':
-            return KnowledgeBase.objects.filter(id=obj.target_id).first()
-        elif obj.target_type == 'persona':
-            return PersonaCard.objects.filter(id=obj.target_id).first()
-        return None
+        targets = getattr(self, '_targets', None)
+        if targets is None:
+            records = [obj]
+            parent = self.parent
+            if isinstance(parent, serializers.ListSerializer) and parent.instance is not None:
+                records = parent.instance
+            targets = self._targets = self._load_targets(records)
+        key = (obj.target_type, obj.target_id)
+        if key not in targets:
+            targets.update(self._load_targets([obj]))
+        return targets.get(key)
+    
+    @staticmethod
+    def _load_targets(records) -> Dict[tuple, Union[KnowledgeBase, PersonaCard]]:
+        """按类型批量加载收藏记录的目标对象（同时加载上传者与关联文件）
+        
+        Args:
+            records: StarRecord 对象序列
+            
+        Returns:
+            dict: (target_type, target_id) -> 目标对象；不存在的目标映射为 None
+        """
+        ids_by_type = {}
+        for record in records:
+            ids_by_type.setdefault(record.target_type, set()).add(record.target_id)
+        
+        targets = {}
+        for target_type, model in (('knowledge', KnowledgeBase), ('persona', PersonaCard)):
+            ids = ids_by_type.pop(target_type, None)
+            if not ids:
+                continue
+            found = model.objects.with_uploader().with_files().in_bulk(ids)
+            for target_id in ids:
+                targets[(target_type, target_id)] = found.get(target_id)
+        # 无效的目标类型
+        for target_type, ids in ids_by_type.items():
+            for target_id in ids:
+                targets[(target_type, target_id)] = None
+        return targets
@@ -11,6 +11,13 @@ from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# 站内信审核摘要中的决策描述
+SUMMARY_DECISION_LABELS = {
+    "auto_approved": "自动通过",
+    "auto_rejected": "自动拒绝",
+    "pending_manual": "待人工审核",
+}
+
 
 class AutoReviewService:
     """AI 自动审核服务
@@ -879,12 +886,7 @@ class AutoReviewService:
         summary_parts = []
 
         # 添加审核决策
-        decision_map = {
-            "auto_approved": "自动通过",
-            "auto_rejected": "自动拒绝",
-            "pending_manual": "待人工审核",
-        }
-        decision_text = decision_map.get(report.decision, report.decision)
+        decision_text = SUMMARY_DECISION_LABELS.get(report.decision, report.decision)
         summary_parts.append(f"审核结果：{decision_text}")
 
         # 添加置信度
@@ -3,8 +3,11 @@
 提供评论相关的业务逻辑，包括评论创建、删除、点赞等功能。
 """
 
+import hashlib
 from typing import List, Optional
-from django.db.models import QuerySet, Q
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Prefetch, QuerySet, Q, prefetch_related_objects
 from django.utils import timezone
 from django.core.exceptions import ValidationError, PermissionDenied
 
@@ -160,22 +163,20 @@ class CommentService:
         end = start + page_size
         page_comments = sorted_comments[start:end]
         
-        # 为每个根评论加载前10条二级评论
-        for comment in page_comments:
-            replies = Comment.objects.filter(
-                parent_id=comment.id,
+        # 一次查询为本页每个根评论预取前10条二级评论（切片的 Prefetch 使用窗口函数按父评论分组截取）
+        prefetch_related_objects(page_comments, Prefetch(
+            'replies',
+            queryset=Comment.objects.filter(
                 is_deleted=False,
             ).exclude(
                 moderation_status='rejected',
-            ).select_related('user', 'reply_to', 'reply_to__user').order_by('create_datetime')[:10]
-            
-            comment._prefetched_replies = list(replies)
-            comment._reply_total = Comment.objects.filter(
-                parent_id=comment.id,
-                is_deleted=False,
-            ).exclude(
-                moderation_status='rejected',
-            ).count()
+            ).with_related().order_by('create_datetime')[:10],
+            to_attr='_prefetched_replies',
+        ))
+        # 回复总数复用查询根评论时注解的 reply_count（过滤条件相同）
+        for comment in page_comments:
+            comment._reply_total = comment.reply_count
+            CommentService.mark_leaf_replies(comment._prefetched_replies)
         
         # 记录用户浏览行为（用于后续个性化）
         if user and user.is_authenticated and page_comments:
@@ -190,6 +191,49 @@ class CommentService:
         }
     
     
+    @staticmethod
+    def get_user_reactions(user, comments) -> dict:
+        """一次查询当前用户对一组评论（含已预取的二级回复）的反应
+
+        结果放入序列化器 context['my_reactions']，供 is_liked / my_reaction 直接查字典。
+
+        Args:
+            user: 当前用户（未登录时返回空字典）
+            comments: 评论列表
+
+        Returns:
+            dict: 评论 ID -> 反应类型；已查询但无反应的评论映射为 None
+        """
+        if not user or not user.is_authenticated:
+            return {}
+        comment_ids = []
+        for comment in comments:
+            comment_ids.append(comment.id)
+            comment_ids.extend(reply.id for reply in getattr(comment, '_prefetched_replies', ()))
+        if not comment_ids:
+            return {}
+
+        reactions = dict.fromkeys(comment_ids)
+        reactions.update(
+            CommentReaction.objects.filter(user=user, comment_id__in=comment_ids)
+            .values_list('comment_id', 'reaction_type')
+        )
+        return reactions
+    
+    @staticmethod
+    def mark_leaf_replies(replies) -> None:
+        """标记二级回复没有下一层回复
+
+        评论树只有两层，序列化器递归到二级回复时直接使用空列表和 0，
+        不再逐条查询回复列表与回复总数。
+
+        Args:
+            replies: 二级回复列表
+        """
+        for reply in replies:
+            reply._prefetched_replies = []
+            reply._reply_total = 0
+
     @staticmethod
     def get_replies(parent_id: str, page: int = 1, page_size: int = 10) -> dict:
         """获取指定评论的二级回复（分页）
@@ -214,13 +258,14 @@ class CommentService:
             is_deleted=False,
         ).exclude(
             moderation_status='rejected',
-        ).select_related('user', 'reply_to', 'reply_to__user').order_by('create_datetime')
+        ).with_related().order_by('create_datetime')
         
         total = replies_query.count()
         start = (page - 1) * page_size
         end = start + page_size
         
         replies = list(replies_query[start:end])
+        CommentService.mark_leaf_replies(replies)
         
         return {
             'replies': replies,
@@ -352,6 +397,80 @@ class CommentService:
         return comment
     @staticmethod
     def _moderate_content(content: str, user=None, content_id: str = None) -> tuple:
+        """审核评论内容，相同文本的审核结论按内容哈希缓存
+
+        重复提交、刷屏等场景下相同文本无需再次调用 AI。缓存键只由内容决定，缓存值只包含
+        由内容得出的 (审核状态, 违规类型)，不包含模型、Token 用量等单次调用信息；
+        只缓存明确的 approved / rejected 结论，AI 异常或不确定的结果不缓存。
+        命中缓存时返回的审核详情带有 cached 标记，并写入一条 model_name 为 cache 的审核日志。
+        缓存时间由 COMMENT_MODERATION_CACHE_TIMEOUT（秒）配置，0 表示不缓存。
+
+        Args:
+            content: 评论文本内容
+            user: 触发审核的用户对象（可选，用于日志记录）
+            content_id: 关联的评论 ID（可选，用于日志记录）
+
+        Returns:
+            tuple: (moderation_status, moderation_detail)，含义同 _moderate_content_uncached
+        """
+        import logging
+
+        timeout = getattr(settings, 'COMMENT_MODERATION_CACHE_TIMEOUT', 3600)
+        if not timeout:
+            return CommentService._moderate_content_uncached(content, user=user, content_id=content_id)
+
+        cache_key = 'comment_moderation:' + hashlib.sha256(content.encode()).hexdigest()
+        cached = cache.get(cache_key)
+        if cached is not None:
+            moderation_status, violation_types = cached
+            logging.getLogger(__name__).info(
+                "评论审核命中缓存 - 状态: %s, 违规类型: %s", moderation_status, violation_types,
+            )
+            CommentService._log_cached_moderation(content, moderation_status, violation_types, user, content_id)
+            return moderation_status, {
+                'decision': moderation_status,
+                'violation_types': list(violation_types),
+                'cached': True,
+            }
+
+        moderation_status, moderation_detail = CommentService._moderate_content_uncached(
+            content, user=user, content_id=content_id,
+        )
+        if moderation_status in ('approved', 'rejected'):
+            violation_types = list(moderation_detail.get('violation_types') or [])
+            cache.set(cache_key, (moderation_status, violation_types), timeout)
+        return moderation_status, moderation_detail
+
+    @staticmethod
+    def _log_cached_moderation(content: str, moderation_status: str, violation_types: list,
+                               user=None, content_id: str = None) -> None:
+        """为命中缓存的审核写入审核日志，保证每次评论审核都有记录
+
+        Args:
+            content: 评论文本内容
+            moderation_status: 缓存的审核状态
+            violation_types: 缓存的违规类型
+            user: 触发审核的用户对象
+            content_id: 关联的评论 ID
+        """
+        from mainotebook.content.models import moderation_log_writer
+
+        moderation_log_writer.add(
+            source="comment",
+            content_id=content_id,
+            user=user,
+            model_name='cache',
+            api_provider='cache',
+            text_type="comment",
+            input_text=content,
+            input_text_length=len(content),
+            decision=moderation_status,
+            violation_types=violation_types,
+            is_success=True,
+        )
+
+    @staticmethod
+    def _moderate_content_uncached(content: str, user=None, content_id: str = None) -> tuple:
         """调用 AI 审核评论内容
 
         使用 ModerationService 对评论内容进行审核，并记录审核日志。
@@ -566,7 +685,7 @@ class CommentService:
             PermissionDenied: 当用户无权限删除时
         """
         # 验证权限（创建者或管理员）
-        if comment.user != user and not user.is_staff:
+        if comment.user_id != user.id and not user.is_staff:
             raise PermissionDenied("只有创建者或管理员可以删除评论")
         
         # 递归软删除评论及其所有子评论
@@ -609,36 +728,27 @@ class CommentService:
             user=user, comment=comment
         ).first()
         
+        like_delta = dislike_delta = 0
         if action == 'clear':
             # 取消当前反应
             if existing:
                 if existing.reaction_type == 'like':
-                    comment.like_count = max(0, comment.like_count - 1)
+                    like_delta = -1
                 elif existing.reaction_type == 'dislike':
-                    comment.dislike_count = max(0, comment.dislike_count - 1)
+                    dislike_delta = -1
                 existing.delete()
-            comment.save()
             my_reaction = None
         elif existing:
             # 已有反应记录
-            if existing.reaction_type == action:
-                # 重复操作，不做任何变更
-                pass
-            else:
-                # 切换反应类型
+            if existing.reaction_type != action:
+                # 切换反应类型（重复操作则不做任何变更）
                 if existing.reaction_type == 'like':
-                    comment.like_count = max(0, comment.like_count - 1)
+                    like_delta, dislike_delta = -1, 1
                 else:
-                    comment.dislike_count = max(0, comment.dislike_count - 1)
+                    like_delta, dislike_delta = 1, -1
                 
                 existing.reaction_type = action
                 existing.save()
-                
-                if action == 'like':
-                    comment.like_count += 1
-                else:
-                    comment.dislike_count += 1
-                comment.save()
             my_reaction = action
         else:
             # 新增反应
@@ -646,13 +756,14 @@ class CommentService:
                 user=user, comment=comment, reaction_type=action
             )
             if action == 'like':
-                comment.like_count += 1
+                like_delta = 1
             else:
-                comment.dislike_count += 1
-            comment.save()
+                dislike_delta = 1
             my_reaction = action
         
-        comment.refresh_from_db()
+        # 计数在数据库中原子增减，再读回最新值
+        Comment.incr_reactions(comment.pk, like=like_delta, dislike=dislike_delta)
+        comment.refresh_from_db(fields=['like_count', 'dislike_count'])
         
         # 清除用户推荐缓存（点赞是兴趣信号）
         from mainotebook.content.services.recommendation_service import RecommendationService
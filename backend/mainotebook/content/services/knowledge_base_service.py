@@ -136,7 +136,7 @@ class KnowledgeBaseService:
             PermissionDenied: 当用户无权限时
         """
         # 验证权限（仅创建者可修改）
-        if knowledge_base.uploader != user:
+        if knowledge_base.uploader_id != user.id:
             raise PermissionDenied("只有创建者可以修改知识库")
         
         # 更新字段
@@ -158,7 +158,7 @@ class KnowledgeBaseService:
             PermissionDenied: 当用户无权限时
         """
         # 验证权限（仅创建者可删除）
-        if knowledge_base.uploader != user:
+        if knowledge_base.uploader_id != user.id:
             raise PermissionDenied("只有创建者可以删除知识库")
         
         # 软删除
@@ -184,7 +184,7 @@ class KnowledgeBaseService:
             ValidationError: 当状态不允许提交时
         """
         # 验证权限（仅创建者可提交审核）
-        if knowledge_base.uploader != user:
+        if knowledge_base.uploader_id != user.id:
             raise PermissionDenied("只有创建者可以提交审核")
         
         # 验证状态（不能重复提交）
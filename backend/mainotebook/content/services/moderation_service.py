@@ -755,14 +755,14 @@ class ModerationService:
             user: 触发审核的用户对象（Django User 实例）
         """
         try:
-            from mainotebook.content.models import ModerationLog
+            from mainotebook.content.models import moderation_log_writer
 
             meta = result.get('_meta', {})
             if not meta:
                 logger.warning("审核结果缺少 _meta 数据，跳过日志记录")
                 return
 
-            ModerationLog.objects.create(
+            moderation_log_writer.add(
                 source=source,
                 content_id=content_id,
                 user=user,
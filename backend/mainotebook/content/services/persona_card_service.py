@@ -68,7 +68,7 @@ class PersonaCardService:
         **验证需求：12.3, 12.4**
         """
         # 检查是否是上传者
-        if persona_card.uploader != user:
+        if persona_card.uploader_id != user.id:
             return False
         
         # 检查人设卡状态
@@ -257,7 +257,7 @@ class PersonaCardService:
             PermissionDenied: 当用户无权限时
         """
         # 验证权限（仅创建者可修改）
-        if persona_card.uploader != user:
+        if persona_card.uploader_id != user.id:
             raise PermissionDenied("只有创建者可以修改人设卡")
         
         # 更新字段
@@ -285,7 +285,7 @@ class PersonaCardService:
             PermissionDenied: 当用户无权限时
         """
         # 验证权限（仅创建者可删除）
-        if persona_card.uploader != user:
+        if persona_card.uploader_id != user.id:
             raise PermissionDenied("只有创建者可以删除人设卡")
         
         # 删除关联的收藏记录
@@ -315,7 +315,7 @@ class PersonaCardService:
             ValidationError: 当状态不允许提交或 TOML 验证失败时
         """
         # 验证权限（仅创建者可提交审核）
-        if persona_card.uploader != user:
+        if persona_card.uploader_id != user.id:
             raise PermissionDenied("只有创建者可以提交审核")
         
         # 验证状态（不能重复提交）
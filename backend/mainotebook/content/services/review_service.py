@@ -5,7 +5,7 @@
 """
 
 from typing import Optional, List, Dict
-from datetime import timedelta
+from datetime import datetime, time, timedelta
 from django.db.models import Q, Count, Subquery, OuterRef, CharField
 from django.core.exceptions import ValidationError
 from django.utils import timezone
@@ -451,28 +451,25 @@ class ReviewService:
             is_pending=True
         ).count()
         
-        # 已处理数量（今日）
-        today = timezone.now().date()
-        approved_today = UploadRecord.objects.filter(
-            status='approved',
-            update_datetime__date=today
-        ).count()
-        rejected_today = UploadRecord.objects.filter(
-            status='rejected',
-            update_datetime__date=today
-        ).count()
-        
-        # 通过率（最近 30 天）
-        thirty_days_ago = timezone.now() - timedelta(days=30)
+        # 已处理数量（今日）与通过率（最近 30 天）：一次范围扫描内分别计数
+        # 使用时间范围而非 __date，便于走 (status, update_datetime) 索引
+        now = timezone.now()
+        today_start = datetime.combine(now.date(), time.min)
+        thirty_days_ago = now - timedelta(days=30)
         # 这里计算的是总的通过率，不区分人工还是 AI
-        total_reviewed_records = UploadRecord.objects.filter(
+        record_stats = UploadRecord.objects.filter(
             status__in=['approved', 'rejected'],
             update_datetime__gte=thirty_days_ago
-        ).count()
-        approved_count_records = UploadRecord.objects.filter(
-            status='approved',
-            update_datetime__gte=thirty_days_ago
-        ).count()
+        ).aggregate(
+            approved_today=Count('id', filter=Q(status='approved', update_datetime__gte=today_start)),
+            rejected_today=Count('id', filter=Q(status='rejected', update_datetime__gte=today_start)),
+            total_reviewed=Count('id'),
+            approved=Count('id', filter=Q(status='approved')),
+        )
+        approved_today = record_stats['approved_today']
+        rejected_today = record_stats['rejected_today']
+        total_reviewed_records = record_stats['total_reviewed']
+        approved_count_records = record_stats['approved']
         
         pass_rate = (approved_count_records / total_reviewed_records * 100) if total_reviewed_records > 0 else 0
         
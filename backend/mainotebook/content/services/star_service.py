@@ -55,8 +55,7 @@ class StarService:
         )
         
         # 增加收藏计数
-        target.star_count += 1
-        target.save(update_fields=['star_count'])
+        type(target).incr_star(target.pk)
     
     @staticmethod
     def unstar_content(user: Users, target_id: str, target_type: str) -> None:
@@ -77,15 +76,9 @@ class StarService:
         if deleted_count > 0:
             # 减少收藏计数
             if target_type == 'knowledge':
-                target = KnowledgeBase.objects.filter(id=target_id).first()
+                KnowledgeBase.incr_star(target_id, -1)
             elif target_type == 'persona':
-                target = PersonaCard.objects.filter(id=target_id).first()
-            else:
-                return
-            
-            if target:
-                target.star_count = max(0, target.star_count - 1)
-                target.save(update_fields=['star_count'])
+                PersonaCard.incr_star(target_id, -1)
     
     @staticmethod
     def get_user_stars(user: Users, target_type: Optional[str] = None) -> QuerySet:
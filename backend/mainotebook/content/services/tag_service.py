@@ -251,14 +251,21 @@ class TagService:
         persona_tag_usage = {}
         
         # 统计知识库标签（只统计公开且未删除的内容）
-        for kb in KnowledgeBase.objects.filter(is_public=True):
-            tags = cls.parse_tags(kb.tags)
+        # 只读取 tags 列，且清除模型默认排序，避免全表扫描后再排序
+        for raw_tags in (
+            KnowledgeBase.objects.filter(is_public=True)
+            .order_by().values_list('tags', flat=True).iterator()
+        ):
+            tags = cls.parse_tags(raw_tags)
             for tag in tags:
                 knowledge_tag_usage[tag] = knowledge_tag_usage.get(tag, 0) + 1
         
         # 统计人设卡标签（只统计公开且未删除的内容）
-        for pc in PersonaCard.objects.filter(is_public=True, is_deleted=False):
-            tags = cls.parse_tags(pc.tags)
+        for raw_tags in (
+            PersonaCard.objects.filter(is_public=True, is_deleted=False)
+            .order_by().values_list('tags', flat=True).iterator()
+        ):
+            tags = cls.parse_tags(raw_tags)
             for tag in tags:
                 persona_tag_usage[tag] = persona_tag_usage.get(tag, 0) + 1
         
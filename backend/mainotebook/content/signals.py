@@ -11,10 +11,11 @@
 """
 
 import logging
-from django.db.models.signals import pre_save, post_delete
+from django.db import connections
+from django.db.models.signals import pre_save, post_save, post_delete
 from django.dispatch import receiver
 
-from mainotebook.content.models import PersonaCard, KnowledgeBase
+from mainotebook.content.models import PersonaCard, KnowledgeBase, IS_POSTGRESQL, build_search_vector
 from mainotebook.content.services.tag_service import TagService
 
 logger = logging.getLogger(__name__)
@@ -162,3 +163,61 @@ def knowledge_base_post_delete(sender, instance, **kwargs):
         logger.info(
             f"知识库 {instance.id} 已物理删除，标签统计已减少: tags={instance.tags}"
         )
+
+
+# 影响全文检索向量的字段
+SEARCH_VECTOR_SOURCE_FIELDS = ('name', 'description', 'tags')
+
+
+@receiver(pre_save, sender=PersonaCard)
+@receiver(pre_save, sender=KnowledgeBase)
+def mark_search_vector_stale(sender, instance, update_fields=None, **kwargs):
+    """保存前比较检索相关字段的旧值，标记是否需要重算全文检索向量（仅 PostgreSQL）
+
+    新建对象总是需要重算；指定了 update_fields 时由 update_search_vector 判断，
+    其余完整保存按主键读取 name / description / tags 的旧值进行比较。
+    """
+    if not IS_POSTGRESQL or update_fields is not None:
+        return
+    if instance._state.adding:
+        instance._search_vector_stale = True
+        return
+    old_values = sender.all_objects.filter(pk=instance.pk).values_list(*SEARCH_VECTOR_SOURCE_FIELDS).first()
+    new_values = tuple(getattr(instance, field) for field in SEARCH_VECTOR_SOURCE_FIELDS)
+    instance._search_vector_stale = old_values is None or tuple(old_values) != new_values
+
+
+@receiver(post_save, sender=PersonaCard)
+@receiver(post_save, sender=KnowledgeBase)
+def update_search_vector(sender, instance, update_fields=None, **kwargs):
+    """保存后在数据库内重算全文检索向量（仅 PostgreSQL）
+
+    只更新了与检索无关的字段（如收藏数、下载次数），或完整保存但 name / description / tags
+    均未变化时跳过。
+    """
+    if not IS_POSTGRESQL:
+        return
+    if update_fields is not None:
+        if not set(SEARCH_VECTOR_SOURCE_FIELDS).intersection(update_fields):
+            return
+    elif not instance.__dict__.pop('_search_vector_stale', True):
+        return
+    _rebuild_search_vector(sender, instance.pk)
+
+
+def _rebuild_search_vector(model, pk):
+    """按主键在数据库内重算单条记录的全文检索向量"""
+    model.all_objects.filter(pk=pk).update(search_vector=build_search_vector())
+
+
+def ensure_pg_trgm_extension(sender, using='default', **kwargs):
+    """迁移前确保 PostgreSQL 已启用 pg_trgm 扩展
+
+    模糊搜索字段上的 GIN 三元组索引依赖 gin_trgm_ops 操作符类，
+    其他数据库不做处理。在 ContentConfig.ready() 中连接到 pre_migrate 信号。
+    """
+    connection = connections[using]
+    if connection.vendor != 'postgresql':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
@@ -197,3 +197,26 @@ def auto_unmute_task(self, mute_record_id: int) -> Dict[str, any]:
             "error": str(exc),
             "mute_record_id": mute_record_id,
         }
+
+
+@app.task(ignore_result=True)
+def flush_audit_record_buffers() -> Dict[str, int]:
+    """将 Redis 缓冲的审计记录批量写入数据库
+
+    AUDIT_RECORD_BUFFER = 'redis' 时由 Celery Beat 每秒调度，
+    每个写入器单次最多取出 REDIS_FLUSH_LIMIT 条记录。
+
+    Returns:
+        dict: 模型名 -> 本次写入条数
+    """
+    # 导入模型模块以注册写入器
+    from mainotebook.content import models  # noqa: F401
+    from mainotebook.utils.record_buffer import BufferedRecordWriter
+
+    flushed = {}
+    for writer in BufferedRecordWriter.registry:
+        try:
+            flushed[writer.model.__name__] = writer.flush_redis()
+        except Exception as exc:
+            logger.error("审计记录缓冲写入失败: model=%s, 错误: %s", writer.model.__name__, exc)
+    return flushed
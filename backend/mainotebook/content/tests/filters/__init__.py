@@ -0,0 +1,3 @@
+"""
+内容应用过滤器测试
+"""
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+"""
+内容过滤器测试
+
+测试评论过滤器的 target_id 校验、通过接口查询评论时的参数校验，
+以及 ContentFilterSet 在没有有效筛选参数时的短路逻辑。
+"""
+
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from mainotebook.system.models import Users
+from mainotebook.content.filters import CommentFilter, KnowledgeBaseFilter
+from mainotebook.content.models import Comment, KnowledgeBase
+from mainotebook.utils.filters import CustomDjangoFilterBackend
+
+
+class CommentFilterView:
+    """只提供过滤器类的视图替身"""
+    filterset_class = CommentFilter
+
+
+class CommentFilterTest(TestCase):
+    """评论过滤器 target_id 测试"""
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.user = Users.objects.create(username='comment_filter_user', name='测试用户')
+        self.kb = KnowledgeBase.objects.create(name='测试知识库', description='描述', uploader=self.user)
+        self.other_kb = KnowledgeBase.objects.create(name='其他知识库', description='描述', uploader=self.user)
+        self.comment = Comment.objects.create(
+            user=self.user, target_id=self.kb.id, target_type='knowledge', content='测试评论'
+        )
+        Comment.objects.create(
+            user=self.user, target_id=self.other_kb.id, target_type='knowledge', content='其他评论'
+        )
+
+    def _filter(self, params):
+        request = Request(self.factory.get('/', params))
+        return CustomDjangoFilterBackend().filter_queryset(request, Comment.objects.all(), CommentFilterView())
+
+    def test_filter_by_target_id(self):
+        """合法的 UUID 只匹配该目标的评论"""
+        queryset = self._filter({'target_id': str(self.kb.id)})
+        self.assertEqual(list(queryset), [self.comment])
+
+    def test_malformed_target_id_rejected(self):
+        """格式错误的 target_id 返回校验错误（400），不再返回空列表"""
+        with self.assertRaises(ValidationError) as ctx:
+            self._filter({'target_id': 'not-a-uuid'})
+        self.assertEqual(ctx.exception.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('target_id', ctx.exception.detail)
+
+    def test_comment_list_malformed_target_id(self):
+        """评论列表接口对格式错误的 target_id 返回 400"""
+        response = APIClient().get('/api/content/comments/', {
+            'target_id': 'not-a-uuid',
+            'target_type': 'knowledge',
+        })
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['code'], 4000)
+
+    def test_comment_list_by_target_id(self):
+        """评论列表接口按合法的 target_id 返回对应评论"""
+        response = APIClient().get('/api/content/comments/', {
+            'target_id': str(self.kb.id),
+            'target_type': 'knowledge',
+        })
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([item['id'] for item in response.data['data']], [str(self.comment.id)])
+
+
+class ContentFilterSetShortCircuitTest(TestCase):
+    """ContentFilterSet 无有效参数时直接返回原查询集"""
+
+    def setUp(self):
+        self.user = Users.objects.create(username='filterset_user', name='测试用户')
+        self.kb = KnowledgeBase.objects.create(name='测试知识库', description='描述', uploader=self.user)
+        self.root = Comment.objects.create(
+            user=self.user, target_id=self.kb.id, target_type='knowledge', content='根评论'
+        )
+        self.reply = Comment.objects.create(
+            user=self.user, target_id=self.kb.id, target_type='knowledge', content='回复', parent=self.root
+        )
+
+    def _filter_queryset(self, filterset_class, data, queryset):
+        filterset = filterset_class(data=data, queryset=queryset)
+        self.assertTrue(filterset.is_valid(), filterset.errors)
+        return filterset.filter_queryset(queryset)
+
+    def test_no_params_returns_queryset_unchanged(self):
+        """没有任何参数时返回同一个查询集对象"""
+        queryset = KnowledgeBase.objects.all()
+        self.assertIs(self._filter_queryset(KnowledgeBaseFilter, {}, queryset), queryset)
+
+    def test_blank_params_returns_queryset_unchanged(self):
+        """只有空字符串或空白参数时同样不做过滤"""
+        queryset = KnowledgeBase.objects.all()
+        data = {'name': '   ', 'description': '', 'tags': ''}
+        self.assertIs(self._filter_queryset(KnowledgeBaseFilter, data, queryset), queryset)
+
+    def test_false_value_still_applied(self):
+        """is_root=false 等为假但有意义的值仍然生效"""
+        queryset = Comment.objects.all()
+        filtered = self._filter_queryset(CommentFilter, {'is_root': 'false'}, queryset)
+        self.assertIsNot(filtered, queryset)
+        self.assertEqual(list(filtered), [self.reply])
@@ -95,7 +95,7 @@ class KnowledgeBaseWorkflowTest(TestCase):
             content='这是一个非常好的知识库！'
         )
         self.assertIsNotNone(main_comment.id)
-        self.assertEqual(main_comment.target_id, str(kb.id))
+        self.assertEqual(str(main_comment.target_id), str(kb.id))
         self.assertEqual(main_comment.target_type, 'knowledge')
         
         # 创建回复评论
@@ -136,7 +136,7 @@ class KnowledgeBaseWorkflowTest(TestCase):
             target_type='knowledge'
         )
         self.assertIsNotNone(star.id)
-        self.assertEqual(star.target_id, str(kb.id))
+        self.assertEqual(str(star.target_id), str(kb.id))
         
         # 验证收藏与用户的关系
         self.assertIn(star, user.star_records.all())
@@ -263,7 +263,7 @@ class KnowledgeBaseWorkflowTest(TestCase):
         
         # 验证上传记录
         self.assertEqual(upload_record.uploader, user)
-        self.assertEqual(upload_record.target_id, str(kb.id))
+        self.assertEqual(str(upload_record.target_id), str(kb.id))
         self.assertEqual(upload_record.status, 'pending')
         
         # 模拟审核通过
@@ -361,7 +361,7 @@ class PersonaCardWorkflowTest(TestCase):
             content='这个人设卡设计得很棒！'
         )
         self.assertIsNotNone(main_comment.id)
-        self.assertEqual(main_comment.target_id, str(pc.id))
+        self.assertEqual(str(main_comment.target_id), str(pc.id))
         self.assertEqual(main_comment.target_type, 'persona')
         
         # 创建回复评论
@@ -402,7 +402,7 @@ class PersonaCardWorkflowTest(TestCase):
             target_type='persona'
         )
         self.assertIsNotNone(star.id)
-        self.assertEqual(star.target_id, str(pc.id))
+        self.assertEqual(str(star.target_id), str(pc.id))
         self.assertEqual(star.target_type, 'persona')
         
         # 验证收藏与用户的关系
@@ -535,7 +535,7 @@ class PersonaCardWorkflowTest(TestCase):
         
         # 验证上传记录
         self.assertEqual(upload_record.uploader, user)
-        self.assertEqual(upload_record.target_id, str(pc.id))
+        self.assertEqual(str(upload_record.target_id), str(pc.id))
         self.assertEqual(upload_record.target_type, 'persona')
         self.assertEqual(upload_record.status, 'pending')
         
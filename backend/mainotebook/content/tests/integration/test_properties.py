@@ -213,11 +213,12 @@ class FieldTypeMappingPropertyTest(TestCase):
         self.assertIsInstance(comment.id, uuid.UUID)
         self.assertIsInstance(comment._meta.get_field('id'), models.UUIDField)
         
-        # 验证 CharField 字段
-        self.assertIsInstance(comment.target_id, str)
-        self.assertIsInstance(comment._meta.get_field('target_id'), models.CharField)
-        self.assertEqual(comment._meta.get_field('target_id').max_length, 36)
+        # 验证 target_id 为 UUID 字段
+        comment.refresh_from_db()
+        self.assertIsInstance(comment.target_id, uuid.UUID)
+        self.assertIsInstance(comment._meta.get_field('target_id'), models.UUIDField)
         
+        # 验证 CharField 字段
         self.assertIsInstance(comment.target_type, str)
         self.assertIsInstance(comment._meta.get_field('target_type'), models.CharField)
         
@@ -263,9 +264,12 @@ class FieldTypeMappingPropertyTest(TestCase):
         self.assertIsInstance(star.id, uuid.UUID)
         self.assertIsInstance(star._meta.get_field('id'), models.UUIDField)
         
+        # 验证 target_id 为 UUID 字段
+        star.refresh_from_db()
+        self.assertIsInstance(star.target_id, uuid.UUID)
+        self.assertIsInstance(star._meta.get_field('target_id'), models.UUIDField)
+        
         # 验证 CharField 字段
-        self.assertIsInstance(star.target_id, str)
-        self.assertIsInstance(star._meta.get_field('target_id'), models.CharField)
         self.assertIsInstance(star.target_type, str)
         self.assertIsInstance(star._meta.get_field('target_type'), models.CharField)
         
@@ -329,9 +333,12 @@ class FieldTypeMappingPropertyTest(TestCase):
         self.assertIsInstance(upload.id, uuid.UUID)
         self.assertIsInstance(upload._meta.get_field('id'), models.UUIDField)
         
+        # 验证 target_id 为 UUID 字段
+        upload.refresh_from_db()
+        self.assertIsInstance(upload.target_id, uuid.UUID)
+        self.assertIsInstance(upload._meta.get_field('target_id'), models.UUIDField)
+        
         # 验证 CharField 字段
-        self.assertIsInstance(upload.target_id, str)
-        self.assertIsInstance(upload._meta.get_field('target_id'), models.CharField)
         self.assertIsInstance(upload.name, str)
         self.assertIsInstance(upload._meta.get_field('name'), models.CharField)
         self.assertIsInstance(upload.status, str)
@@ -366,9 +373,12 @@ class FieldTypeMappingPropertyTest(TestCase):
         self.assertIsInstance(download.id, uuid.UUID)
         self.assertIsInstance(download._meta.get_field('id'), models.UUIDField)
         
+        # 验证 target_id 为 UUID 字段
+        download.refresh_from_db()
+        self.assertIsInstance(download.target_id, uuid.UUID)
+        self.assertIsInstance(download._meta.get_field('target_id'), models.UUIDField)
+        
         # 验证 CharField 字段
-        self.assertIsInstance(download.target_id, str)
-        self.assertIsInstance(download._meta.get_field('target_id'), models.CharField)
         self.assertIsInstance(download.target_type, str)
         self.assertIsInstance(download._meta.get_field('target_type'), models.CharField)
 
@@ -0,0 +1,3 @@
+"""
+内容应用管理命令测试
+"""
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+"""
+fix_comment_parents 管理命令测试
+
+测试三级及以上评论的 parent 修正为根评论，以及祖先缺失、成环数据保持不变。
+"""
+
+import uuid
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from mainotebook.system.models import Users
+from mainotebook.content.models import Comment, KnowledgeBase
+
+
+class FixCommentParentsTest(TestCase):
+    """修复评论树结构命令测试"""
+
+    def setUp(self):
+        """构建评论树：
+
+        - root <- reply（已正确）<- level3 <- level4
+        - 祖先缺失：orphan 指向不存在的评论，orphan_child <- orphan
+        - 成环：cycle_a <-> cycle_b
+        """
+        self.user = Users.objects.create(username='fix_parents_user', name='测试用户')
+        self.kb = KnowledgeBase.objects.create(name='测试知识库', description='描述', uploader=self.user)
+
+        self.root = self._comment()
+        self.reply = self._comment(self.root.id)
+        self.level3 = self._comment(self.reply.id)
+        self.level4 = self._comment(self.level3.id)
+
+        self.missing_id = uuid.uuid4()
+        self.orphan = self._comment(self.missing_id)
+        self.orphan_child = self._comment(self.orphan.id)
+
+        self.cycle_a = self._comment()
+        self.cycle_b = self._comment(self.cycle_a.id)
+        Comment.all_objects.filter(id=self.cycle_a.id).update(parent_id=self.cycle_b.id)
+
+    def _comment(self, parent_id=None):
+        return Comment.objects.create(
+            user=self.user,
+            target_id=self.kb.id,
+            target_type='knowledge',
+            content='测试评论',
+            parent_id=parent_id,
+        )
+
+    def _parent_id(self, comment):
+        return Comment.all_objects.values_list('parent_id', flat=True).get(id=comment.id)
+
+    def _assert_fixed(self, output):
+        # 三级及以上评论改为指向根评论
+        self.assertEqual(self._parent_id(self.level3), self.root.id)
+        self.assertEqual(self._parent_id(self.level4), self.root.id)
+        # 已正确的二级评论与根评论不变
+        self.assertEqual(self._parent_id(self.reply), self.root.id)
+        self.assertIsNone(self._parent_id(self.root))
+        # 祖先缺失与成环的评论链无法确定根评论，保持不变
+        self.assertEqual(self._parent_id(self.orphan), self.missing_id)
+        self.assertEqual(self._parent_id(self.orphan_child), self.orphan.id)
+        self.assertEqual(self._parent_id(self.cycle_a), self.cycle_b.id)
+        self.assertEqual(self._parent_id(self.cycle_b), self.cycle_a.id)
+        self.assertIn('共修正 2 条', output)
+
+    def test_fix_with_database_path(self):
+        """当前数据库对应的修复方式（SQLite / PostgreSQL 使用递归 CTE）"""
+        out = StringIO()
+        call_command('fix_comment_parents', stdout=out)
+        self._assert_fixed(out.getvalue())
+
+    def test_fix_with_python_fallback(self):
+        """其他数据库回退到内存解析的方式"""
+        out = StringIO()
+        with patch('mainotebook.content.management.commands.fix_comment_parents.connection') as mocked:
+            mocked.vendor = 'mysql'
+            call_command('fix_comment_parents', stdout=out)
+        self._assert_fixed(out.getvalue())
+
+    def test_fix_is_idempotent(self):
+        """重复执行不再修正任何评论"""
+        call_command('fix_comment_parents', stdout=StringIO())
+        out = StringIO()
+        call_command('fix_comment_parents', stdout=out)
+        self.assertIn('共修正 0 条', out.getvalue())
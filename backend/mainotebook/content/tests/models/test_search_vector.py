@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+"""
+全文检索向量信号测试
+
+测试 update_search_vector 仅在 name / description / tags 发生变化时重算 search_vector。
+"""
+
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from mainotebook.system.models import Users
+from mainotebook.content.models import KnowledgeBase
+
+
+class SearchVectorSignalTest(TestCase):
+    """全文检索向量重算条件测试
+
+    信号仅在 PostgreSQL 下生效，用例中将 IS_POSTGRESQL 置为 True，
+    并替换实际执行 UPDATE 的 _rebuild_search_vector，只断言是否触发。
+    """
+
+    def setUp(self):
+        self.user = Users.objects.create(username='search_vector_user', name='测试用户')
+        self.kb = KnowledgeBase.objects.create(
+            name='测试知识库',
+            description='描述',
+            uploader=self.user,
+            tags=['标签'],
+        )
+        patcher = patch('mainotebook.content.signals.IS_POSTGRESQL', True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        rebuild_patcher = patch('mainotebook.content.signals._rebuild_search_vector')
+        self.rebuild = rebuild_patcher.start()
+        self.addCleanup(rebuild_patcher.stop)
+
+    def test_update_fields_without_search_fields_skipped(self):
+        """update_fields 不含检索相关字段时跳过"""
+        self.kb.star_count = 5
+        self.kb.save(update_fields=['star_count'])
+        self.rebuild.assert_not_called()
+
+    def test_update_fields_with_search_fields_rebuilds(self):
+        """update_fields 包含检索相关字段时重算"""
+        self.kb.name = '新名称'
+        self.kb.save(update_fields=['name'])
+        self.rebuild.assert_called_once_with(KnowledgeBase, self.kb.pk)
+
+    def test_full_save_without_changes_skipped(self):
+        """完整保存但检索相关字段未变化时跳过"""
+        self.kb.downloads = 3
+        self.kb.save()
+        self.rebuild.assert_not_called()
+
+    def test_full_save_with_changes_rebuilds(self):
+        """完整保存且标签发生变化时重算"""
+        self.kb.tags = ['标签', '新标签']
+        self.kb.save()
+        self.rebuild.assert_called_once_with(KnowledgeBase, self.kb.pk)
+
+    def test_create_rebuilds(self):
+        """新建对象时重算"""
+        kb = KnowledgeBase.objects.create(name='另一个知识库', description='描述', uploader=self.user)
+        self.rebuild.assert_called_once_with(KnowledgeBase, kb.pk)
@@ -213,6 +213,50 @@ class TestCommentSerializer(TestCase):
         # 验证未点赞状态
         self.assertFalse(data['is_liked'])
     
+    def test_reactions_from_context(self):
+        """测试评论树服务的输出整页序列化不再逐条查询（反应、回复列表、回复数）"""
+        from mainotebook.content.services.comment_service import CommentService
+
+        comment = Comment.objects.create(
+            user=self.user,
+            target_id=str(self.kb.id),
+            target_type='knowledge',
+            content="测试评论"
+        )
+        reply = Comment.objects.create(
+            user=self.user,
+            target_id=str(self.kb.id),
+            target_type='knowledge',
+            parent=comment,
+            content="测试回复"
+        )
+        CommentReaction.objects.create(
+            user=self.user,
+            comment=reply,
+            reaction_type='dislike'
+        )
+        comments = CommentService.get_comments_tree(str(self.kb.id), 'knowledge')['comments']
+
+        request = self.factory.get('/')
+        request.user = self.user
+        context = {
+            'request': request,
+            'my_reactions': CommentService.get_user_reactions(self.user, comments),
+        }
+
+        with self.assertNumQueries(0):
+            data = CommentSerializer(comments, many=True, context=context).data[0]
+            reply_data = data['replies'][0]
+
+        self.assertEqual(data['reply_total'], 1)
+        self.assertEqual(reply_data['replies'], [])
+        self.assertEqual(reply_data['reply_total'], 0)
+
+        self.assertFalse(data['is_liked'])
+        self.assertIsNone(data['my_reaction'])
+        self.assertFalse(reply_data['is_liked'])
+        self.assertEqual(reply_data['my_reaction'], 'dislike')
+
     def test_get_is_liked_unauthenticated_user(self):
         """测试未认证用户的点赞状态"""
         from django.contrib.auth.models import AnonymousUser
@@ -291,7 +335,7 @@ class TestCommentCreateSerializer(TestCase):
         # 验证创建成功
         self.assertEqual(comment.content, '这是一条测试评论')
         self.assertEqual(comment.user, self.user)
-        self.assertEqual(comment.target_id, str(self.kb.id))
+        self.assertEqual(str(comment.target_id), str(self.kb.id))
         self.assertEqual(comment.target_type, 'knowledge')
         self.assertIsNone(comment.parent)
     
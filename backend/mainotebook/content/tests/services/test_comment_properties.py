@@ -109,7 +109,7 @@ class CommentContentLengthPropertyTest(TestCase):
         self.assertIsNotNone(comment, "评论应创建成功")
         self.assertEqual(comment.content, content, "评论内容应与输入一致")
         self.assertEqual(comment.user, user, "评论用户应与创建用户一致")
-        self.assertEqual(comment.target_id, str(target.id), "目标 ID 应正确")
+        self.assertEqual(str(comment.target_id), str(target.id), "目标 ID 应正确")
         self.assertEqual(comment.target_type, target_type, "目标类型应正确")
         self.assertLessEqual(len(comment.content), 500, "评论内容长度应不超过 500 字符")
 
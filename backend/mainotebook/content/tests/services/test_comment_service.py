@@ -11,12 +11,15 @@
 验证需求：4.1, 4.2, 4.4, 4.5, 4.6, 4.11, 4.12, 4.13
 """
 
+from unittest.mock import patch
+
+from django.core.cache import cache
 from django.test import TestCase
 from django.core.exceptions import ValidationError, PermissionDenied
 from django.utils import timezone
 from datetime import timedelta
 from mainotebook.system.models import Users
-from mainotebook.content.models import Comment, CommentReaction, KnowledgeBase
+from mainotebook.content.models import Comment, CommentReaction, KnowledgeBase, ModerationLog
 from mainotebook.content.services.comment_service import CommentService
 
 
@@ -73,7 +76,7 @@ class CommentServiceTest(TestCase):
         # 验证评论创建成功
         self.assertIsNotNone(comment)
         self.assertEqual(comment.user, self.user1)
-        self.assertEqual(comment.target_id, str(self.knowledge_base.id))
+        self.assertEqual(str(comment.target_id), str(self.knowledge_base.id))
         self.assertEqual(comment.target_type, 'knowledge')
         self.assertEqual(comment.content, '这是一条测试评论')
         self.assertIsNone(comment.parent_id)
@@ -747,3 +750,28 @@ class CommentServiceTest(TestCase):
         # 验证结果只包含第一个知识库的评论
         self.assertEqual(len(comments), 1)
         self.assertEqual(comments[0].id, comment1.id)
+
+    def test_moderate_content_caches_by_content(self):
+        """相同文本的明确审核结果只调用一次 AI，不确定的结果不缓存"""
+        cache.clear()
+        target = 'mainotebook.content.services.comment_service.CommentService._moderate_content_uncached'
+        
+        detail = {
+            'decision': 'rejected',
+            'violation_types': ['abuse'],
+            '_meta': {'model_name': 'THUDM/glm-4-9b-chat', 'total_tokens': 100},
+        }
+        with patch(target, return_value=('rejected', detail)) as mocked:
+            first = CommentService._moderate_content('重复的评论', user=self.user1)
+            second = CommentService._moderate_content('重复的评论', user=self.user2)
+        self.assertEqual(mocked.call_count, 1)
+        self.assertEqual(first, ('rejected', detail))
+        # 命中缓存只返回由内容得出的结论，不带首次调用的模型信息
+        self.assertEqual(second, ('rejected', {'decision': 'rejected', 'violation_types': ['abuse'], 'cached': True}))
+        self.assertTrue(ModerationLog.objects.filter(model_name='cache', user=self.user2).exists())
+        
+        with patch(target, return_value=('uncertain', {'decision': 'unknown'})) as mocked:
+            CommentService._moderate_content('另一条评论')
+            CommentService._moderate_content('另一条评论')
+        self.assertEqual(mocked.call_count, 2)
+        cache.clear()
@@ -0,0 +1,3 @@
+"""
+通用工具（mainotebook.utils）在内容应用中的测试
+"""
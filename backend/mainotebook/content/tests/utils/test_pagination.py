@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+"""
+分页总数缓存测试
+
+测试 CachedCountPaginator 在不同 PAGINATION_COUNT_CACHE_TIMEOUT 配置下的计数行为。
+"""
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from mainotebook.system.models import Users
+from mainotebook.content.models import KnowledgeBase
+from mainotebook.utils.pagination import CachedCountPaginator
+
+
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'pagination-count-tests',
+    }
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CachedCountPaginatorTest(TestCase):
+    """CachedCountPaginator 计数测试"""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.user = Users.objects.create(username='pagination_user', name='测试用户')
+        for index in range(3):
+            KnowledgeBase.objects.create(
+                name=f'知识库{index}',
+                description='描述',
+                uploader=self.user,
+                is_public=index < 2,
+            )
+
+    @override_settings(PAGINATION_COUNT_CACHE_TIMEOUT=0)
+    def test_no_cache_when_timeout_is_zero(self):
+        """未开启缓存时每个分页器都执行 COUNT"""
+        queryset = KnowledgeBase.objects.all()
+        with self.assertNumQueries(1):
+            self.assertEqual(CachedCountPaginator(queryset, 10).count, 3)
+        with self.assertNumQueries(1):
+            self.assertEqual(CachedCountPaginator(queryset, 10).count, 3)
+
+    @override_settings(PAGINATION_COUNT_CACHE_TIMEOUT=60)
+    def test_second_paginator_reads_cached_count(self):
+        """开启缓存后，同一查询的第二个分页器不再查询数据库"""
+        with self.assertNumQueries(1):
+            self.assertEqual(CachedCountPaginator(KnowledgeBase.objects.all(), 10).count, 3)
+        with self.assertNumQueries(0):
+            self.assertEqual(CachedCountPaginator(KnowledgeBase.objects.all(), 10).count, 3)
+
+    @override_settings(PAGINATION_COUNT_CACHE_TIMEOUT=60)
+    def test_different_filters_use_different_keys(self):
+        """筛选参数不同的查询各自计数，互不命中"""
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                CachedCountPaginator(KnowledgeBase.objects.filter(is_public=True), 10).count, 2
+            )
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                CachedCountPaginator(KnowledgeBase.objects.filter(is_public=False), 10).count, 1
+            )
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                CachedCountPaginator(KnowledgeBase.objects.filter(is_public=True), 10).count, 2
+            )
+
+    @override_settings(PAGINATION_COUNT_CACHE_TIMEOUT=60)
+    def test_empty_queryset_returns_zero(self):
+        """none() 查询集直接返回 0"""
+        with self.assertNumQueries(0):
+            self.assertEqual(CachedCountPaginator(KnowledgeBase.objects.none(), 10).count, 0)
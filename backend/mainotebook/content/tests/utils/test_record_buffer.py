@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+
+"""
+审计记录批量写入测试
+
+测试 BufferedRecordWriter 在不同 AUDIT_RECORD_BUFFER 配置下的写入行为，
+以及 PostgreSQL COPY 文本格式的字段转义。
+"""
+
+import datetime
+import uuid
+from unittest import skipIf
+from unittest.mock import patch
+
+from django.db import connection, models
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from mainotebook.system.models import Users
+from mainotebook.content.models import DownloadRecord, ModerationLog
+from mainotebook.utils.record_buffer import BufferedRecordWriter, _copy_text
+
+
+class BufferedRecordWriterTest(TestCase):
+    """BufferedRecordWriter 写入测试"""
+
+    def setUp(self):
+        """为每个用例创建独立的写入器，避免影响全局的 download_record_writer"""
+        self.writer = BufferedRecordWriter(DownloadRecord, max_size=2)
+        self.addCleanup(BufferedRecordWriter.registry.remove, self.writer)
+        # 缓冲模式下不启动后台线程，由用例显式调用 flush()
+        patcher = patch.object(self.writer, '_ensure_thread')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _add(self, count):
+        """新增 count 条下载记录，返回目标 ID 列表"""
+        target_ids = [uuid.uuid4() for _ in range(count)]
+        for target_id in target_ids:
+            self.writer.add(target_id=target_id, target_type='knowledge')
+        return target_ids
+
+    @override_settings(AUDIT_RECORD_BUFFER=False)
+    def test_unbuffered_add_inserts_immediately(self):
+        """未开启缓冲时 add() 立即写入数据库"""
+        target_ids = self._add(1)
+
+        self.assertTrue(DownloadRecord.objects.filter(target_id=target_ids[0]).exists())
+        self.assertEqual(len(self.writer._buffer), 0)
+
+    @skipIf(connection.vendor == 'postgresql', 'PostgreSQL 使用 COPY 写入')
+    @override_settings(AUDIT_RECORD_BUFFER=True)
+    def test_buffered_add_written_on_flush(self):
+        """开启缓冲时 add() 只入队，flush() 后全部写入"""
+        target_ids = self._add(2)
+        self.assertFalse(DownloadRecord.objects.filter(target_id__in=target_ids).exists())
+
+        with patch.object(DownloadRecord.all_objects, 'bulk_create',
+                          wraps=DownloadRecord.all_objects.bulk_create) as bulk_create:
+            self.writer.flush()
+
+        self.assertEqual(bulk_create.call_count, 1)
+        self.assertEqual(DownloadRecord.objects.filter(target_id__in=target_ids).count(), 2)
+        self.assertEqual(len(self.writer._buffer), 0)
+
+    @skipIf(connection.vendor == 'postgresql', 'PostgreSQL 使用 COPY 写入')
+    @override_settings(AUDIT_RECORD_BUFFER=True)
+    def test_flush_splits_batches_by_max_size(self):
+        """超过 max_size 的缓冲记录分多批写入"""
+        target_ids = self._add(5)
+
+        with patch.object(DownloadRecord.all_objects, 'bulk_create',
+                          wraps=DownloadRecord.all_objects.bulk_create) as bulk_create:
+            self.writer.flush()
+
+        batch_sizes = [len(call.args[0]) for call in bulk_create.call_args_list]
+        self.assertEqual(batch_sizes, [2, 2, 1])
+        self.assertEqual(DownloadRecord.objects.filter(target_id__in=target_ids).count(), 5)
+
+
+class FakeRedis:
+    """只实现 rpush / lrange / ltrim 的内存 Redis 替身"""
+
+    def __init__(self):
+        self.lists = {}
+
+    def rpush(self, key, value):
+        self.lists.setdefault(key, []).append(value)
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """按顺序执行命令的 pipeline 替身"""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def lrange(self, key, start, end):
+        self.commands.append(lambda: list(self.redis.lists.get(key, [])[start:end + 1]))
+
+    def ltrim(self, key, start, end):
+        def run():
+            items = self.redis.lists.get(key, [])
+            self.redis.lists[key] = items[start:] if end == -1 else items[start:end + 1]
+            return True
+        self.commands.append(run)
+
+    def execute(self):
+        return [command() for command in self.commands]
+
+
+@override_settings(AUDIT_RECORD_BUFFER='redis')
+class RedisRecordBufferTest(TestCase):
+    """Redis 模式的序列化与批量写入往返测试"""
+
+    def setUp(self):
+        self.user = Users.objects.create(username='redis_buffer_user', name='缓冲测试用户')
+        self.writer = BufferedRecordWriter(ModerationLog)
+        self.addCleanup(BufferedRecordWriter.registry.remove, self.writer)
+        self.redis = FakeRedis()
+        patcher = patch('django_redis.get_redis_connection', return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_push_and_flush_round_trip(self):
+        """UUID 主键、外键 *_id、JSON 与创建时间经 Redis 往返后保持不变"""
+        instance = self.writer.add(
+            source='comment',
+            content_id=str(uuid.uuid4()),
+            user=self.user,
+            model_name='test-model',
+            text_type='comment',
+            input_text='待审核内容',
+            decision='rejected',
+            violation_types=['porn', 'abuse'],
+        )
+        # 尚未写库，事件时间已在入队时确定
+        self.assertFalse(ModerationLog.objects.filter(id=instance.id).exists())
+        self.assertIsNotNone(instance.create_datetime)
+        self.assertEqual(len(self.redis.lists[self.writer.redis_key]), 1)
+
+        self.assertEqual(self.writer.flush_redis(), 1)
+        self.assertEqual(self.redis.lists[self.writer.redis_key], [])
+
+        saved = ModerationLog.objects.get(id=instance.id)
+        self.assertEqual(saved.user_id, self.user.id)
+        self.assertEqual(saved.content_id, instance.content_id)
+        self.assertEqual(saved.violation_types, ['abuse', 'porn'])
+        self.assertEqual(saved.create_datetime, instance.create_datetime)
+
+
+class CopyTextTest(SimpleTestCase):
+    """COPY FROM STDIN 文本格式的字段转义测试"""
+
+    def test_null(self):
+        """None 输出为 \\N"""
+        self.assertEqual(_copy_text(models.CharField(), None), '\\N')
+
+    def test_boolean(self):
+        """布尔值输出为 t / f"""
+        self.assertEqual(_copy_text(models.BooleanField(), True), 't')
+        self.assertEqual(_copy_text(models.BooleanField(), False), 'f')
+
+    def test_json_with_newline(self):
+        """JSON 字符串中的换行先由 JSON 转义为 \\n，其中的反斜杠再按 COPY 规则转义"""
+        value = _copy_text(models.JSONField(), {'text': 'a\nb'})
+        self.assertEqual(value, '{"text":"a\\\\nb"}')
+        self.assertNotIn('\n', value)
+
+    def test_text_escapes(self):
+        """制表符、换行、回车与反斜杠按 COPY 文本格式转义"""
+        self.assertEqual(
+            _copy_text(models.TextField(), 'a\tb\\c\nd\re'),
+            'a\\tb\\\\c\\nd\\re',
+        )
+
+    def test_datetime(self):
+        """日期时间输出为 ISO 8601 格式（含时区）"""
+        value = datetime.datetime(2024, 1, 2, 3, 4, 5, 678000, tzinfo=datetime.timezone.utc)
+        self.assertEqual(_copy_text(models.DateTimeField(), value), '2024-01-02T03:04:05.678000+00:00')
+
+    def test_uuid(self):
+        """UUID 输出为带连字符的标准格式"""
+        value = uuid.UUID('12345678-1234-5678-1234-567812345678')
+        self.assertEqual(_copy_text(models.UUIDField(), value), '12345678-1234-5678-1234-567812345678')
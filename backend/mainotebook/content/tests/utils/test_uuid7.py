@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+"""
+UUIDv7 生成测试
+
+测试 uuid7 的版本位、变体位、时间戳位，以及不同毫秒生成的 id 按时间有序。
+"""
+
+import time
+import uuid
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from mainotebook.utils.uuid7 import uuid7
+
+
+class UUID7Test(SimpleTestCase):
+    """uuid7 生成测试"""
+
+    def test_version_and_variant(self):
+        """版本号为 7，变体为 RFC 4122"""
+        value = uuid7()
+        self.assertEqual(value.version, 7)
+        self.assertEqual(value.variant, uuid.RFC_4122)
+
+    def test_timestamp_bits(self):
+        """高 48 位为生成时刻的 Unix 毫秒时间戳"""
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+        timestamp_ms = value.int >> 80
+        self.assertGreaterEqual(timestamp_ms, before - 1)
+        self.assertLessEqual(timestamp_ms, after + 1)
+
+    def test_sorted_across_milliseconds(self):
+        """不同毫秒生成的 id 按生成顺序排序"""
+        start_ns = time.time_ns()
+        ticks = iter(start_ns + offset * 1_000_000 for offset in range(20))
+        with patch('mainotebook.utils.uuid7.time.time_ns', side_effect=lambda: next(ticks)):
+            values = [uuid7() for _ in range(20)]
+        self.assertEqual(sorted(values), values)
+        self.assertEqual(sorted(str(value) for value in values), [str(value) for value in values])
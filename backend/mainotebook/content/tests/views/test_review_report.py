@@ -94,7 +94,8 @@ class ReviewReportModelTest(TestCase):
         # 从数据库重新读取
         report = ReviewReport.objects.get(pk=self.report.pk)
         self.assertIsInstance(report.violation_types, list)
-        self.assertEqual(report.violation_types, ["porn", "abuse"])
+        # 写入时去重并排序
+        self.assertEqual(report.violation_types, ["abuse", "porn"])
 
     def test_json_field_violation_types_empty(self):
         """测试 violation_types 为空列表时的存储和读取"""
@@ -295,7 +296,7 @@ class ReviewReportSerializerTest(TestCase):
         self.assertEqual(data['content_name'], '测试知识库')
         self.assertEqual(data['decision'], 'auto_rejected')
         self.assertAlmostEqual(data['final_confidence'], 0.92)
-        self.assertEqual(data['violation_types'], ['porn', 'abuse'])
+        self.assertEqual(data['violation_types'], ['abuse', 'porn'])
 
     def test_serializer_report_data_preserved(self):
         """测试序列化后 report_data 结构完整保留"""
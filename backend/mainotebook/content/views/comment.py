@@ -7,6 +7,8 @@
 支持嵌套回复和树形结构返回。
 """
 
+import uuid
+
 from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -142,6 +144,18 @@ class CommentViewSet(CustomModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
+        # 验证 target_id 格式（UUID）
+        try:
+            target_id = uuid.UUID(target_id)
+        except ValueError:
+            return Response(
+                {
+                    'code': 4000,
+                    'msg': 'target_id 格式无效'
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
         # 验证 target_type 的有效性
         if target_type not in ['knowledge', 'persona']:
             return Response(
@@ -162,8 +176,10 @@ class CommentViewSet(CustomModelViewSet):
                 user=request.user if request.user.is_authenticated else None
             )
             
-            # 序列化评论
-            serializer = self.get_serializer(result['comments'], many=True)
+            # 序列化评论（一次查询当前用户对本页评论及回复的反应）
+            context = self.get_serializer_context()
+            context['my_reactions'] = CommentService.get_user_reactions(request.user, result['comments'])
+            serializer = self.get_serializer_class()(result['comments'], many=True, context=context)
             
             return Response(
                 {
@@ -420,8 +436,10 @@ class CommentViewSet(CustomModelViewSet):
             # 使用服务层获取回复
             result = CommentService.get_replies(str(pk), page, page_size)
             
-            # 序列化回复
-            serializer = self.get_serializer(result['replies'], many=True)
+            # 序列化回复（一次查询当前用户对本页回复的反应）
+            context = self.get_serializer_context()
+            context['my_reactions'] = CommentService.get_user_reactions(request.user, result['replies'])
+            serializer = self.get_serializer_class()(result['replies'], many=True, context=context)
             
             return Response(
                 {
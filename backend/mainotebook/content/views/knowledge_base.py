@@ -118,7 +118,7 @@ class KnowledgeBaseViewSet(CustomModelViewSet):
         
         # list 操作（广场）：只返回公开且已审核的知识库
         if self.action == 'list':
-            queryset = KnowledgeBase.objects.filter(
+            queryset = KnowledgeBase.objects.list_view().with_viewer_stats(user).filter(
                 is_public=True,
                 is_pending=False
             )
@@ -128,21 +128,12 @@ class KnowledgeBaseViewSet(CustomModelViewSet):
             if starred_param == 'true' and user.is_authenticated:
                 # 只返回当前用户收藏的知识库
                 from mainotebook.content.models import StarRecord
-                import uuid as uuid_module
                 
-                # 获取收藏的 target_id（字符串格式）
-                starred_id_strs = StarRecord.objects.filter(
+                # target_id 为 UUID 字段，直接作为子查询过滤
+                starred_ids = StarRecord.objects.filter(
                     user=user,
                     target_type='knowledge'
-                ).values_list('target_id', flat=True)
-                
-                # 将字符串转换为 UUID 对象
-                starred_ids = []
-                for id_str in starred_id_strs:
-                    try:
-                        starred_ids.append(uuid_module.UUID(id_str))
-                    except (ValueError, AttributeError):
-                        continue
+                ).values('target_id')
                 
                 queryset = queryset.filter(id__in=starred_ids)
             
@@ -306,7 +297,9 @@ class KnowledgeBaseViewSet(CustomModelViewSet):
         Returns:
             Response: 包含用户知识库列表的响应
         """
-        queryset = KnowledgeBaseService.get_user_knowledge_bases(request.user)
+        queryset = KnowledgeBaseService.get_user_knowledge_bases(request.user).list_view(
+            owner_only=True
+        ).with_viewer_stats(request.user)
         
         # 应用分页
         page = self.paginate_queryset(queryset)
@@ -351,7 +344,7 @@ class KnowledgeBaseViewSet(CustomModelViewSet):
         knowledge_base = self.get_object()
         
         # 验证权限（仅创建者可添加文件）
-        if knowledge_base.uploader != request.user:
+        if knowledge_base.uploader_id != request.user.id:
             return ErrorResponse(msg="只有创建者可以添加文件", status=status.HTTP_403_FORBIDDEN)
         
         # 获取上传的文件
@@ -415,7 +408,7 @@ class KnowledgeBaseViewSet(CustomModelViewSet):
         
         if request.method == 'DELETE':
             # 验证权限（仅创建者可删除文件）
-            if knowledge_base.uploader != request.user:
+            if knowledge_base.uploader_id != request.user.id:
                 return ErrorResponse(msg="只有创建者可以删除文件", status=status.HTTP_403_FORBIDDEN)
             
             FileService.delete_file(kb_file.file_path)
@@ -425,15 +418,12 @@ class KnowledgeBaseViewSet(CustomModelViewSet):
         # GET: 下载文件
         try:
             # 增加下载计数
-            from django.db.models import F
-            KnowledgeBase.objects.filter(id=knowledge_base.id).update(
-                downloads=F('downloads') + 1
-            )
+            KnowledgeBase.incr_downloads(knowledge_base.pk)
             
             # 记录下载记录
-            from mainotebook.content.models import DownloadRecord
-            DownloadRecord.objects.create(
-                target_id=str(knowledge_base.id),
+            from mainotebook.content.models import download_record_writer
+            download_record_writer.add(
+                target_id=knowledge_base.id,
                 target_type='knowledge'
             )
             
@@ -612,7 +602,7 @@ class KnowledgeBaseViewSet(CustomModelViewSet):
             
             logger.info(
                 f"用户 {request.user.id if request.user.is_authenticated else '匿名'} "
-                f"解析知识库 {kb_file.knowledge_base.id} 的 JSON 文件: {kb_file.original_name}, "
+                f"解析知识库 {kb_file.knowledge_base_id} 的 JSON 文件: {kb_file.original_name}, "
                 f"第 {page} 页{f', 搜索: {search_keyword}' if search_keyword else ''}"
             )
             
@@ -662,7 +652,7 @@ class KnowledgeBaseViewSet(CustomModelViewSet):
             }
             
             logger.info(
-                f"解析知识库 {kb_file.knowledge_base.id} 的 TXT 文件: {kb_file.original_name}, "
+                f"解析知识库 {kb_file.knowledge_base_id} 的 TXT 文件: {kb_file.original_name}, "
                 f"共 {len(paragraphs)} 个段落{f', 搜索: {search_keyword}' if search_keyword else ''}"
             )
             
@@ -77,23 +77,27 @@ class ModerationLogViewSet(CustomModelViewSet):
         """
         from django.db.models import Sum, Avg, Count, Q
         from django.utils import timezone
-        from datetime import timedelta
+        from datetime import datetime, time, timedelta
 
         qs = ModerationLog.objects.all()
-        today = timezone.now().date()
-        last_30_days = today - timedelta(days=30)
-
-        total_count = qs.count()
-        success_count = qs.filter(is_success=True).count()
-        today_count = qs.filter(create_datetime__date=today).count()
-
-        # Token 用量统计
-        token_stats = qs.aggregate(
+        today_start = datetime.combine(timezone.now().date(), time.min)
+        tomorrow_start = today_start + timedelta(days=1)
+
+        # 计数与 Token 用量在一次扫描中完成；今日条件使用时间范围以便走 create_datetime 索引
+        stats = qs.aggregate(
+            total_count=Count('id'),
+            success_count=Count('id', filter=Q(is_success=True)),
+            today_count=Count(
+                'id',
+                filter=Q(create_datetime__gte=today_start, create_datetime__lt=tomorrow_start),
+            ),
             total_tokens_sum=Sum('total_tokens'),
             prompt_tokens_sum=Sum('prompt_tokens'),
             completion_tokens_sum=Sum('completion_tokens'),
             avg_latency=Avg('latency_ms'),
         )
+        total_count = stats['total_count']
+        success_count = stats['success_count']
 
         # 按决策分布
         decision_dist = dict(
@@ -113,11 +117,11 @@ class ModerationLogViewSet(CustomModelViewSet):
             'total_count': total_count,
             'success_count': success_count,
             'success_rate': round(success_count / total_count * 100, 1) if total_count else 0,
-            'today_count': today_count,
-            'total_tokens': token_stats['total_tokens_sum'] or 0,
-            'prompt_tokens': token_stats['prompt_tokens_sum'] or 0,
-            'completion_tokens': token_stats['completion_tokens_sum'] or 0,
-            'avg_latency_ms': round(token_stats['avg_latency'] or 0, 1),
+            'today_count': stats['today_count'],
+            'total_tokens': stats['total_tokens_sum'] or 0,
+            'prompt_tokens': stats['prompt_tokens_sum'] or 0,
+            'completion_tokens': stats['completion_tokens_sum'] or 0,
+            'avg_latency_ms': round(stats['avg_latency'] or 0, 1),
             'decision_distribution': decision_dist,
             'source_distribution': source_dist,
         }
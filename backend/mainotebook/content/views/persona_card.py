@@ -111,7 +111,7 @@ class PersonaCardViewSet(CustomModelViewSet):
         
         # list 操作（广场）：只返回公开且已审核且未删除的人设卡
         if self.action == 'list':
-            queryset = PersonaCard.objects.filter(
+            queryset = PersonaCard.objects.list_view().with_viewer_stats(user).filter(
                 is_public=True,
                 is_pending=False,
                 is_deleted=False  # 过滤已删除的人设卡
@@ -122,21 +122,12 @@ class PersonaCardViewSet(CustomModelViewSet):
             if starred_param == 'true' and user.is_authenticated:
                 # 只返回当前用户收藏的人设卡
                 from mainotebook.content.models import StarRecord
-                import uuid as uuid_module
                 
-                # 获取收藏的 target_id（字符串格式）
-                starred_id_strs = StarRecord.objects.filter(
+                # target_id 为 UUID 字段，直接作为子查询过滤
+                starred_ids = StarRecord.objects.filter(
                     user=user,
                     target_type='persona'
-                ).values_list('target_id', flat=True)
-                
-                # 将字符串转换为 UUID 对象
-                starred_ids = []
-                for id_str in starred_id_strs:
-                    try:
-                        starred_ids.append(uuid_module.UUID(id_str))
-                    except (ValueError, AttributeError):
-                        continue
+                ).values('target_id')
                 
                 queryset = queryset.filter(id__in=starred_ids)
                 
@@ -321,7 +312,7 @@ class PersonaCardViewSet(CustomModelViewSet):
             return ErrorResponse(msg='人设卡不存在', code=404)
         
         # 检查用户权限（只有上传者可以删除）
-        if instance.uploader != request.user:
+        if instance.uploader_id != request.user.id:
             logger.warning(
                 f"用户 {request.user.id} 尝试删除非自己的人设卡: "
                 f"persona_card_id={instance.id}, uploader_id={instance.uploader_id}"
@@ -365,7 +356,9 @@ class PersonaCardViewSet(CustomModelViewSet):
         Returns:
             Response: 用户的人设卡列表响应
         """
-        queryset = PersonaCardService.get_user_persona_cards(request.user)
+        queryset = PersonaCardService.get_user_persona_cards(request.user).list_view(
+            owner_only=True
+        ).with_viewer_stats(request.user)
         
         # 支持按名称搜索（兼容 name 和 keyword 参数）
         keyword = request.query_params.get('keyword') or request.query_params.get('name')
@@ -411,7 +404,7 @@ class PersonaCardViewSet(CustomModelViewSet):
         """
         persona_card = self.get_object()
         
-        if persona_card.uploader != request.user:
+        if persona_card.uploader_id != request.user.id:
             return ErrorResponse(msg='只有创建者可以添加文件', code=403)
         
         file = request.FILES.get('file')
@@ -470,7 +463,7 @@ class PersonaCardViewSet(CustomModelViewSet):
             return ErrorResponse(msg='文件不存在', code=404)
         
         if request.method == 'DELETE':
-            if persona_card.uploader != request.user:
+            if persona_card.uploader_id != request.user.id:
                 return ErrorResponse(msg='只有创建者可以删除文件', code=403)
             
             FileService.delete_file(persona_card_file.file_path)
@@ -483,8 +476,7 @@ class PersonaCardViewSet(CustomModelViewSet):
             return DetailResponse(data=[], msg='删除成功')
         
         # GET: 下载文件
-        persona_card.downloads += 1
-        persona_card.save(update_fields=['downloads'])
+        PersonaCard.incr_downloads(persona_card.pk)
         
         logger.info(
             f"用户 {request.user.id} 下载人设卡 {persona_card.id} "
@@ -1187,7 +1179,7 @@ class PersonaCardViewSet(CustomModelViewSet):
         persona_card = self.get_object()
         
         # 检查权限（只有创建者可以确认）
-        if persona_card.uploader != request.user:
+        if persona_card.uploader_id != request.user.id:
             return ErrorResponse(msg='只有创建者可以确认敏感信息', code=403)
         
         # 检查冷却期
@@ -1425,7 +1417,7 @@ class PersonaCardViewSet(CustomModelViewSet):
         if request.method == 'GET':
             # 获取配置项
             # 检查权限（只有上传者可以查看）
-            if persona_card.uploader != request.user:
+            if persona_card.uploader_id != request.user.id:
                 logger.warning(
                     f"用户 {request.user.id} 尝试查看非自己的人设卡配置: "
                     f"persona_card_id={persona_card.id}"
@@ -1485,7 +1477,7 @@ class PersonaCardViewSet(CustomModelViewSet):
                 )
                 
                 # 根据具体情况返回不同的错误消息
-                if persona_card.uploader != request.user:
+                if persona_card.uploader_id != request.user.id:
                     return ErrorResponse(msg='只有上传者可以编辑配置项', code=403)
                 elif persona_card.is_pending:
                     return ErrorResponse(msg='审核中的人设卡不能编辑', code=403)
@@ -1623,7 +1615,7 @@ class PersonaCardViewSet(CustomModelViewSet):
         persona_card = self.get_object()
         
         # 检查权限（只有上传者可以导出）
-        if persona_card.uploader != request.user:
+        if persona_card.uploader_id != request.user.id:
             logger.warning(
                 f"用户 {request.user.id} 尝试导出非自己的人设卡配置: "
                 f"persona_card_id={persona_card.id}"
@@ -1754,8 +1746,7 @@ class PersonaCardViewSet(CustomModelViewSet):
             )
             
             # 增加下载计数
-            persona_card.downloads += 1
-            persona_card.save(update_fields=['downloads'])
+            PersonaCard.incr_downloads(persona_card.pk)
             
             # 记录下载历史（如果模型存在）
             try:
@@ -1772,7 +1763,7 @@ class PersonaCardViewSet(CustomModelViewSet):
             
             logger.info(
                 f"用户 {request.user.id} 下载人设卡 {persona_card.id} 成功, "
-                f"当前下载次数: {persona_card.downloads}"
+                f"当前下载次数: {persona_card.downloads + 1}"
             )
             
             # 返回文件响应
@@ -1851,7 +1842,7 @@ class PersonaCardViewSet(CustomModelViewSet):
             return ErrorResponse(msg='人设卡不存在', code=404)
         
         # 检查用户权限（只有上传者可以操作）
-        if persona_card.uploader != request.user:
+        if persona_card.uploader_id != request.user.id:
             logger.warning(
                 f"用户 {request.user.id} 尝试切换非自己的人设卡状态: "
                 f"persona_card_id={persona_card.id}, uploader_id={persona_card.uploader_id}"
@@ -1988,7 +1979,7 @@ class PersonaCardViewSet(CustomModelViewSet):
             )
             
             # 根据具体情况返回不同的错误消息
-            if persona_card.uploader != request.user:
+            if persona_card.uploader_id != request.user.id:
                 return ErrorResponse(msg='只有上传者可以编辑基本信息', code=403)
             elif persona_card.is_pending:
                 return ErrorResponse(msg='审核中的人设卡不能编辑', code=403)
@@ -29,6 +29,15 @@ from mainotebook.content.models import (
 )
 
 
+# 上传内容按审核状态计数（用于 aggregate）
+UPLOAD_STATUS_COUNTS = {
+    'total': Count('id'),
+    'pending': Count('id', filter=Q(is_pending=True)),
+    'approved': Count('id', filter=Q(is_public=True, is_pending=False)),
+    'rejected': Count('id', filter=Q(is_public=False, is_pending=False, rejection_reason__isnull=False)),
+}
+
+
 class UserExtensionViewSet(viewsets.ViewSet):
     """用户扩展视图集
     
@@ -243,51 +252,18 @@ class UserExtensionViewSet(viewsets.ViewSet):
             Response: 包含上传统计数据的响应
         """
         try:
-            # 知识库统计
-            kb_total = KnowledgeBase.objects.filter(
+            # 知识库 / 人设卡各用一次聚合查询完成按状态计数
+            kb_stats = KnowledgeBase.objects.filter(
                 uploader=request.user
-            ).count()
-            
-            kb_pending = KnowledgeBase.objects.filter(
-                uploader=request.user,
-                is_pending=True
-            ).count()
-            
-            kb_approved = KnowledgeBase.objects.filter(
-                uploader=request.user,
-                is_public=True,
-                is_pending=False
-            ).count()
-            
-            kb_rejected = KnowledgeBase.objects.filter(
-                uploader=request.user,
-                is_public=False,
-                is_pending=False,
-                rejection_reason__isnull=False
-            ).count()
-            
-            # 人设卡统计
-            pc_total = PersonaCard.objects.filter(
+            ).aggregate(**UPLOAD_STATUS_COUNTS)
+            pc_stats = PersonaCard.objects.filter(
                 uploader=request.user
-            ).count()
-            
-            pc_pending = PersonaCard.objects.filter(
-                uploader=request.user,
-                is_pending=True
-            ).count()
-            
-            pc_approved = PersonaCard.objects.filter(
-                uploader=request.user,
-                is_public=True,
-                is_pending=False
-            ).count()
+            ).aggregate(**UPLOAD_STATUS_COUNTS)
             
-            pc_rejected = PersonaCard.objects.filter(
-                uploader=request.user,
-                is_public=False,
-                is_pending=False,
-                rejection_reason__isnull=False
-            ).count()
+            kb_total, kb_pending = kb_stats['total'], kb_stats['pending']
+            kb_approved, kb_rejected = kb_stats['approved'], kb_stats['rejected']
+            pc_total, pc_pending = pc_stats['total'], pc_stats['pending']
+            pc_approved, pc_rejected = pc_stats['approved'], pc_stats['rejected']
             
             # 计算总数和通过率
             total = kb_total + pc_total
@@ -377,11 +353,11 @@ class UserExtensionViewSet(viewsets.ViewSet):
             # 内容被收藏数（用户上传的内容被收藏的总数）
             kb_ids = KnowledgeBase.objects.filter(
                 uploader=request.user
-            ).values_list('id', flat=True)
+            ).order_by().values_list('id', flat=True)
             
             pc_ids = PersonaCard.objects.filter(
                 uploader=request.user
-            ).values_list('id', flat=True)
+            ).order_by().values_list('id', flat=True)
             
             content_star_count = StarRecord.objects.filter(
                 Q(target_id__in=[str(id) for id in kb_ids], target_type='knowledge') |
@@ -8,3 +8,7 @@ class SystemConfig(AppConfig):
     def ready(self):
         # 注册信号
         import mainotebook.system.signals  # 确保路径正确
+        # 初始化系统配置与字典（每个进程执行一次）
+        from application import dispatch
+        dispatch.init_system_config()
+        dispatch.init_dictionary()
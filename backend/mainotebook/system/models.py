@@ -6,6 +6,8 @@ from pathlib import PurePosixPath
 from django.contrib.auth.models import AbstractUser, UserManager
 from django.db import models
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.utils import timezone
+from django.utils.functional import cached_property
 from application import dispatch
 from mainotebook.utils.models import CoreModel, table_prefix, get_custom_app_models
 
@@ -148,6 +150,12 @@ class Users(CoreModel, AbstractUser):
     
     objects = CustomUserManager()
 
+    # 权限等级，由 is_moderator / is_staff / is_superuser 推导
+    ROLE_USER = 0
+    ROLE_MODERATOR = 10
+    ROLE_STAFF = 20
+    ROLE_SUPERUSER = 30
+
     def is_system_account(self) -> bool:
         """判断是否为系统账号
         
@@ -166,6 +174,36 @@ class Users(CoreModel, AbstractUser):
         """
         return not self.is_system_account()
 
+    @cached_property
+    def role_level(self) -> int:
+        """权限等级（ROLE_* 常量），按实例缓存
+        
+        权限类只需一次整数比较；修改权限标识后需重新获取用户实例。
+        
+        Returns:
+            int: 权限等级
+        """
+        if self.is_superuser:
+            return self.ROLE_SUPERUSER
+        if self.is_staff:
+            return self.ROLE_STAFF
+        if self.is_moderator:
+            return self.ROLE_MODERATOR
+        return self.ROLE_USER
+
+    @cached_property
+    def is_currently_muted(self) -> bool:
+        """当前是否处于禁言中（未设置截止时间表示永久禁言）
+        
+        按实例缓存，同一请求内的权限类与序列化器校验只计算一次。
+        
+        Returns:
+            bool: 禁言中返回 True
+        """
+        if not self.is_muted:
+            return False
+        return self.muted_until is None or self.muted_until > timezone.now()
+
     def can_be_deleted(self) -> bool:
         """判断是否可以被删除
         
@@ -3,7 +3,7 @@ import time
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import Signal, receiver
 from django.core.cache import cache
-from mainotebook.system.models import MessageCenterTargetUser
+from mainotebook.system.models import MessageCenterTargetUser, Users
 
 # 初始化信号
 pre_init_complete = Signal()
@@ -25,3 +25,10 @@ last_db_change_time = time.time()
 @receiver(post_delete, sender=MessageCenterTargetUser)
 def update_last_change_time(sender, **kwargs):
     cache.set('last_db_change_time', time.time(), timeout=None)  # 设置永不超时的键值对
+
+
+@receiver(post_save, sender=Users)
+@receiver(post_delete, sender=Users)
+def invalidate_avatar_cache(sender, instance, **kwargs):
+    """用户信息变更时清除头像地址缓存"""
+    cache.delete(f'avatar:{instance.pk}')
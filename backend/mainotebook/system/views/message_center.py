@@ -11,14 +11,13 @@
 """
 import json
 
-from asgiref.sync import async_to_sync
-from channels.layers import get_channel_layer
 from django.db.models import Q
 from django_restql.fields import DynamicSerializerMethodField
 from rest_framework import serializers
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 
+from application.websocketConfig import websocket_push, broadcast_websocket, broadcast_all_websocket
 from mainotebook.system.models import MessageCenter, Users, MessageCenterTargetUser, UserNotificationPreference
 from mainotebook.utils.json_response import SuccessResponse, DetailResponse
 from mainotebook.utils.serializers import CustomModelSerializer
@@ -147,36 +146,6 @@ class MessageCenterDetailSerializer(CustomModelSerializer):
         read_only_fields = ["id"]
 
 
-def websocket_push(user_id, message):
-    """通过 WebSocket 向指定用户推送消息
-    
-    Args:
-        user_id: 目标用户 ID
-        message: 推送消息体字典
-    """
-    username = "user_" + str(user_id)
-    channel_layer = get_channel_layer()
-    async_to_sync(channel_layer.group_send)(
-        username,
-        {"type": "push.message", "json": message}
-    )
-
-
-def _broadcast_websocket(user_ids, message):
-    """批量 WebSocket 推送
-    
-    Args:
-        user_ids: 用户 ID 可迭代对象
-        message: 推送消息体字典
-    """
-    channel_layer = get_channel_layer()
-    for uid in user_ids:
-        async_to_sync(channel_layer.group_send)(
-            "user_" + str(uid),
-            {"type": "push.message", "json": message}
-        )
-
-
 class MessageCenterCreateSerializer(CustomModelSerializer):
     """消息中心-新增-序列化器
     
@@ -246,7 +215,7 @@ class MessageCenterCreateSerializer(CustomModelSerializer):
             user_ids = Users.objects.filter(
                 role__id__in=target_role
             ).values_list('id', flat=True).distinct()
-            _broadcast_websocket(user_ids, ws_message)
+            broadcast_websocket(user_ids, ws_message)
             
         elif target_type == 2:
             # 按部门：不写中间表，推送给部门下的在线用户
@@ -254,12 +223,11 @@ class MessageCenterCreateSerializer(CustomModelSerializer):
             user_ids = Users.objects.filter(
                 dept__id__in=target_dept
             ).values_list('id', flat=True).distinct()
-            _broadcast_websocket(user_ids, ws_message)
+            broadcast_websocket(user_ids, ws_message)
             
         elif target_type == 3:
-            # 系统通知：不写中间表，广播所有在线用户
-            user_ids = Users.objects.values_list('id', flat=True)
-            _broadcast_websocket(user_ids, ws_message)
+            # 系统通知：不写中间表，向全员广播组发送一条消息
+            broadcast_all_websocket(ws_message)
 
         return data
 
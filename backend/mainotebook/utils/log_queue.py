@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+"""
+日志异步队列
+
+将指定 logger 的输出改为写入内存队列，由后台 QueueListener 线程交给原有 handler 处理，
+避免文件/远程等较慢的日志输出阻塞请求线程。
+
+入队前仍由标准 QueueHandler 在请求线程中合并消息参数与异常堆栈并丢弃 args / exc_info，
+日志内容反映调用时的状态，后台线程不会访问查询集等延迟求值的参数，也不会持有请求的栈帧。
+"""
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+_listeners = {}
+
+
+def enable_queue_logging(logger_name, handlers=None):
+    """为 logger 启用异步队列输出
+
+    Args:
+        logger_name: logger 名称
+        handlers: 实际输出的 handler 列表，默认使用根 logger 的 handler
+
+    Returns:
+        QueueListener: 已启动的监听器（重复调用返回同一个）
+    """
+    if logger_name in _listeners:
+        return _listeners[logger_name]
+
+    if handlers is None:
+        handlers = list(logging.getLogger().handlers)
+
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+
+    target_logger = logging.getLogger(logger_name)
+    target_logger.addHandler(QueueHandler(log_queue))
+    # 记录已由队列转交给根 logger 的 handler，不再向上传播避免重复输出
+    target_logger.propagate = False
+
+    listener.start()
+    atexit.register(listener.stop)
+    _listeners[logger_name] = listener
+    return listener
@@ -9,7 +9,7 @@
 from datetime import datetime
 from importlib import import_module
 
-import uuid
+import orjson
 
 from application import settings
 from django.apps import apps
@@ -17,9 +17,46 @@ from django.conf import settings
 from django.db import models
 from rest_framework.request import Request
 
+from mainotebook.utils.uuid7 import uuid7
+
 table_prefix = settings.TABLE_PREFIX  # 数据库表名前缀
 
 
+class OrjsonJSONField(models.JSONField):
+    """读取时使用 orjson 解析的 JSONField
+
+    数据库列类型与查询能力与 JSONField 完全一致，仅将 from_db_value 中的 json.loads
+    换成 orjson.loads，适用于读取频繁、内容嵌套较深的 JSON 列。
+    注意 orjson 会把超出 64 位的整数解析为浮点数。
+    """
+
+    def from_db_value(self, value, expression, connection):
+        if value is None or not isinstance(value, (str, bytes)) or self.decoder is not None:
+            return super().from_db_value(value, expression, connection)
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            return super().from_db_value(value, expression, connection)
+
+
+class SortedSetJSONField(OrjsonJSONField):
+    """以去重、排序后的列表存储的 JSON 数组字段
+
+    写入前（save / bulk_create）将列表规范化，相同集合的值逐字节相等，
+    可直接用于等值查询与分组统计。元素不可排序时保持原值。
+    """
+
+    def pre_save(self, model_instance, add):
+        value = getattr(model_instance, self.attname)
+        if isinstance(value, (list, tuple, set, frozenset)):
+            try:
+                value = sorted(set(value))
+            except TypeError:
+                return value
+            setattr(model_instance, self.attname, value)
+        return value
+
+
 class SoftDeleteQuerySet(models.QuerySet):
     pass
 
@@ -108,7 +145,7 @@ class CoreModel(models.Model):
     核心标准抽象模型模型,可直接继承使用
     增加审计字段, 覆盖字段时, 字段名称请勿修改, 必须统一审计字段名称
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False, help_text="Id", verbose_name="Id")
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False, help_text="Id", verbose_name="Id")
     description = models.CharField(max_length=255, verbose_name="描述", null=True, blank=True, help_text="描述")
     creator = models.ForeignKey(to=settings.AUTH_USER_MODEL, related_query_name='creator_query', null=True,
                                 verbose_name='创建人', help_text="创建人", on_delete=models.SET_NULL,
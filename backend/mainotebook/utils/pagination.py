@@ -7,19 +7,45 @@
 
 @Created on: 2020/4/16 23:35
 """
+import hashlib
 from collections import OrderedDict
 
+from django.conf import settings
 from django.core import paginator
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
 from django.core.paginator import Paginator as DjangoPaginator, InvalidPage
+from django.utils.functional import cached_property
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 
 
+class CachedCountPaginator(DjangoPaginator):
+    """总数短时缓存的分页器
+
+    总数变化缓慢，而 COUNT(*) 需要扫描整个筛选结果集。配置 PAGINATION_COUNT_CACHE_TIMEOUT（秒）后，
+    以查询 SQL 与参数为键缓存总数；未配置或为 0 时与 Django Paginator 行为一致。
+    """
+
+    @cached_property
+    def count(self):
+        timeout = getattr(settings, 'PAGINATION_COUNT_CACHE_TIMEOUT', 0)
+        query = getattr(self.object_list, 'query', None)
+        if not timeout or query is None:
+            return DjangoPaginator.count.func(self)
+        try:
+            sql, params = query.sql_with_params()
+        except EmptyResultSet:
+            return 0
+        digest = hashlib.md5(f'{self.object_list.db}:{sql}:{params!r}'.encode()).hexdigest()
+        return cache.get_or_set(f'pgcount:{digest}', lambda: DjangoPaginator.count.func(self), timeout)
+
+
 class CustomPagination(PageNumberPagination):
     page_size = 10
     page_size_query_param = "limit"
     max_page_size = 999
-    django_paginator_class = DjangoPaginator
+    django_paginator_class = CachedCountPaginator
 
     def paginate_queryset(self, queryset, request, view=None):
         """
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+
+"""
+时间有序的 UUID（RFC 9562 UUIDv7）
+
+高 48 位为 Unix 毫秒时间戳，其余为版本/变体位与 74 位随机数。
+作为主键默认值时新记录的 id 近似单调递增，B-tree 索引插入集中在右侧页，
+避免 uuid4 随机写入带来的页分裂与 WAL 放大。
+"""
+import os
+import time
+import uuid
+
+_VERSION_MASK = ~(0xF << 76) & ((1 << 128) - 1)
+_VARIANT_MASK = ~(0x3 << 62) & ((1 << 128) - 1)
+_VERSION_BITS = 0x7 << 76
+_VARIANT_BITS = 0x2 << 62
+
+
+def uuid7() -> uuid.UUID:
+    """生成 UUIDv7
+
+    Returns:
+        uuid.UUID: 版本号为 7 的 UUID
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), 'big')
+    value = value & _VERSION_MASK & _VARIANT_MASK | _VERSION_BITS | _VARIANT_BITS
+    return uuid.UUID(int=value)
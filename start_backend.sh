@@ -463,9 +463,15 @@ run_migrations() {
     info "执行 makemigrations..."
     "$PYTHON_CMD" "$BACKEND_DIR/manage.py" makemigrations
 
+    info "规范目标 ID 格式..."
+    "$PYTHON_CMD" "$BACKEND_DIR/manage.py" normalize_target_ids
+
     info "执行 migrate..."
     "$PYTHON_CMD" "$BACKEND_DIR/manage.py" migrate
 
+    info "设置大字段 TOAST 压缩算法..."
+    "$PYTHON_CMD" "$BACKEND_DIR/manage.py" set_toast_compression || warn "TOAST 压缩算法设置失败，已跳过"
+
     success "数据库迁移完成"
 }
 